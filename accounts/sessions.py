@@ -0,0 +1,150 @@
+import datetime
+
+from django.conf import settings
+from django.contrib.sessions.backends import cached_db, db
+from django.core.exceptions import ImproperlyConfigured
+
+# Prefix of the cache keys of the sessions (the cached entries aren't
+# compatible with the ones of Django's 'cached_db' engine)
+KEY_PREFIX = 'accounts.sessions'
+
+# Cache backends that aren't shared by the server processes
+LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+class SessionStore(cached_db.SessionStore):
+    """
+    A session engine that reads the sessions through the cache, with the
+    database as the source of truth, and only writes them when they change.
+
+    Like Django's 'cached_db' engine, a session is read from the database
+    only when it isn't cached, and every write goes to the database first
+    and then to the cache. Unlike it, the session is not written back if
+    its data hasn't changed since it was read (even if it was marked as
+    modified) and its expiry date would only move forward by less than the
+    'SESSION_REFRESH_INTERVAL' setting, so the expiry of the sessions is
+    refreshed (with 'SESSION_SAVE_EVERY_REQUEST') at most once per
+    interval. The stored expiry date can therefore be up to one interval
+    earlier than the one of the session cookie.
+
+    The cache ('SESSION_CACHE_ALIAS') must be shared by all the server
+    processes, so a logout is seen by every process: the engine refuses to
+    work with a per-process ('locmem') or 'dummy' cache. It is opt-in
+    (see the 'SESSION_ENGINE' setting).
+
+    Attributes:
+        cache_key_prefix: The prefix of the session cache keys.
+    """
+    cache_key_prefix = KEY_PREFIX
+
+    def __init__(self, session_key=None):
+        backend = settings.CACHES[settings.SESSION_CACHE_ALIAS]['BACKEND']
+        if backend in LOCAL_CACHE_BACKENDS:
+            raise ImproperlyConfigured(
+                f'The accounts.sessions session engine requires a cache '
+                f'shared by all the server processes, but the '
+                f'{settings.SESSION_CACHE_ALIAS!r} cache uses {backend}.'
+            )
+        super().__init__(session_key)
+        self._stored = None
+
+    def _dump(self, data):
+        """
+        It serializes session data, to compare it with the stored data.
+
+        :param data: The session data.
+        :return: The serialized data.
+        """
+        return self.serializer().dumps(data)
+
+    def load(self):
+        """
+        It loads the session data, from the cache if it is there and from
+        the database otherwise, and remembers what is stored.
+
+        :return: The session data (empty if the session doesn't exist).
+        """
+        try:
+            entry = self._cache.get(self.cache_key)
+        except Exception:
+            # Some backends raise an exception on invalid cache keys
+            entry = None
+
+        if entry is None:
+            session = self._get_session_from_db()
+            if session is None:
+                self._stored = None
+                return {}
+            entry = (self.decode(session.session_data), session.expire_date)
+            self._cache.set(
+                self.cache_key,
+                entry,
+                self.get_expiry_age(expiry=session.expire_date)
+            )
+
+        data, expire_date = entry
+        self._stored = (self._dump(data), expire_date)
+        return data
+
+    def is_stored(self, data, expire_date):
+        """
+        It checks if the session data is already stored and if its stored
+        expiry date is recent enough.
+
+        :param data: The session data.
+        :param expire_date: The new expiry date of the session.
+        :return: True if the session doesn't need to be written, False
+            otherwise.
+        """
+        if self._stored is None:
+            return False
+        stored_data, stored_expire_date = self._stored
+        interval = datetime.timedelta(
+            seconds=settings.SESSION_REFRESH_INTERVAL
+        )
+        return (
+            stored_data == self._dump(data)
+            and datetime.timedelta(0) <= expire_date - stored_expire_date
+            < interval
+        )
+
+    def save(self, must_create=False):
+        """
+        It saves the session to the database and the cache, unless it is
+        already stored.
+
+        :param must_create: True if a new session must be created.
+        :raise CreateError: If 'must_create' is True and the session key
+            already exists.
+        :raise UpdateError: If the session doesn't exist anymore.
+        """
+        if self.session_key is None:
+            return self.create()
+        data = self._get_session(no_load=must_create)
+        expire_date = self.get_expiry_date()
+        if not must_create and self.is_stored(data, expire_date):
+            return
+
+        # The database write of the 'db' engine (the 'cached_db' engine
+        # would cache the data in its own format)
+        db.SessionStore.save(self, must_create)
+        self._cache.set(
+            self.cache_key,
+            (data, expire_date),
+            self.get_expiry_age(expiry=expire_date)
+        )
+        self._stored = (self._dump(data), expire_date)
+
+    def delete(self, session_key=None):
+        """
+        It deletes a session from the database and the cache.
+
+        :param session_key: The key of the session (the current session by
+            default).
+        """
+        if session_key is None or session_key == self.session_key:
+            self._stored = None
+        super().delete(session_key)
@@ -1,9 +1,14 @@
+import re
+
 from django.contrib.auth import get_user_model
 from django.contrib.sessions.models import Session
-from django.test import TestCase
+from django.core.cache import caches
+from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 
+from pages.mixins import CSRF_TOKEN_PLACEHOLDER
+
 
 class LoginTestCase(TestCase):
     """
@@ -192,3 +197,90 @@ class LoginTestCase(TestCase):
             first=active_sessions.count(),
             second=1
         )
+
+
+@override_settings(ANONYMOUS_PAGE_CACHE_ENABLED=True)
+class CachedLoginPageTestCase(TestCase):
+    """
+    A unit test case for the login page served from the page cache for
+    non-authenticated users. It checks that every user gets their own CSRF
+    token from the cached page and can log in with it.
+    """
+    LOGIN_URL = reverse('login')
+    HOMEPAGE_URL = reverse('home')
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        This method creates objects in a test database that are available to
+        all unit tests. It is called only once for this test case, and the
+        created objects are shared among all unit tests in this test case.
+        """
+        # Custom user model used by this project
+        user_model = get_user_model()
+
+        # Test user
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+    def setUp(self):
+        """
+        It clears the page cache before every test.
+        """
+        caches['pages'].clear()
+
+    def test_cached_login_page_csrf_token(self):
+        """
+        Checks that a cached login page includes a valid CSRF token for
+        every user, different from the token of other users.
+        """
+        # First user (renders and caches the page)
+        first_client = Client(enforce_csrf_checks=True)
+        first_response = first_client.get(self.LOGIN_URL)
+        first_token = first_response.cookies['csrftoken'].value
+
+        # Second user (served from the cache)
+        second_client = Client(enforce_csrf_checks=True)
+        second_response = second_client.get(self.LOGIN_URL)
+        self.assertTemplateNotUsed(
+            response=second_response,
+            template_name='registration/login.html'
+        )
+        second_token = second_response.cookies['csrftoken'].value
+        self.assertNotEqual(
+            first=first_token,
+            second=second_token
+        )
+        self.assertNotContains(
+            response=second_response,
+            text=CSRF_TOKEN_PLACEHOLDER
+        )
+
+        # CSRF token of the cached form
+        form_token = re.search(
+            pattern=r'name="csrfmiddlewaretoken" value="([^"]+)"',
+            string=second_response.content.decode()
+        ).group(1)
+        self.assertIn(
+            member='private',
+            container=second_response['Cache-Control']
+        )
+
+        # The second user logs in with the cached form
+        response = second_client.post(
+            path=self.LOGIN_URL,
+            data={
+                'username': 'test_user',
+                'password': 'test_pass',
+                'csrfmiddlewaretoken': form_token
+            }
+        )
+        self.assertRedirects(
+            response=response,
+            expected_url=self.HOMEPAGE_URL,
+            fetch_redirect_response=False
+        )
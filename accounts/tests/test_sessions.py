@@ -0,0 +1,223 @@
+import os
+import tempfile
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from accounts.sessions import SessionStore
+
+# Caches with a 'sessions' cache shared by all the processes (a file-based
+# cache)
+SHARED_CACHES = {
+    **settings.CACHES,
+    'sessions': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(tempfile.gettempdir(), 'newspaper-sessions'),
+    },
+}
+
+
+@override_settings(
+    CACHES=SHARED_CACHES,
+    SESSION_CACHE_ALIAS='sessions',
+    SESSION_ENGINE='accounts.sessions'
+)
+class SessionStoreTestCase(TestCase):
+    """
+    A unit test case for the 'accounts.sessions' session engine, which reads
+    the sessions through the cache and only writes them when they change.
+    """
+
+    def setUp(self):
+        """
+        It empties the cache (which stores the sessions) and creates a test
+        session before every test.
+        """
+        caches['sessions'].clear()
+        session = SessionStore()
+        session['value'] = 'test'
+        session.create()
+        self.session_key = session.session_key
+
+    def get_stored_session(self):
+        """
+        It returns the stored row of the test session.
+
+        :return: The 'Session' object.
+        """
+        return Session.objects.get(session_key=self.session_key)
+
+    def test_session_read_through_cache(self):
+        """
+        Checks that a session is only read from the database when it isn't
+        cached.
+        """
+        with self.assertNumQueries(0):
+            session = SessionStore(self.session_key)
+            self.assertEqual(
+                first=session['value'],
+                second='test'
+            )
+
+        # The database is the source of truth
+        caches['sessions'].clear()
+        with self.assertNumQueries(1):
+            session = SessionStore(self.session_key)
+            self.assertEqual(
+                first=session['value'],
+                second='test'
+            )
+        with self.assertNumQueries(0):
+            SessionStore(self.session_key).load()
+
+    def test_session_unchanged_not_written(self):
+        """
+        Checks that a session marked as modified isn't written if its data
+        hasn't changed.
+        """
+        session = SessionStore(self.session_key)
+        session['value'] = 'test'
+        self.assertTrue(session.modified)
+
+        with self.assertNumQueries(0):
+            session.save()
+
+    def test_session_changed_written(self):
+        """
+        Checks that a changed session is written to the database and the
+        cache.
+        """
+        session = SessionStore(self.session_key)
+        session['value'] = 'changed'
+        session.save()
+
+        self.assertEqual(
+            first=SessionStore().decode(
+                self.get_stored_session().session_data
+            )['value'],
+            second='changed'
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                first=SessionStore(self.session_key)['value'],
+                second='changed'
+            )
+
+    def test_session_expiry_refresh_throttled(self):
+        """
+        Checks that the expiry date of an unchanged session is only
+        refreshed once the refresh interval has passed.
+        """
+        expire_date = self.get_stored_session().expire_date
+
+        with self.assertNumQueries(0):
+            SessionStore(self.session_key).save()
+        self.assertEqual(
+            first=self.get_stored_session().expire_date,
+            second=expire_date
+        )
+
+        with override_settings(SESSION_REFRESH_INTERVAL=0):
+            SessionStore(self.session_key).save()
+        self.assertGreater(
+            a=self.get_stored_session().expire_date,
+            b=expire_date
+        )
+
+    def test_session_local_cache(self):
+        """
+        Checks that the engine can't be used with a cache that isn't shared
+        by the server processes, where a logout wouldn't be seen by the
+        other processes.
+        """
+        for alias in ('default', 'dummy'):
+            caches_setting = {
+                **SHARED_CACHES,
+                'dummy': {
+                    'BACKEND': 'django.core.cache.backends.dummy.DummyCache'
+                },
+            }
+            with self.subTest(alias=alias), override_settings(
+                CACHES=caches_setting,
+                SESSION_CACHE_ALIAS=alias
+            ):
+                with self.assertRaises(ImproperlyConfigured):
+                    SessionStore(self.session_key)
+
+    def test_session_delete(self):
+        """
+        Checks that a deleted session is removed from the database and the
+        cache.
+        """
+        SessionStore(self.session_key).delete()
+
+        self.assertFalse(
+            Session.objects.filter(session_key=self.session_key).exists()
+        )
+        session = SessionStore(self.session_key)
+        self.assertNotIn(
+            member='value',
+            container=session
+        )
+
+
+@override_settings(
+    CACHES=SHARED_CACHES,
+    SESSION_CACHE_ALIAS='sessions',
+    SESSION_ENGINE='accounts.sessions'
+)
+class SessionLoginTestCase(TestCase):
+    """
+    A unit test case that checks that the users stay logged in, and are
+    logged out, with the 'accounts.sessions' session engine.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        This method creates a test user available to all unit tests.
+        """
+        # Custom user model used by this project
+        user_model = get_user_model()
+
+        # Test user
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+    def setUp(self):
+        """
+        It empties the cache (which stores the sessions) before every test.
+        """
+        caches['sessions'].clear()
+
+    def test_session_login_and_logout(self):
+        """
+        Checks that the session of a logged-in user is read from the cache
+        and that the logout removes it.
+        """
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+
+        # HTTP Response (only the user is read from the database)
+        with self.assertNumQueries(1):
+            response = self.client.get(path=reverse('home'))
+        self.assertEqual(
+            first=response.context['user'],
+            second=self.user
+        )
+
+        self.client.post(path=reverse('logout'))
+        response = self.client.get(path=reverse('home'))
+        self.assertFalse(response.context['user'].is_authenticated)
+        self.assertFalse(Session.objects.exists())
@@ -1,7 +1,8 @@
 from django.urls import path
 
-from accounts.views import SignUpView
+from accounts.views import LoginView, SignUpView
 
 urlpatterns = [
+    path('login/', LoginView.as_view(), name='login'),
     path('signup/', SignUpView.as_view(), name='signup')
 ]
@@ -1,16 +1,21 @@
+from django.contrib.auth import views as auth_views
 from django.contrib.auth.mixins import UserPassesTestMixin
 from django.urls import reverse_lazy
 from django.views.generic import CreateView
 
 from accounts.forms import CustomUserCreationForm
+from pages.mixins import AnonymousPageCacheMixin
 
 
-class SignUpView(UserPassesTestMixin, CreateView):
+class SignUpView(AnonymousPageCacheMixin, UserPassesTestMixin, CreateView):
     """
     A class-based view that inherits from Django generic 'CreateView' view
     and uses the 'UserPassesTestMixin' mixin and implements the user signup
     logic exclusively for non-authenticated users.
 
+    The signup form page can be cached (via the 'AnonymousPageCacheMixin'
+    mixin).
+
     Attributes:
         * form_class: Class-based form to use in the user signup process.
         * success_url: URL for a successful signup process.
@@ -30,3 +35,16 @@ class SignUpView(UserPassesTestMixin, CreateView):
         False otherwise.
         """
         return not self.request.user.is_authenticated
+
+
+class LoginView(AnonymousPageCacheMixin, auth_views.LoginView):
+    """
+    A class-based view that extends the Django 'LoginView' view so the login
+    form page served to non-authenticated users can be cached (via the
+    'AnonymousPageCacheMixin' mixin).
+
+    Attributes:
+        * page_cache_query_params: The redirect parameter read by the view,
+          which is part of the page cache keys.
+    """
+    page_cache_query_params = (auth_views.LoginView.redirect_field_name,)
@@ -28,8 +28,11 @@ class ArticleAdmin(admin.ModelAdmin):
 
     Attributes:
         inlines: A list of inline classes to use with the Article model.
+        readonly_fields: The summary fields (computed from the article body
+            every time it is saved) and the comment counter.
     """
     inlines = [CommentInline]
+    readonly_fields = (*Article.SUMMARY_FIELDS, 'comment_count')
 
 
 admin.site.register(Article, ArticleAdmin)
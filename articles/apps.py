@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class ArticlesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'articles'
+
+    def ready(self):
+        """
+        It connects the signal handlers of the app models once the app
+        registry is ready.
+        """
+        from articles import signals  # noqa: F401
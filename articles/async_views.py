@@ -0,0 +1,237 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.contrib.auth.mixins import AccessMixin
+from django.core.cache import cache
+from django.http import Http404
+from django.template.response import TemplateResponse
+from django.utils.functional import SimpleLazyObject
+from django.views import View
+
+from articles.cache import aget_article_version, comments_fragment_key, \
+    comments_fragment_vary_on
+from articles.forms import CommentForm
+from articles.models import Article
+from articles.pagination import InvalidCursor, KeysetPaginator
+from articles.views import ARTICLE_CARD_FIELDS, ArticleDetailView, \
+    annotate_is_owner, get_comments_paginator
+
+
+async def aget_user(request):
+    """
+    It loads the user of a request.
+
+    The session and the authentication backends are synchronous (they may
+    query the database), so the user is loaded in a thread once per request
+    and stored in the request, replacing the lazy user set by the
+    authentication middleware. The templates and the synchronous code
+    called later reuse it without touching the database again.
+
+    :param request: The incoming request.
+    :return: The user (an 'AnonymousUser' object if the user isn't logged
+        in).
+    """
+    user = await sync_to_async(get_user)(request)
+    request.user = user
+    return user
+
+
+class AsyncLoginRequiredMixin(AccessMixin):
+    """
+    The asynchronous version of Django's 'LoginRequiredMixin' mixin, for the
+    views with async handlers.
+
+    The user is loaded (see 'aget_user') before the request is dispatched,
+    so the handlers can use 'request.user' without blocking the event loop.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        """
+        It dispatches the request if the user is logged in, redirecting it
+        to the login page otherwise.
+
+        :param request: The incoming request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The HTTP response.
+        """
+        user = await aget_user(request)
+        if not user.is_authenticated:
+            return self.handle_no_permission()
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class AsyncArticleListView(AsyncLoginRequiredMixin, View):
+    """
+    The asynchronous version of the 'ArticleListView' view, for ASGI
+    servers.
+
+    The page of articles is fetched with the async ORM interface, so the
+    request never leaves the event loop while it waits for the database
+    (only the user loading and the template rendering run in a thread).
+    The page has the same content as the one of the 'ArticleListView' view,
+    but conditional GET requests aren't supported.
+
+    Attributes:
+        template_name: The template name used to render the view.
+        paginate_by: The number of articles on each page.
+        cursor_kwarg: The query string parameter that holds the cursor.
+    """
+    template_name = 'articles/article_list.html'
+    paginate_by = 12
+    cursor_kwarg = 'cursor'
+
+    async def get(self, request, *args, **kwargs):
+        """
+        Handles GET requests for the view.
+
+        :param request: The incoming GET request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The HTTP response.
+        :raise Http404: If the page cursor is invalid.
+        """
+        paginator = KeysetPaginator(
+            queryset=(
+                Article.objects
+                .select_related('author')
+                .only(*ARTICLE_CARD_FIELDS)
+            ),
+            per_page=self.paginate_by
+        )
+        try:
+            page = await paginator.apage(request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            raise Http404('Invalid page cursor.')
+        context = {
+            'view': self,
+            'paginator': paginator,
+            'page_obj': page,
+            'is_paginated': page.has_other_pages(),
+            'object_list': page.object_list,
+            'article_list': page.object_list,
+        }
+        return TemplateResponse(request, self.template_name, context)
+
+
+class AsyncArticleDetailView(AsyncLoginRequiredMixin, View):
+    """
+    The asynchronous version of the 'ArticleDetailView' view, for ASGI
+    servers.
+
+    The article (with its author and the 'is_owner' flag), its cache
+    version and its page of comments are fetched with the async ORM and
+    cache interfaces. The comments aren't fetched when their template
+    fragment is cached. Comments are still added by the synchronous
+    'ArticleDetailPost' view, run in a thread, as the comment form, the
+    messages and the redirection are synchronous. Conditional GET requests
+    aren't supported.
+
+    Attributes:
+        template_name: The template name used to render the view.
+        comments_per_page: The number of comments on each page.
+        comments_cursor_kwarg: The query string parameter that holds the
+            comments page cursor.
+    """
+    template_name = 'articles/article_detail.html'
+    comments_per_page = 20
+    comments_cursor_kwarg = 'comments'
+
+    async def get_article(self, pk):
+        """
+        It returns the requested article, together with its author and the
+        'is_owner' flag of the current user.
+
+        :param pk: The id of the article.
+        :return: The article.
+        :raise Http404: If the article doesn't exist.
+        """
+        queryset = annotate_is_owner(Article.objects.all(), self.request.user)
+        try:
+            return await queryset.aget(pk=pk)
+        except Article.DoesNotExist:
+            raise Http404('No article found matching the query.')
+
+    async def get_comments_page(self, article, article_version, cursor):
+        """
+        It returns the requested page of comments of an article.
+
+        If the comments template fragment is cached, the comments aren't
+        fetched: a lazy page is returned instead, which only queries the
+        database (synchronously, while the template is rendered) if the
+        fragment expires in the meantime.
+
+        :param article: The article.
+        :param article_version: The cache version of the article.
+        :param cursor: The comments page cursor (empty for the first page).
+        :return: A 'KeysetPage' object (or a lazy one).
+        :raise Http404: If the comments page cursor is invalid.
+        """
+        paginator = get_comments_paginator(
+            article_id=article.pk,
+            per_page=self.comments_per_page
+        )
+        if cursor:
+            try:
+                paginator.decode_cursor(cursor)
+            except InvalidCursor:
+                raise Http404('Invalid comments page cursor.')
+
+        fragment_key = comments_fragment_key(article, article_version, cursor)
+        if await cache.ahas_key(fragment_key):
+            return SimpleLazyObject(lambda: paginator.page(cursor))
+        return await paginator.apage(cursor)
+
+    async def get(self, request, *args, **kwargs):
+        """
+        Handles GET requests for the view.
+
+        :param request: The incoming GET request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The HTTP response.
+        :raise Http404: If the article doesn't exist or the comments page
+            cursor is invalid.
+        """
+        article = await self.get_article(kwargs['pk'])
+        article_version = await aget_article_version(article.pk)
+        cursor = request.GET.get(self.comments_cursor_kwarg, '')
+        comment_page = await self.get_comments_page(
+            article=article,
+            article_version=article_version,
+            cursor=cursor
+        )
+        context = {
+            'view': self,
+            'object': article,
+            'article': article,
+            'comment_page': comment_page,
+            'comments': SimpleLazyObject(lambda: comment_page.object_list),
+            'comments_cursor': cursor,
+            'comments_fragment_vary_on': comments_fragment_vary_on(
+                article=article,
+                article_version=article_version,
+                cursor=cursor
+            ),
+            'article_version': article_version,
+            'fragment_cache_timeout':
+                settings.ARTICLE_FRAGMENT_CACHE_TIMEOUT,
+            'form': CommentForm(),
+        }
+        return TemplateResponse(request, self.template_name, context)
+
+    async def post(self, request, *args, **kwargs):
+        """
+        Handles POST requests for the view, calling the synchronous
+        'ArticleDetailPost' view in a thread.
+
+        :param request: The incoming POST request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The HTTP response.
+        """
+        return await sync_to_async(ArticleDetailView.post_view)(
+            request,
+            *args,
+            **kwargs
+        )
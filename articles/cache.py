@@ -0,0 +1,208 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+
+from articles.models import Article, ArticleArchiveMonth
+
+
+def _new_version():
+    """
+    It returns a new cache version number based on the current time.
+
+    Using the time (instead of starting from 1) means that a version lost
+    by the cache (evicted or after a restart) is never reused, so fragments
+    cached with an old version can't be served again.
+
+    :return: A new version number.
+    """
+    return time.time_ns() // 1000
+
+
+def get_cache_version(key):
+    """
+    It returns the current version of a cache namespace, creating it if it
+    doesn't exist yet.
+
+    :param key: The cache key that stores the version.
+    :return: The version number.
+    """
+    version = cache.get(key)
+    if version is None:
+        version = _new_version()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+async def aget_cache_version(key):
+    """
+    The asynchronous version of the 'get_cache_version' function.
+
+    :param key: The cache key that stores the version.
+    :return: The version number.
+    """
+    version = await cache.aget(key)
+    if version is None:
+        version = _new_version()
+        if not await cache.aadd(key, version, timeout=None):
+            version = await cache.aget(key, version)
+    return version
+
+
+def bump_cache_version(key):
+    """
+    It changes the version of a cache namespace, so all the entries cached
+    with the previous version are no longer used.
+
+    :param key: The cache key that stores the version.
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The version doesn't exist (yet or anymore)
+        cache.set(key, _new_version(), timeout=None)
+
+
+def article_version_key(article_id):
+    """
+    It returns the cache key that stores the version of an article.
+
+    :param article_id: The id of the article.
+    :return: The cache key.
+    """
+    return f'articles:article:{article_id}:version'
+
+
+def get_article_version(article_id):
+    """
+    It returns the cache version of an article, used to build the cache
+    keys of its template fragments.
+
+    :param article_id: The id of the article.
+    :return: The version number.
+    """
+    return get_cache_version(article_version_key(article_id))
+
+
+async def aget_article_version(article_id):
+    """
+    The asynchronous version of the 'get_article_version' function.
+
+    :param article_id: The id of the article.
+    :return: The version number.
+    """
+    return await aget_cache_version(article_version_key(article_id))
+
+
+def comments_fragment_vary_on(article, article_version, cursor):
+    """
+    It returns the values that the cached comments fragment of the article
+    detail page varies on (the template passes them to its 'cache' tag as a
+    single value, see 'comments_fragment_key').
+
+    :param article: The article.
+    :param article_version: The cache version of the article.
+    :param cursor: The comments page cursor (empty for the first page).
+    :return: The list of values.
+    """
+    return [article.pk, article_version, article.updated_at, cursor]
+
+
+def comments_fragment_key(article, article_version, cursor):
+    """
+    It returns the cache key of the comments fragment of the article detail
+    page, as built by its 'cache' template tag.
+
+    :param article: The article.
+    :param article_version: The cache version of the article.
+    :param cursor: The comments page cursor (empty for the first page).
+    :return: The cache key.
+    """
+    return make_template_fragment_key(
+        fragment_name='article_comments',
+        vary_on=[comments_fragment_vary_on(article, article_version, cursor)]
+    )
+
+
+def bump_article_version(article_id):
+    """
+    It invalidates the cached template fragments of an article by changing
+    its cache version.
+
+    :param article_id: The id of the article.
+    """
+    bump_cache_version(article_version_key(article_id))
+
+
+def author_article_count_key(author_id):
+    """
+    It returns the cache key that stores the number of articles of an
+    author.
+
+    :param author_id: The id of the author.
+    :return: The cache key.
+    """
+    return f'articles:author:{author_id}:count'
+
+
+def get_author_article_count(author_id):
+    """
+    It returns the number of articles of an author, counting them (over the
+    '(author, date, id)' index) only if the number isn't cached.
+
+    :param author_id: The id of the author.
+    :return: The number of articles.
+    """
+    key = author_article_count_key(author_id)
+    count = cache.get(key)
+    if count is None:
+        count = Article.objects.filter(author_id=author_id).count()
+        cache.set(key, count, timeout=settings.ARTICLE_COUNT_CACHE_TIMEOUT)
+    return count
+
+
+def invalidate_author_article_count(author_id):
+    """
+    It removes the cached number of articles of an author, so it is counted
+    again the next time it is needed.
+
+    :param author_id: The id of the author.
+    """
+    cache.delete(author_article_count_key(author_id))
+
+
+# Cache key that stores the monthly article counters
+ARCHIVE_MONTHS_KEY = 'articles:archive:months'
+
+
+def get_archive_months():
+    """
+    It returns the months that have articles and their number of articles
+    (newest month first), reading the monthly counters only if they aren't
+    cached.
+
+    :return: A list of '(year, month, article_count)' tuples.
+    """
+    months = cache.get(ARCHIVE_MONTHS_KEY)
+    if months is None:
+        months = list(
+            ArticleArchiveMonth.objects
+            .filter(article_count__gt=0)
+            .values_list('year', 'month', 'article_count')
+        )
+        cache.set(
+            ARCHIVE_MONTHS_KEY,
+            months,
+            timeout=settings.ARTICLE_COUNT_CACHE_TIMEOUT
+        )
+    return months
+
+
+def invalidate_archive_months():
+    """
+    It removes the cached monthly article counters, so they are read again
+    the next time they are needed.
+    """
+    cache.delete(ARCHIVE_MONTHS_KEY)
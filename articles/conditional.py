@@ -0,0 +1,86 @@
+import hashlib
+
+from django.views.decorators.http import condition
+
+
+def make_etag(*parts):
+    """
+    It builds a weak ETag from the given parts.
+
+    The ETags are weak because the pages include a per-request CSRF token,
+    so two responses with the same ETag are equivalent but not identical
+    byte by byte.
+
+    :param parts: The values that identify a version of a page.
+    :return: The weak ETag.
+    """
+    digest = hashlib.md5(usedforsecurity=False)
+    for part in parts:
+        digest.update(str(part).encode())
+        digest.update(b'|')
+    return f'W/"{digest.hexdigest()}"'
+
+
+def get_user_validator_parts(user):
+    """
+    It returns the values of the current user that change the pages (the
+    username in the navbar and the owner buttons).
+
+    The last login date is included so a page cached by a browser is not
+    reused after another user logs in on it.
+
+    :param user: The current user.
+    :return: A tuple with the user values.
+    """
+    return user.pk, user.last_login
+
+
+class ConditionalGetMixin:
+    """
+    A mixin for class-based views that answers conditional GET (and HEAD)
+    requests ('If-None-Match' and 'If-Modified-Since' headers) with an
+    HTTP 304 (Not Modified) response, without rendering the page.
+
+    The views provide the validators by overriding the 'get_etag' and
+    'get_last_modified' methods, which should run cheap queries only.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        """
+        It checks the validators of GET and HEAD requests before calling the
+        parent's implementation (other requests are not checked).
+
+        :param request: The incoming request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The HTTP response.
+        """
+        if request.method not in ('GET', 'HEAD'):
+            return super().dispatch(request, *args, **kwargs)
+        view = condition(
+            etag_func=self.get_etag,
+            last_modified_func=self.get_last_modified
+        )(super().dispatch)
+        return view(request, *args, **kwargs)
+
+    def get_etag(self, request, *args, **kwargs):
+        """
+        It returns the ETag of the requested page.
+
+        :param request: The incoming GET request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The ETag, or None if the page has no ETag.
+        """
+        return None
+
+    def get_last_modified(self, request, *args, **kwargs):
+        """
+        It returns the last modification date of the requested page.
+
+        :param request: The incoming GET request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The last modification date, or None if it is unknown.
+        """
+        return None
@@ -0,0 +1,166 @@
+import csv
+import datetime
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from articles.models import Article, Comment
+
+# Exported models and columns of every dataset
+EXPORT_DATASETS = {
+    'articles': (
+        Article,
+        (
+            'id', 'title', 'body', 'date', 'updated_at', 'author_id',
+            'author__username', 'word_count', 'reading_time',
+            'comment_count'
+        )
+    ),
+    'comments': (
+        Comment,
+        (
+            'id', 'article_id', 'author_id', 'author__username', 'comment',
+            'created_at'
+        )
+    ),
+}
+
+# Export formats and their content types
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+class ExportJSONEncoder(DjangoJSONEncoder):
+    """
+    A JSON encoder that keeps the microseconds of the dates and times
+    (Django's encoder truncates them to milliseconds), so the exported dates
+    can be imported back without changes.
+    """
+
+    def default(self, o):
+        """
+        It encodes the values that the JSON module doesn't support.
+
+        :param o: The value.
+        :return: The encoded value.
+        """
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class Echo:
+    """
+    A file-like object that returns what is written to it instead of
+    storing it, used to get the lines built by a CSV writer one by one.
+    """
+
+    def write(self, value):
+        """
+        It returns the written value.
+
+        :param value: The value to write.
+        :return: The same value.
+        """
+        return value
+
+
+def iter_rows(dataset, using='default', chunk_size=2000):
+    """
+    It returns the rows of a dataset, ordered by id.
+
+    The rows are fetched as dictionaries with a server-side cursor (where
+    the database supports it) in chunks, so the memory use doesn't depend on
+    the size of the table.
+
+    :param dataset: The name of the dataset ('articles' or 'comments').
+    :param using: The alias of the database that stores the dataset.
+    :param chunk_size: The number of rows fetched from the database at once.
+    :return: An iterator over the rows.
+    """
+    model, fields = EXPORT_DATASETS[dataset]
+    return (
+        model.objects
+        .using(using)
+        .order_by('pk')
+        .values(*fields)
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def iter_ndjson(rows):
+    """
+    It encodes rows as NDJSON (a JSON object per line).
+
+    :param rows: The rows (dictionaries).
+    :return: An iterator over the lines.
+    """
+    encoder = ExportJSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(row) + '\n'
+
+
+def iter_csv(rows, fields):
+    """
+    It encodes rows as CSV, with a header line.
+
+    :param rows: The rows (dictionaries).
+    :param fields: The column names.
+    :return: An iterator over the lines.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow([row[field] for field in fields])
+
+
+def iter_gzip(chunks, level=6, min_size=64 * 1024):
+    """
+    It compresses text chunks in the gzip format as they are produced.
+
+    The compressed data is returned in blocks of about 'min_size' bytes (or
+    less at the end), so the memory use is constant and the receiver gets
+    the data while the rest is still being compressed.
+
+    :param chunks: The text chunks.
+    :param level: The compression level (1 to 9).
+    :param min_size: The minimum size of the returned blocks.
+    :return: An iterator over the compressed blocks.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    buffer = []
+    buffered = 0
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            buffer.append(data)
+            buffered += len(data)
+            if buffered >= min_size:
+                yield b''.join(buffer)
+                buffer = []
+                buffered = 0
+    buffer.append(compressor.flush())
+    yield b''.join(buffer)
+
+
+def iter_export(dataset, export_format, compress=True, using='default',
+                chunk_size=2000):
+    """
+    It returns the content of a dataset export.
+
+    :param dataset: The name of the dataset ('articles' or 'comments').
+    :param export_format: The format ('ndjson' or 'csv').
+    :param compress: True to compress the content in the gzip format.
+    :param using: The alias of the database that stores the dataset.
+    :param chunk_size: The number of rows fetched from the database at once.
+    :return: An iterator over the content (bytes if it is compressed, text
+        otherwise).
+    """
+    rows = iter_rows(dataset, using=using, chunk_size=chunk_size)
+    if export_format == 'csv':
+        lines = iter_csv(rows, EXPORT_DATASETS[dataset][1])
+    else:
+        lines = iter_ndjson(rows)
+    return iter_gzip(lines) if compress else lines
@@ -0,0 +1,398 @@
+import copy
+import hashlib
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.syndication.views import Feed
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.feedgenerator import Atom1Feed
+from django.utils.http import http_date
+
+from articles.cache import bump_cache_version, get_cache_version
+from articles.models import Article
+from newspaper.db.routers import replica_reads
+
+# Fields of the articles loaded by the feeds
+FEED_ARTICLE_FIELDS = (
+    'title',
+    'excerpt',
+    'date',
+    'updated_at',
+    'author__username'
+)
+
+
+def latest_feed_scope():
+    """
+    It returns the cache scope of the latest articles feeds.
+
+    :return: The cache scope.
+    """
+    return 'articles:feed:latest'
+
+
+def author_feed_scope(username):
+    """
+    It returns the cache scope of the article feeds of an author.
+
+    :param username: The username of the author.
+    :return: The cache scope.
+    """
+    return f'articles:feed:author:{username}'
+
+
+def invalidate_article_feeds(article):
+    """
+    It invalidates the cached feeds that include (or would include) an
+    article that has been saved or deleted.
+
+    The feeds of a scope (RSS and Atom) are only invalidated if the article
+    is newer than the oldest article of the cached feeds or if the cached
+    feeds aren't full (or their oldest article is unknown), so changes to
+    old articles don't invalidate them.
+
+    The scopes are also marked as recently written, so their feeds are
+    generated from the primary database until the replicas have received
+    the change.
+
+    The username of the author (in the scope of the author feeds) is taken
+    from the author loaded with the article, and only fetched (alone) if it
+    isn't loaded.
+
+    :param article: The saved or deleted article.
+    """
+    if Article.author.is_cached(article):
+        username = article.author.username
+    else:
+        username = (
+            get_user_model().objects
+            .filter(pk=article.author_id)
+            .values_list('username', flat=True)
+            .first()
+        )
+    scopes = [latest_feed_scope()]
+    if username is not None:
+        scopes.append(author_feed_scope(username))
+    for scope in scopes:
+        if settings.DATABASE_REPLICAS:
+            cache.set(
+                f'{scope}:written',
+                True,
+                timeout=settings.DATABASE_REPLICA_PIN_SECONDS
+            )
+        version = cache.get(f'{scope}:version')
+        if version is None:
+            # Nothing has been cached for the scope
+            continue
+        floor = cache.get(f'{scope}:{version}:floor', default=False)
+        if floor in (False, None) or (article.date, article.pk) >= floor:
+            bump_cache_version(f'{scope}:version')
+
+
+def invalidate_feed_scopes(usernames):
+    """
+    It invalidates the cached latest articles feeds and the feeds of some
+    authors, whatever their articles are, e.g. after a bulk import, which
+    doesn't run the signal handlers.
+
+    :param usernames: The usernames of the authors.
+    """
+    scopes = [
+        latest_feed_scope(),
+        *(author_feed_scope(username) for username in usernames)
+    ]
+    for scope in scopes:
+        if settings.DATABASE_REPLICAS:
+            cache.set(
+                f'{scope}:written',
+                True,
+                timeout=settings.DATABASE_REPLICA_PIN_SECONDS
+            )
+        bump_cache_version(f'{scope}:version')
+
+
+class CachedArticleFeed(Feed):
+    """
+    The base class of the article feeds, which caches the generated XML.
+
+    The XML of every feed is cached with the version of its scope (the
+    latest articles or the articles of an author), which is changed when an
+    article of the scope is saved or deleted (see 'articles.signals'), so
+    the polls of the feed readers are answered from the cache without
+    querying the database. The responses have 'ETag' and 'Last-Modified'
+    headers and conditional requests are answered with an HTTP 304 (Not
+    Modified) response.
+
+    The feeds are generated from the database replicas, if any, except
+    right after a change of their scope.
+
+    Attributes:
+        item_count: The number of articles of the feed.
+    """
+    item_count = 20
+
+    def __call__(self, request, *args, **kwargs):
+        """
+        It returns the feed, served by a copy of the feed object (the feed
+        objects are shared by all the requests and the feed generation
+        stores values in the object).
+
+        :param request: The incoming request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The HTTP response.
+        """
+        return copy.copy(self).serve(request, *args, **kwargs)
+
+    def serve(self, request, *args, **kwargs):
+        """
+        It returns the feed, generating it only if it isn't cached.
+
+        :param request: The incoming request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The HTTP response.
+        """
+        scope = self.get_cache_scope(**kwargs)
+        version = get_cache_version(f'{scope}:version')
+        cache_key = f'{scope}:{version}:{self.feed_type.__name__}'
+        cached_feed = cache.get(cache_key)
+
+        if cached_feed is None:
+            # A lagging replica could cache the old feed with the new version
+            written = settings.DATABASE_REPLICAS \
+                and cache.get(f'{scope}:written', default=False)
+            with replica_reads(not written):
+                response = super().__call__(request, *args, **kwargs)
+            digest = hashlib.md5(response.content, usedforsecurity=False)
+            cached_feed = {
+                'content': response.content,
+                'content_type': response['Content-Type'],
+                'etag': f'"{digest.hexdigest()}"',
+                # The generation time, as the newest modification date of
+                # the articles goes back when an article is deleted
+                'last_modified': int(time.time()),
+            }
+            timeout = settings.ARTICLE_FEED_CACHE_TIMEOUT
+            cache.set(cache_key, cached_feed, timeout=timeout)
+            cache.set(
+                f'{scope}:{version}:floor',
+                self.floor,
+                timeout=timeout
+            )
+
+        response = HttpResponse(
+            cached_feed['content'],
+            content_type=cached_feed['content_type']
+        )
+        response['ETag'] = cached_feed['etag']
+        response['Last-Modified'] = http_date(cached_feed['last_modified'])
+        patch_cache_control(response, max_age=settings.ARTICLE_FEED_MAX_AGE)
+        return get_conditional_response(
+            request,
+            etag=cached_feed['etag'],
+            last_modified=cached_feed['last_modified'],
+            response=response
+        )
+
+    def get_cache_scope(self, **kwargs):
+        """
+        It returns the cache scope of the feed.
+
+        :param kwargs: The keyword arguments of the URL.
+        :return: The cache scope.
+        """
+        raise NotImplementedError(
+            'Subclasses of CachedArticleFeed must provide a '
+            'get_cache_scope() method.'
+        )
+
+    def get_articles(self, obj):
+        """
+        It returns the articles queryset of the feed.
+
+        :param obj: The object of the feed (None or an author).
+        :return: The articles queryset.
+        """
+        return Article.objects.all()
+
+    def items(self, obj):
+        """
+        It returns the newest articles of the feed and remembers the oldest
+        one (cached with the feed) if the feed is full.
+
+        :param obj: The object of the feed (None or an author).
+        :return: A list with the articles.
+        """
+        articles = list(
+            self.get_articles(obj)
+            .select_related('author')
+            .only(*FEED_ARTICLE_FIELDS)
+            .order_by('-date', '-id')[:self.item_count]
+        )
+        self.floor = None
+        if len(articles) == self.item_count:
+            self.floor = (articles[-1].date, articles[-1].pk)
+        return articles
+
+    def item_title(self, item):
+        """
+        It returns the title of a feed item.
+
+        :param item: The article.
+        :return: The article title.
+        """
+        return item.title
+
+    def item_description(self, item):
+        """
+        It returns the description of a feed item.
+
+        :param item: The article.
+        :return: The article excerpt.
+        """
+        return item.excerpt
+
+    def item_author_name(self, item):
+        """
+        It returns the author name of a feed item.
+
+        :param item: The article.
+        :return: The username of the author.
+        """
+        return item.author.username
+
+    def item_pubdate(self, item):
+        """
+        It returns the publication date of a feed item.
+
+        :param item: The article.
+        :return: The article date.
+        """
+        return item.date
+
+    def item_updateddate(self, item):
+        """
+        It returns the modification date of a feed item.
+
+        :param item: The article.
+        :return: The article modification date.
+        """
+        return item.updated_at
+
+
+class LatestArticlesFeed(CachedArticleFeed):
+    """
+    An RSS feed with the newest articles.
+    """
+    title = 'Newspaper App: latest articles'
+    description = 'The newest articles of the Newspaper App.'
+
+    def link(self):
+        """
+        It returns the link of the feed.
+
+        :return: The URL of the article list.
+        """
+        return reverse('article_list')
+
+    def get_cache_scope(self, **kwargs):
+        """
+        It returns the cache scope of the feed.
+
+        :param kwargs: The keyword arguments of the URL.
+        :return: The cache scope.
+        """
+        return latest_feed_scope()
+
+
+class LatestArticlesAtomFeed(LatestArticlesFeed):
+    """
+    An Atom feed with the newest articles.
+    """
+    feed_type = Atom1Feed
+    subtitle = LatestArticlesFeed.description
+
+
+class AuthorArticlesFeed(CachedArticleFeed):
+    """
+    An RSS feed with the newest articles of an author.
+    """
+
+    def get_object(self, request, username):
+        """
+        It returns the author whose username is in the URL.
+
+        :param request: The incoming request.
+        :param username: The username of the author.
+        :return: The author.
+        :raise Http404: If there is no user with the username.
+        """
+        return get_object_or_404(
+            get_user_model().objects.only('id', 'username'),
+            username=username
+        )
+
+    def title(self, obj):
+        """
+        It returns the title of the feed.
+
+        :param obj: The author.
+        :return: The feed title.
+        """
+        return f'Newspaper App: articles by {obj.username}'
+
+    def description(self, obj):
+        """
+        It returns the description of the feed.
+
+        :param obj: The author.
+        :return: The feed description.
+        """
+        return f'The newest articles of {obj.username}.'
+
+    subtitle = description
+
+    def link(self, obj):
+        """
+        It returns the link of the feed.
+
+        :param obj: The author.
+        :return: The URL of the author articles page.
+        """
+        return reverse(
+            viewname='author_article_list',
+            kwargs={
+                'username': obj.username
+            }
+        )
+
+    def get_cache_scope(self, **kwargs):
+        """
+        It returns the cache scope of the feed.
+
+        :param kwargs: The keyword arguments of the URL.
+        :return: The cache scope.
+        """
+        return author_feed_scope(kwargs['username'])
+
+    def get_articles(self, obj):
+        """
+        It returns the articles queryset of the feed.
+
+        :param obj: The author.
+        :return: The articles of the author.
+        """
+        return Article.objects.filter(author=obj)
+
+
+class AuthorArticlesAtomFeed(AuthorArticlesFeed):
+    """
+    An Atom feed with the newest articles of an author.
+    """
+    feed_type = Atom1Feed
@@ -0,0 +1,131 @@
+import contextlib
+import csv
+import gzip
+import json
+from itertools import islice
+
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# Import formats of the file extensions
+IMPORT_FORMATS = {
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+    '.csv': 'csv',
+}
+
+
+def get_import_format(path):
+    """
+    It returns the format of an import file from its extension (ignoring a
+    final '.gz' extension).
+
+    :param path: The path of the file.
+    :return: The format ('ndjson' or 'csv'), or None if it is unknown.
+    """
+    name = path[:-3] if path.endswith('.gz') else path
+    for extension, import_format in IMPORT_FORMATS.items():
+        if name.endswith(extension):
+            return import_format
+    return None
+
+
+def open_import_file(path):
+    """
+    It opens an import file as text, decompressing it if its name ends with
+    '.gz'.
+
+    :param path: The path of the file.
+    :return: The text file.
+    """
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', newline='')
+    return open(path, encoding='utf-8', newline='')
+
+
+def iter_records(file, import_format, skip=0):
+    """
+    It reads the records of an import file one by one, so the file is never
+    loaded all at once.
+
+    :param file: The text file.
+    :param import_format: The format of the file ('ndjson' or 'csv').
+    :param skip: The number of records to skip (the NDJSON records skipped
+        aren't decoded).
+    :return: An iterator over the records (dictionaries).
+    """
+    if import_format == 'csv':
+        yield from islice(csv.DictReader(file), skip, None)
+        return
+    lines = (line for line in file if line.strip())
+    for line in islice(lines, skip, None):
+        yield json.loads(line)
+
+
+def iter_batches(records, batch_size):
+    """
+    It groups records into lists of at most 'batch_size' records.
+
+    :param records: The records.
+    :param batch_size: The maximum number of records of every batch.
+    :return: An iterator over the batches.
+    """
+    records = iter(records)
+    while batch := list(islice(records, batch_size)):
+        yield batch
+
+
+def parse_date(value):
+    """
+    It parses an imported date and time (an ISO 8601 string), which is
+    considered to be in the project time zone if it has no offset.
+
+    :param value: The imported value.
+    :return: An aware 'datetime' object, or None if the value is empty.
+    :raise ValueError: If the value isn't a valid date and time.
+    """
+    if not value:
+        return None
+    date = parse_datetime(value)
+    if date is None:
+        raise ValueError(f'Invalid date: {value!r}')
+    if timezone.is_naive(date):
+        date = timezone.make_aware(date)
+    return date
+
+
+def parse_id(value):
+    """
+    It parses an imported id.
+
+    :param value: The imported value.
+    :return: The id, or None if the value is empty.
+    """
+    if value in (None, ''):
+        return None
+    return int(value)
+
+
+@contextlib.contextmanager
+def imported_dates(model):
+    """
+    A context manager that disables the automatic dates ('auto_now' and
+    'auto_now_add' options) of a model, so the dates of the imported rows
+    are kept.
+
+    :param model: The model.
+    """
+    fields = [
+        field for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False)
+        or getattr(field, 'auto_now_add', False)
+    ]
+    options = [(field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, (auto_now, auto_now_add) in zip(fields, options):
+            field.auto_now = auto_now
+            field.auto_now_add = auto_now_add
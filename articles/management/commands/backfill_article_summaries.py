@@ -0,0 +1,70 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from articles.models import Article
+
+
+class Command(BaseCommand):
+    """
+    A management command that computes the summary fields (excerpt, word
+    count and reading time) of the existing articles.
+
+    The articles are processed in batches ordered by id, so the memory usage
+    is bounded by the batch size and every batch is saved with a single
+    bulk update inside its own transaction.
+
+    Usage:
+        python manage.py backfill_article_summaries [--batch-size N]
+    """
+    help = 'Computes the excerpt, word count and reading time of articles.'
+
+    def add_arguments(self, parser):
+        """
+        It adds the command-line arguments of the command.
+
+        :param parser: The command-line arguments parser.
+        """
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of articles updated on each batch.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        It runs the command, updating the articles batch by batch.
+
+        :param args: Positional arguments.
+        :param options: The command-line options.
+        """
+        batch_size = options['batch_size']
+        last_pk = 0
+        updated = 0
+
+        while True:
+            batch = list(
+                Article.objects
+                .filter(pk__gt=last_pk)
+                .order_by('pk')
+                .only('id', 'body')[:batch_size]
+            )
+            if not batch:
+                break
+
+            for article in batch:
+                article.update_summary()
+
+            with transaction.atomic():
+                Article.objects.bulk_update(
+                    objs=batch,
+                    fields=Article.SUMMARY_FIELDS
+                )
+
+            last_pk = batch[-1].pk
+            updated += len(batch)
+            self.stdout.write(f'{updated} articles updated...')
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Done: {updated} articles updated.')
+        )
@@ -0,0 +1,344 @@
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+from itertools import cycle, islice
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, \
+    SESSION_KEY, get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient, Client, override_settings
+from django.urls import reverse
+
+from articles.models import Article
+
+
+class Command(BaseCommand):
+    """
+    A management command that compares the throughput of the article list
+    and detail pages served by WSGI and ASGI workers under concurrent load.
+
+    The WSGI worker serves the synchronous views ('article_list' and
+    'article_detail') and the ASGI worker serves the async views
+    ('article_list_async' and 'article_detail_async').
+
+    With the '--wsgi-url' and '--asgi-url' options, the requests are made
+    over HTTP to running servers (e.g. gunicorn and uvicorn), from a pool of
+    threads, so the results include the server, the network and the
+    workers' processes. The servers must use the database of the command.
+
+    Otherwise, the worker runs in the command process, with Django's request
+    handlers and the project middleware but without any server, network or
+    HTTP parsing, so it's only an in-process micro-benchmark of the views:
+
+    - The WSGI handler is called from a pool of threads, one request per
+      thread at a time (like a threaded WSGI server).
+    - The ASGI handler is called from concurrent tasks on a single event
+      loop (like an ASGI server).
+
+    The requests are made by the given user, with a session created for the
+    benchmark (and deleted afterwards).
+
+    Usage:
+        python manage.py benchmark_article_views USERNAME [--requests N]
+            [--concurrency N] [--article ID] [--wsgi-url URL]
+            [--asgi-url URL]
+    """
+    help = 'Compares the throughput of the article views under WSGI and ASGI.'
+
+    def add_arguments(self, parser):
+        """
+        It adds the command-line arguments of the command.
+
+        :param parser: The command-line arguments parser.
+        """
+        parser.add_argument(
+            'username',
+            help='The user that makes the requests.'
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=500,
+            help='Number of requests made to every worker.'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=20,
+            help='Number of requests made at the same time.'
+        )
+        parser.add_argument(
+            '--article',
+            type=int,
+            help='The id of the article of the detail page (the newest '
+                 'article by default).'
+        )
+        parser.add_argument(
+            '--wsgi-url',
+            help='The base URL of a running WSGI server (e.g. '
+                 'http://127.0.0.1:8000). The views are called in-process '
+                 'by default.'
+        )
+        parser.add_argument(
+            '--asgi-url',
+            help='The base URL of a running ASGI server (e.g. '
+                 'http://127.0.0.1:8001). The views are called in-process '
+                 'by default.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        It runs the command.
+
+        :param args: Positional arguments.
+        :param options: The command-line options.
+        :raise CommandError: If the user or the article doesn't exist, or a
+            server can't be reached.
+        """
+        user_model = get_user_model()
+        try:
+            user = user_model.objects.get(
+                **{user_model.USERNAME_FIELD: options['username']}
+            )
+        except user_model.DoesNotExist:
+            raise CommandError(f"Unknown user: {options['username']}")
+
+        article_id = options['article']
+        if article_id is None:
+            article_id = (
+                Article.objects
+                .order_by('-date', '-id')
+                .values_list('id', flat=True)
+                .first()
+            )
+        if article_id is None:
+            raise CommandError('There are no articles.')
+
+        total = max(options['requests'], 1)
+        concurrency = max(options['concurrency'], 1)
+        wsgi_paths = [
+            reverse('article_list'),
+            reverse('article_detail', kwargs={'pk': article_id}),
+        ]
+        asgi_paths = [
+            reverse('article_list_async'),
+            reverse('article_detail_async', kwargs={'pk': article_id}),
+        ]
+
+        wsgi_url = options['wsgi_url']
+        asgi_url = options['asgi_url']
+
+        session_key = self.create_session(user)
+        # The test clients make the requests to the 'testserver' host
+        allowed_hosts = [*settings.ALLOWED_HOSTS, 'testserver']
+        try:
+            with override_settings(ALLOWED_HOSTS=allowed_hosts):
+                if wsgi_url:
+                    wsgi_summary = self.run_http(
+                        url=wsgi_url,
+                        paths=wsgi_paths,
+                        total=total,
+                        concurrency=concurrency,
+                        session_key=session_key
+                    )
+                else:
+                    wsgi_summary = self.run_wsgi(
+                        paths=wsgi_paths,
+                        total=total,
+                        concurrency=concurrency,
+                        session_key=session_key
+                    )
+                if asgi_url:
+                    asgi_summary = self.run_http(
+                        url=asgi_url,
+                        paths=asgi_paths,
+                        total=total,
+                        concurrency=concurrency,
+                        session_key=session_key
+                    )
+                else:
+                    asgi_summary = asyncio.run(self.run_asgi(
+                        paths=asgi_paths,
+                        total=total,
+                        concurrency=concurrency,
+                        session_key=session_key
+                    ))
+        finally:
+            self.delete_session(session_key)
+        self.report(f"WSGI ({wsgi_url or 'in-process'})", wsgi_summary)
+        self.report(f"ASGI ({asgi_url or 'in-process'})", asgi_summary)
+
+    def create_session(self, user):
+        """
+        It creates a session where the user is logged in.
+
+        :param user: The user.
+        :return: The session key.
+        """
+        engine = import_module(settings.SESSION_ENGINE)
+        session = engine.SessionStore()
+        session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+        session[BACKEND_SESSION_KEY] = \
+            'django.contrib.auth.backends.ModelBackend'
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.create()
+        return session.session_key
+
+    def delete_session(self, session_key):
+        """
+        It deletes the session created for the benchmark.
+
+        :param session_key: The session key.
+        """
+        engine = import_module(settings.SESSION_ENGINE)
+        engine.SessionStore().delete(session_key)
+
+    def run_wsgi(self, paths, total, concurrency, session_key):
+        """
+        It makes the requests to the WSGI handler from a pool of threads.
+
+        :param paths: The requested paths (used in turns).
+        :param total: The number of requests.
+        :param concurrency: The number of threads.
+        :param session_key: The session key of the user.
+        :return: A tuple with the elapsed seconds, the response times in
+            seconds and the number of failed requests.
+        """
+        local = threading.local()
+
+        def fetch(path):
+            client = getattr(local, 'client', None)
+            if client is None:
+                client = local.client = Client()
+                client.cookies[settings.SESSION_COOKIE_NAME] = session_key
+            started_at = time.perf_counter()
+            response = client.get(path)
+            return time.perf_counter() - started_at, response.status_code
+
+        return self.run_threads(fetch, paths, total, concurrency)
+
+    def run_http(self, url, paths, total, concurrency, session_key):
+        """
+        It makes the requests over HTTP to a running server from a pool of
+        threads.
+
+        :param url: The base URL of the server.
+        :param paths: The requested paths (used in turns).
+        :param total: The number of requests.
+        :param concurrency: The number of threads.
+        :param session_key: The session key of the user.
+        :return: A tuple with the elapsed seconds, the response times in
+            seconds and the number of failed requests.
+        :raise CommandError: If the server can't be reached.
+        """
+        base_url = url.rstrip('/')
+        headers = {'Cookie': f'{settings.SESSION_COOKIE_NAME}={session_key}'}
+
+        def fetch(path):
+            request = Request(base_url + path, headers=headers)
+            started_at = time.perf_counter()
+            try:
+                with urlopen(request, timeout=30) as response:
+                    response.read()
+                    status_code = response.status
+            except HTTPError as error:
+                status_code = error.code
+            return time.perf_counter() - started_at, status_code
+
+        try:
+            return self.run_threads(fetch, paths, total, concurrency)
+        except URLError as error:
+            raise CommandError(f'Cannot reach {url}: {error.reason}')
+
+    def run_threads(self, fetch, paths, total, concurrency):
+        """
+        It makes the requests from a pool of threads, after a warm-up
+        request per thread.
+
+        :param fetch: The function that makes a request to a path and
+            returns a tuple with the response time and the status code.
+        :param paths: The requested paths (used in turns).
+        :param total: The number of requests.
+        :param concurrency: The number of threads.
+        :return: A tuple with the elapsed seconds, the response times in
+            seconds and the number of failed requests.
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # Warm up the threads (and their connections)
+            list(executor.map(fetch, islice(cycle(paths), concurrency)))
+            started_at = time.perf_counter()
+            results = list(executor.map(fetch, islice(cycle(paths), total)))
+            elapsed = time.perf_counter() - started_at
+        return self.summarize(elapsed, results)
+
+    async def run_asgi(self, paths, total, concurrency, session_key):
+        """
+        It makes the requests to the ASGI handler from concurrent tasks.
+
+        :param paths: The requested paths (used in turns).
+        :param total: The number of requests.
+        :param concurrency: The maximum number of requests in progress.
+        :param session_key: The session key of the user.
+        :return: A tuple with the elapsed seconds, the response times in
+            seconds and the number of failed requests.
+        """
+        client = AsyncClient()
+        client.cookies[settings.SESSION_COOKIE_NAME] = session_key
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(path):
+            async with semaphore:
+                started_at = time.perf_counter()
+                response = await client.get(path)
+                return time.perf_counter() - started_at, response.status_code
+
+        # Warm up the handler (and its database connection)
+        await asyncio.gather(*map(fetch, paths))
+        started_at = time.perf_counter()
+        results = await asyncio.gather(
+            *map(fetch, islice(cycle(paths), total))
+        )
+        elapsed = time.perf_counter() - started_at
+        return self.summarize(elapsed, results)
+
+    def summarize(self, elapsed, results):
+        """
+        It summarizes the results of a benchmark run.
+
+        :param elapsed: The elapsed seconds.
+        :param results: A list of tuples with the response times and the
+            status codes.
+        :return: A tuple with the elapsed seconds, the response times and
+            the number of failed requests.
+        """
+        times = [seconds for seconds, status_code in results]
+        errors = sum(
+            1 for seconds, status_code in results if status_code != 200
+        )
+        return elapsed, times, errors
+
+    def report(self, worker, summary):
+        """
+        It writes the throughput and the response time percentiles of a
+        worker.
+
+        :param worker: The name of the worker.
+        :param summary: The summary returned by the 'summarize' method.
+        """
+        elapsed, times, errors = summary
+        percentiles = statistics.quantiles(times, n=100) \
+            if len(times) > 1 else times * 99
+        self.stdout.write(
+            f'{worker}: {len(times)} requests in {elapsed:.2f} s, '
+            f'{len(times) / elapsed:.1f} requests/s, '
+            f'p50 {percentiles[49] * 1000:.1f} ms, '
+            f'p95 {percentiles[94] * 1000:.1f} ms, '
+            f'p99 {percentiles[98] * 1000:.1f} ms, '
+            f'{errors} errors'
+        )
@@ -0,0 +1,93 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from articles.export import EXPORT_DATASETS, EXPORT_FORMATS, iter_export
+
+
+class Command(BaseCommand):
+    """
+    A management command that exports the articles or the comments as NDJSON
+    or CSV, compressed in the gzip format by default.
+
+    The rows are streamed from the database and written as they are
+    compressed, so the memory use doesn't depend on the size of the tables
+    (unlike 'dumpdata', which loads all of them).
+
+    Usage:
+        python manage.py export_articles {articles,comments}
+            [--format {ndjson,csv}] [--output FILE] [--no-gzip]
+    """
+    help = 'Exports the articles or the comments as NDJSON or CSV.'
+
+    def add_arguments(self, parser):
+        """
+        It adds the command-line arguments of the command.
+
+        :param parser: The command-line arguments parser.
+        """
+        parser.add_argument(
+            'dataset',
+            choices=EXPORT_DATASETS,
+            help='The data to export.'
+        )
+        parser.add_argument(
+            '--format',
+            choices=EXPORT_FORMATS,
+            default='ndjson',
+            help='The export format.'
+        )
+        parser.add_argument(
+            '--output',
+            help='The output file (the standard output if it is not given).'
+        )
+        parser.add_argument(
+            '--no-gzip',
+            action='store_false',
+            dest='gzip',
+            help='Writes the export without compressing it.'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=2000,
+            help='Number of rows fetched from the database at once.'
+        )
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='The database that stores the data.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        It runs the command.
+
+        :param args: Positional arguments.
+        :param options: The command-line options.
+        """
+        chunks = iter_export(
+            dataset=options['dataset'],
+            export_format=options['format'],
+            compress=options['gzip'],
+            using=options['database'],
+            chunk_size=options['chunk_size']
+        )
+        if options['output']:
+            with open(options['output'], 'wb') as output:
+                self.write_chunks(output, chunks, options['gzip'])
+        else:
+            self.write_chunks(sys.stdout.buffer, chunks, options['gzip'])
+            sys.stdout.buffer.flush()
+
+    def write_chunks(self, output, chunks, compressed):
+        """
+        It writes the export chunks to a binary file.
+
+        :param output: The binary file.
+        :param chunks: The export chunks.
+        :param compressed: True if the chunks are bytes, False if they are
+            text.
+        """
+        for chunk in chunks:
+            output.write(chunk if compressed else chunk.encode())
@@ -0,0 +1,404 @@
+import json
+import os
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connections, transaction
+from django.utils import timezone
+
+from articles.cache import bump_article_version, \
+    invalidate_author_article_count
+from articles.feeds import invalidate_feed_scopes
+from articles.imports import get_import_format, imported_dates, \
+    iter_batches, iter_records, open_import_file, parse_date, parse_id
+from articles.models import Article, Comment
+from articles.search.autocomplete import invalidate_title_indexes
+from articles.sitemaps import invalidate_sitemaps
+
+
+class Command(BaseCommand):
+    """
+    A management command that imports articles or comments from NDJSON or
+    CSV files (optionally gzip-compressed), like the ones written by the
+    'export_articles' command.
+
+    The records are read one by one and inserted with 'bulk_create' in
+    batches, every batch in its own transaction. The authors are resolved
+    by username (or id) through an in-memory map loaded once, and the ids
+    and dates of the records are kept when they are given, so comments can
+    refer to imported articles.
+
+    After every batch, the number of records processed is saved in a
+    checkpoint file, so an interrupted import can be run again with the
+    same arguments and it resumes after the last committed batch. Records
+    without an id in the batch that was being committed when the import
+    was interrupted may be imported twice.
+
+    The bulk inserts don't run the signal handlers, so the comment
+    counters, the search index and the archive counters are rebuilt at the
+    end (unless the '--no-rebuild' option is given). The caches that the
+    signal handlers invalidate (the article fragments, the feeds, the
+    sitemaps and the autocomplete indexes) are invalidated too, and the
+    modification dates of the articles with imported comments are updated,
+    so their conditional GET validators change.
+
+    Usage:
+        python manage.py import_articles {articles,comments} FILE
+            [--format {ndjson,csv}] [--batch-size N] [--checkpoint FILE]
+    """
+    help = 'Imports articles or comments from NDJSON or CSV files.'
+
+    # Imported models
+    models = {
+        'articles': Article,
+        'comments': Comment,
+    }
+
+    # Seconds between progress reports
+    report_interval = 5
+
+    def add_arguments(self, parser):
+        """
+        It adds the command-line arguments of the command.
+
+        :param parser: The command-line arguments parser.
+        """
+        parser.add_argument(
+            'dataset',
+            choices=self.models,
+            help='The data to import.'
+        )
+        parser.add_argument(
+            'path',
+            help='The file to import (compressed if it ends with ".gz").'
+        )
+        parser.add_argument(
+            '--format',
+            choices=('ndjson', 'csv'),
+            help='The file format (taken from the file name by default).'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Number of records inserted on each transaction.'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            help='The checkpoint file (the file to import plus '
+                 '".checkpoint" by default).'
+        )
+        parser.add_argument(
+            '--no-rebuild',
+            action='store_false',
+            dest='rebuild',
+            help='Doesn\'t rebuild the counters and indexes at the end.'
+        )
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='The database where the records are imported.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        It runs the command.
+
+        :param args: Positional arguments.
+        :param options: The command-line options.
+        :raise CommandError: If the file format is unknown.
+        """
+        path = options['path']
+        import_format = options['format'] or get_import_format(path)
+        if import_format is None:
+            raise CommandError(
+                'Unknown file format, use the --format option.'
+            )
+        self.using = options['database']
+        self.dataset = options['dataset']
+        model = self.models[self.dataset]
+        batch_size = options['batch_size']
+        checkpoint_path = options['checkpoint'] or f'{path}.checkpoint'
+
+        processed = self.read_checkpoint(checkpoint_path, path)
+        if processed:
+            self.stdout.write(f'Resuming after {processed} records.')
+        self.load_authors()
+        self.imported_author_ids = set()
+        self.imported_ids = False
+        self.changed_article_ids = set()
+        self.unknown_article_ids = False
+        imported = 0
+        ignore_conflicts = bool(processed)
+        started_at = reported_at = time.perf_counter()
+        started_with = processed
+
+        with open_import_file(path) as file, imported_dates(model):
+            records = iter_records(file, import_format, skip=processed)
+            for batch in iter_batches(records, batch_size):
+                objects = self.build_objects(batch)
+                with transaction.atomic(using=self.using):
+                    model.objects.using(self.using).bulk_create(
+                        objects,
+                        batch_size=batch_size,
+                        ignore_conflicts=ignore_conflicts
+                    )
+                ignore_conflicts = False
+                self.record_changed_articles(objects)
+                processed += len(batch)
+                imported += len(objects)
+                self.write_checkpoint(checkpoint_path, path, processed)
+
+                now = time.perf_counter()
+                if now - reported_at >= self.report_interval:
+                    reported_at = now
+                    self.report(processed, started_with, started_at)
+
+        if self.imported_ids:
+            self.reset_sequence(model)
+        os.remove(checkpoint_path)
+        self.report(processed, started_with, started_at)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Done: {imported} {self.dataset} imported, '
+                f'{processed - started_with - imported} records skipped.'
+            )
+        )
+
+        for author_id in self.imported_author_ids:
+            invalidate_author_article_count(author_id)
+        if options['rebuild']:
+            self.rebuild()
+        self.invalidate_caches()
+
+    def read_checkpoint(self, checkpoint_path, path):
+        """
+        It reads the number of records already processed from the
+        checkpoint file.
+
+        :param checkpoint_path: The path of the checkpoint file.
+        :param path: The path of the imported file.
+        :return: The number of records processed (0 if there is no
+            checkpoint).
+        :raise CommandError: If the checkpoint belongs to another file.
+        """
+        if not os.path.exists(checkpoint_path):
+            return 0
+        with open(checkpoint_path) as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        if checkpoint['path'] != os.path.abspath(path):
+            raise CommandError(
+                f'The checkpoint {checkpoint_path} belongs to another file.'
+            )
+        return checkpoint['processed']
+
+    def write_checkpoint(self, checkpoint_path, path, processed):
+        """
+        It saves the number of records processed in the checkpoint file.
+
+        The file is replaced atomically, so an interruption never leaves a
+        truncated checkpoint.
+
+        :param checkpoint_path: The path of the checkpoint file.
+        :param path: The path of the imported file.
+        :param processed: The number of records processed.
+        """
+        temporary_path = f'{checkpoint_path}.tmp'
+        with open(temporary_path, 'w') as checkpoint_file:
+            json.dump(
+                {'path': os.path.abspath(path), 'processed': processed},
+                checkpoint_file
+            )
+        os.replace(temporary_path, checkpoint_path)
+
+    def load_authors(self):
+        """
+        It loads the map of usernames to user ids used to resolve the
+        authors of the records.
+        """
+        users = (
+            get_user_model().objects
+            .using(self.using)
+            .values_list('username', 'id')
+            .iterator()
+        )
+        self.author_ids_by_username = dict(users)
+        self.author_ids = set(self.author_ids_by_username.values())
+
+    def get_author_id(self, record):
+        """
+        It returns the id of the author of a record, given by its username
+        ('author__username' or 'author' field) or by its id ('author_id'
+        field).
+
+        :param record: The imported record.
+        :return: The user id, or None if the user doesn't exist.
+        """
+        username = record.get('author__username') or record.get('author')
+        if username:
+            return self.author_ids_by_username.get(username)
+        author_id = parse_id(record.get('author_id'))
+        return author_id if author_id in self.author_ids else None
+
+    def build_objects(self, batch):
+        """
+        It builds the model instances of a batch of records, skipping the
+        records whose author (or article) doesn't exist.
+
+        :param batch: The imported records.
+        :return: A list with the model instances.
+        """
+        if self.dataset == 'articles':
+            objects = [self.build_article(record) for record in batch]
+        else:
+            article_ids = {
+                parse_id(record.get('article_id')) for record in batch
+            }
+            self.existing_article_ids = set(
+                Article.objects
+                .using(self.using)
+                .filter(pk__in=article_ids - {None})
+                .values_list('pk', flat=True)
+            )
+            objects = [self.build_comment(record) for record in batch]
+        objects = [obj for obj in objects if obj is not None]
+        if any(obj.pk is not None for obj in objects):
+            self.imported_ids = True
+        return objects
+
+    def build_article(self, record):
+        """
+        It builds an article from an imported record, computing its summary
+        fields.
+
+        :param record: The imported record.
+        :return: The article, or None if its author doesn't exist.
+        """
+        author_id = self.get_author_id(record)
+        if author_id is None:
+            return None
+        self.imported_author_ids.add(author_id)
+        date = parse_date(record.get('date')) or timezone.now()
+        article = Article(
+            id=parse_id(record.get('id')),
+            title=record['title'],
+            body=record['body'],
+            author_id=author_id,
+            date=date,
+            updated_at=parse_date(record.get('updated_at')) or date
+        )
+        article.update_summary()
+        return article
+
+    def build_comment(self, record):
+        """
+        It builds a comment from an imported record.
+
+        :param record: The imported record.
+        :return: The comment, or None if its author or article doesn't
+            exist.
+        """
+        author_id = self.get_author_id(record)
+        article_id = parse_id(record.get('article_id'))
+        if author_id is None or article_id not in self.existing_article_ids:
+            return None
+        return Comment(
+            id=parse_id(record.get('id')),
+            comment=record['comment'],
+            article_id=article_id,
+            author_id=author_id,
+            created_at=parse_date(record.get('created_at')) or timezone.now()
+        )
+
+    def record_changed_articles(self, objects):
+        """
+        It records the ids of the imported articles (or of the articles of
+        the imported comments), whose caches are invalidated at the end.
+
+        :param objects: The inserted model instances.
+        """
+        for obj in objects:
+            if self.dataset == 'comments':
+                self.changed_article_ids.add(obj.article_id)
+            elif obj.pk is None:
+                # Not returned by the database
+                self.unknown_article_ids = True
+            else:
+                self.changed_article_ids.add(obj.pk)
+
+    def invalidate_caches(self):
+        """
+        It invalidates the caches that the signal handlers keep up to date,
+        which the bulk inserts skip, and updates the modification date of
+        the articles with imported comments.
+        """
+        if self.dataset == 'articles':
+            usernames = {
+                username
+                for username, author_id in self.author_ids_by_username.items()
+                if author_id in self.imported_author_ids
+            }
+            invalidate_feed_scopes(usernames)
+            invalidate_sitemaps(
+                None if self.unknown_article_ids else self.changed_article_ids
+            )
+            invalidate_title_indexes()
+        else:
+            now = timezone.now()
+            for article_ids in iter_batches(
+                sorted(self.changed_article_ids),
+                1000
+            ):
+                Article.objects.using(self.using).filter(
+                    pk__in=article_ids
+                ).update(updated_at=now)
+        for article_id in self.changed_article_ids:
+            bump_article_version(article_id)
+
+    def reset_sequence(self, model):
+        """
+        It resets the id sequence of a model after importing records with
+        ids, so the new records don't reuse them (only needed by some
+        databases, e.g. PostgreSQL).
+
+        :param model: The imported model.
+        """
+        connection = connections[self.using]
+        statements = connection.ops.sequence_reset_sql(no_style(), [model])
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+    def report(self, processed, started_with, started_at):
+        """
+        It writes the number of records processed and the import speed.
+
+        :param processed: The number of records processed.
+        :param started_with: The number of records processed before this
+            run (by an interrupted import).
+        :param started_at: The time this run started.
+        """
+        elapsed = time.perf_counter() - started_at
+        rate = (processed - started_with) / elapsed if elapsed else 0
+        self.stdout.write(
+            f'{processed} records processed ({rate:.0f} records/s).'
+        )
+
+    def rebuild(self):
+        """
+        It rebuilds the data that the signal handlers keep up to date, which
+        the bulk inserts skip.
+        """
+        options = {
+            'database': self.using,
+            'stdout': self.stdout,
+            'stderr': self.stderr
+        }
+        if self.dataset == 'articles':
+            call_command('rebuild_search_index', **options)
+            call_command('rebuild_archive_counts', **options)
+        else:
+            call_command('reconcile_comment_counts', **options)
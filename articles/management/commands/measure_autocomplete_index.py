@@ -0,0 +1,69 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from articles.search.autocomplete import title_index
+
+
+class Command(BaseCommand):
+    """
+    A management command that builds the article title autocomplete index
+    and reports its size and lookup times, to check the memory that every
+    worker process uses for it (see the 'ARTICLE_AUTOCOMPLETE_MAX_TITLES'
+    setting).
+
+    Usage:
+        python manage.py measure_autocomplete_index [--query TEXT ...]
+    """
+    help = 'Measures the memory use and speed of the title autocomplete index.'
+
+    def add_arguments(self, parser):
+        """
+        It adds the command-line arguments of the command.
+
+        :param parser: The command-line arguments parser.
+        """
+        parser.add_argument(
+            '--query',
+            action='append',
+            default=[],
+            help='A query to time (it can be given several times).'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=100,
+            help='Number of times every query is run.'
+        )
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='The database that stores the articles.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        It runs the command.
+
+        :param args: Positional arguments.
+        :param options: The command-line options.
+        """
+        title_index.build(using=options['database'])
+        stats = title_index.get_stats()
+        self.stdout.write(
+            f"Titles: {stats['titles']}\n"
+            f"Trigrams: {stats['trigrams']}\n"
+            f"Memory: {stats['memory_bytes'] / 1024 / 1024:.2f} MiB\n"
+            f"Build time: {stats['build_seconds'] * 1000:.1f} ms"
+        )
+
+        repeat = max(options['repeat'], 1)
+        for query in options['query']:
+            started_at = time.perf_counter()
+            for _ in range(repeat):
+                matches = title_index.search(query)
+            elapsed = (time.perf_counter() - started_at) / repeat
+            self.stdout.write(
+                f'Query {query!r}: {len(matches)} matches in '
+                f'{elapsed * 1000:.3f} ms'
+            )
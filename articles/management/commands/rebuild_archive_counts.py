@@ -0,0 +1,68 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import ExtractMonth, ExtractYear
+from django.utils import timezone
+
+from articles.cache import invalidate_archive_months
+from articles.models import Article, ArticleArchiveMonth
+
+
+class Command(BaseCommand):
+    """
+    A management command that rebuilds the monthly article counters of the
+    archive from the articles table (e.g. after a bulk import, which doesn't
+    update them).
+
+    The articles are counted with a single grouped query, which is run only
+    by this command, never by the archive pages.
+
+    Usage:
+        python manage.py rebuild_archive_counts [--database DATABASE]
+    """
+    help = 'Rebuilds the monthly article counters of the archive.'
+
+    def add_arguments(self, parser):
+        """
+        It adds the command-line arguments of the command.
+
+        :param parser: The command-line arguments parser.
+        """
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='The database that stores the articles.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        It runs the command.
+
+        :param args: Positional arguments.
+        :param options: The command-line options.
+        """
+        using = options['database']
+        tzinfo = timezone.get_default_timezone()
+        months = (
+            Article.objects
+            .using(using)
+            .annotate(
+                year=ExtractYear('date', tzinfo=tzinfo),
+                month=ExtractMonth('date', tzinfo=tzinfo)
+            )
+            .order_by()
+            .values('year', 'month')
+            .annotate(article_count=Count('pk'))
+        )
+
+        archive_months = ArticleArchiveMonth.objects.using(using)
+        with transaction.atomic(using=using):
+            archive_months.all().delete()
+            created = archive_months.bulk_create([
+                ArticleArchiveMonth(**month) for month in months
+            ])
+        invalidate_archive_months()
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Done: {len(created)} months counted.')
+        )
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from articles.search import get_search_backend
+
+
+class Command(BaseCommand):
+    """
+    A management command that rebuilds the article full-text search index
+    from the articles table (e.g. after a bulk import, which doesn't update
+    the index).
+
+    Usage:
+        python manage.py rebuild_search_index [--batch-size N]
+    """
+    help = 'Rebuilds the article full-text search index.'
+
+    def add_arguments(self, parser):
+        """
+        It adds the command-line arguments of the command.
+
+        :param parser: The command-line arguments parser.
+        """
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of articles indexed on each batch.'
+        )
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='The database that stores the articles.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        It runs the command.
+
+        :param args: Positional arguments.
+        :param options: The command-line options.
+        """
+        backend = get_search_backend(options['database'])
+        indexed = backend.rebuild(batch_size=options['batch_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Done: {indexed} articles indexed.')
+        )
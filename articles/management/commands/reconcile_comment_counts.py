@@ -0,0 +1,99 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from articles.cache import bump_article_version
+from articles.models import Article, Comment
+
+
+class Command(BaseCommand):
+    """
+    A management command that fixes the comment counters of the articles
+    that have drifted from the real number of comments (e.g. after a bulk
+    import or a manual database change).
+
+    The articles are checked in batches ordered by id and only the counters
+    that are wrong are updated.
+
+    Usage:
+        python manage.py reconcile_comment_counts [--batch-size N]
+            [--database DATABASE]
+    """
+    help = 'Fixes the comment counters of articles.'
+
+    # Number of comments of the article being updated
+    comment_count = (
+        Comment.objects
+        .filter(article=OuterRef('pk'))
+        .order_by()
+        .values('article')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+
+    def add_arguments(self, parser):
+        """
+        It adds the command-line arguments of the command.
+
+        :param parser: The command-line arguments parser.
+        """
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of articles checked on each batch.'
+        )
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='The database that stores the articles.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        It runs the command, fixing the wrong counters batch by batch.
+
+        :param args: Positional arguments.
+        :param options: The command-line options.
+        """
+        batch_size = options['batch_size']
+        articles = Article.objects.using(options['database'])
+        last_pk = 0
+        checked = 0
+        fixed = 0
+
+        while True:
+            batch_pks = list(
+                articles
+                .filter(pk__gt=last_pk)
+                .order_by('pk')
+                .values_list('pk', flat=True)[:batch_size]
+            )
+            if not batch_pks:
+                break
+
+            drifted_pks = list(
+                articles
+                .filter(pk__in=batch_pks)
+                .annotate(actual_count=Count('comment'))
+                .exclude(comment_count=F('actual_count'))
+                .values_list('pk', flat=True)
+            )
+            if drifted_pks:
+                # The counters are recomputed inside the 'UPDATE' statement,
+                # so comments added meanwhile are not lost.
+                articles.filter(pk__in=drifted_pks).update(
+                    comment_count=Coalesce(Subquery(self.comment_count), 0)
+                )
+                for article_id in drifted_pks:
+                    bump_article_version(article_id)
+
+            last_pk = batch_pks[-1]
+            checked += len(batch_pks)
+            fixed += len(drifted_pks)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Done: {checked} articles checked, {fixed} counters fixed.'
+            )
+        )
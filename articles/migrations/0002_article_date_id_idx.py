@@ -0,0 +1,17 @@
+# Generated by Django 4.1.13 on 2026-10-17 21:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['-date', '-id'], name='article_date_id_idx'),
+        ),
+    ]
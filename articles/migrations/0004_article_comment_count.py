@@ -0,0 +1,44 @@
+# Generated by Django 4.1.13 on 2026-10-17 21:14
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_existing_comments(apps, schema_editor):
+    """
+    It sets the comment counter of the existing articles with a single
+    'UPDATE' statement.
+    """
+    Article = apps.get_model('articles', 'Article')
+    Comment = apps.get_model('articles', 'Comment')
+    comment_count = (
+        Comment.objects
+        .filter(article=OuterRef('pk'))
+        .order_by()
+        .values('article')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    Article.objects.using(schema_editor.connection.alias).update(
+        comment_count=Coalesce(Subquery(comment_count), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0003_article_summary_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(
+            code=count_existing_comments,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
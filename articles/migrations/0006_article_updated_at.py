@@ -0,0 +1,36 @@
+# Generated by Django 4.1.13 on 2026-10-17 21:25
+
+from django.db import migrations, models
+from django.db.models import F
+import django.utils.timezone
+
+
+def set_existing_updated_at(apps, schema_editor):
+    """
+    It sets the modification date of the existing articles to their
+    creation date.
+    """
+    Article = apps.get_model('articles', 'Article')
+    Article.objects.using(schema_editor.connection.alias).update(
+        updated_at=F('date')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0005_comment_created_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(
+            code=set_existing_updated_at,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
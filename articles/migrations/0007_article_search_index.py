@@ -0,0 +1,57 @@
+# Generated by Django 4.1.13 on 2026-10-17 21:31
+
+from django.db import migrations
+
+# Text search configuration of the PostgreSQL index (fixed, as the queries
+# must use the configuration of the index)
+SEARCH_CONFIG = 'english'
+
+
+def create_search_index(apps, schema_editor):
+    """
+    It creates the full-text search index of the articles used by the
+    search backend of the database vendor.
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS articles_article_fts "
+            "USING fts5(title, body, tokenize='porter unicode61')"
+        )
+        schema_editor.execute(
+            "INSERT INTO articles_article_fts (rowid, title, body) "
+            "SELECT id, title, body FROM articles_article"
+        )
+    elif vendor == 'postgresql':
+        config = SEARCH_CONFIG
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS article_search_idx "
+            f"ON articles_article USING GIN (("
+            f"setweight(to_tsvector('{config}', title), 'A') || "
+            f"setweight(to_tsvector('{config}', body), 'B')))"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    """
+    It drops the full-text search index of the articles.
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute('DROP TABLE IF EXISTS articles_article_fts')
+    elif vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS article_search_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0006_article_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=create_search_index,
+            reverse_code=drop_search_index
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.13 on 2026-10-17 21:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0007_article_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['author', '-date', '-id'], name='article_author_date_idx'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 4.1.13 on 2026-10-17 21:32
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+
+def count_existing_articles(apps, schema_editor):
+    """
+    It creates the monthly article counters of the existing articles.
+    """
+    Article = apps.get_model('articles', 'Article')
+    ArticleArchiveMonth = apps.get_model('articles', 'ArticleArchiveMonth')
+    alias = schema_editor.connection.alias
+    months = (
+        Article.objects
+        .using(alias)
+        .annotate(year=ExtractYear('date'), month=ExtractMonth('date'))
+        .order_by()
+        .values('year', 'month')
+        .annotate(article_count=Count('pk'))
+    )
+    ArticleArchiveMonth.objects.using(alias).bulk_create([
+        ArticleArchiveMonth(**month) for month in months
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0008_article_author_date_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleArchiveMonth',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('article_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['-year', '-month'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='articlearchivemonth',
+            constraint=models.UniqueConstraint(fields=('year', 'month'), name='archive_month_unique'),
+        ),
+        migrations.RunPython(
+            code=count_existing_articles,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.conf import settings
-from django.db import models
+from django.db import models, router, transaction
 from django.urls import reverse
+from django.utils.text import Truncator
 
 
 class Article(models.Model):
@@ -11,8 +12,20 @@ class Article(models.Model):
         title: The title of the article.
         body: The body or content of the article.
         date: The article creation date and time.
+        updated_at: The date and time of the last change of the article or
+            its comments.
         author: The user who is the author of the article.
+        excerpt: A short excerpt of the body, shown in the article list.
+        word_count: The number of words in the body.
+        reading_time: The estimated reading time of the body, in minutes.
+        comment_count: The number of comments on the article (kept up to date
+            by the 'Comment' model signals).
     """
+    # Summary fields settings
+    EXCERPT_LENGTH = 280
+    WORDS_PER_MINUTE = 200
+    SUMMARY_FIELDS = ('excerpt', 'word_count', 'reading_time')
+
     title = models.CharField(
         max_length=255
     )
@@ -20,10 +33,51 @@ class Article(models.Model):
     date = models.DateTimeField(
         auto_now_add=True
     )
+    updated_at = models.DateTimeField(
+        auto_now=True
+    )
     author = models.ForeignKey(
         to=settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE
     )
+    excerpt = models.CharField(
+        max_length=EXCERPT_LENGTH,
+        blank=True,
+        editable=False
+    )
+    word_count = models.PositiveIntegerField(
+        default=0,
+        editable=False
+    )
+    reading_time = models.PositiveIntegerField(
+        default=0,
+        editable=False
+    )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False
+    )
+
+    class Meta:
+        """
+        Metadata for the Article model.
+
+        Attributes:
+            indexes: The '(date, id)' index used by the keyset pagination of
+                the article list (newest articles first) and the
+                '(author, date, id)' index used by the keyset pagination of
+                the articles of an author.
+        """
+        indexes = [
+            models.Index(
+                fields=['-date', '-id'],
+                name='article_date_id_idx'
+            ),
+            models.Index(
+                fields=['author', '-date', '-id'],
+                name='article_author_date_idx'
+            )
+        ]
 
     def __str__(self):
         """
@@ -32,6 +86,48 @@ class Article(models.Model):
         """
         return self.title
 
+    def save(self, *args, **kwargs):
+        """
+        It saves the article, updating its summary fields (excerpt, word
+        count and reading time) from the body first.
+
+        When only some fields are saved (via 'update_fields'), the
+        modification date is saved as well, and so are the summary fields if
+        the body is one of them. A full save of an existing article saves
+        every loaded field but the comment counter: the counter of the
+        instance may be stale (comments added or deleted since it was
+        loaded), so it is only changed by the 'Comment' signals.
+
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        """
+        self.update_summary()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None and not self._state.adding \
+                and not kwargs.get('force_insert'):
+            deferred_fields = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'comment_count'
+                and field.attname not in deferred_fields
+            ]
+        elif update_fields is not None:
+            update_fields = {*update_fields, 'updated_at'}
+            if 'body' in update_fields:
+                update_fields.update(self.SUMMARY_FIELDS)
+            kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+
+    def update_summary(self):
+        """
+        It computes the summary fields (excerpt, word count and reading time)
+        from the article body, without saving them to the database.
+        """
+        words = self.body.split()
+        self.word_count = len(words)
+        self.reading_time = -(-self.word_count // self.WORDS_PER_MINUTE)
+        self.excerpt = Truncator(' '.join(words)).chars(self.EXCERPT_LENGTH)
+
     def get_absolute_url(self):
         """
         It returns the absolute URL of the detail page for an Article object.
@@ -49,6 +145,12 @@ class Article(models.Model):
 class Comment(models.Model):
     """
     A model that represents a comment made on a newspaper article.
+
+    Attributes:
+        comment: The comment content.
+        article: The commented article.
+        author: The user who wrote the comment.
+        created_at: The comment creation date and time.
     """
     comment = models.CharField(
         max_length=150
@@ -61,6 +163,26 @@ class Comment(models.Model):
         to=settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE
     )
+    created_at = models.DateTimeField(
+        auto_now_add=True
+    )
+
+    class Meta:
+        """
+        Metadata for the Comment model.
+
+        Attributes:
+            ordering: The default ordering of the comments (newest first).
+            indexes: The '(article, created_at, id)' index used to fetch the
+                comments of an article page by page.
+        """
+        ordering = ['-created_at', '-id']
+        indexes = [
+            models.Index(
+                fields=['article', '-created_at', '-id'],
+                name='comment_article_created_idx'
+            )
+        ]
 
     def __str__(self):
         """
@@ -69,9 +191,72 @@ class Comment(models.Model):
         """
         return self.comment
 
+    def save(self, *args, **kwargs):
+        """
+        It saves the comment inside a transaction, so the update of the
+        article comment counter (done by a 'post_save' signal handler) is
+        committed or rolled back together with the comment.
+
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        """
+        using = kwargs.get('using') or router.db_for_write(
+            model=self.__class__,
+            instance=self
+        )
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+
     def get_absolute_url(self):
         """
         It returns the absolute URL of the Article list.
         :return: The absolute URL for the article list.
         """
         return reverse(viewname='article_list')
+
+
+class ArticleArchiveMonth(models.Model):
+    """
+    A model that stores the number of articles published in a month, used to
+    render the archive navigation without counting the articles of every
+    month on each request.
+
+    The counters are updated by signal handlers when articles are created or
+    deleted (see 'articles.signals') and can be rebuilt from the articles
+    table with the 'rebuild_archive_counts' command. The months are those of
+    the project time zone (the 'TIME_ZONE' setting).
+
+    Attributes:
+        year: The year.
+        month: The month (1 to 12).
+        article_count: The number of articles published in the month.
+    """
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    article_count = models.PositiveIntegerField(
+        default=0
+    )
+
+    class Meta:
+        """
+        Metadata for the ArticleArchiveMonth model.
+
+        Attributes:
+            ordering: The default ordering of the months (newest first).
+            constraints: A single row for every month.
+        """
+        ordering = ['-year', '-month']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['year', 'month'],
+                name='archive_month_unique'
+            )
+        ]
+
+    def __str__(self):
+        """
+        It returns the string representation of an 'ArticleArchiveMonth'
+        object.
+        :return: The year and month.
+        """
+        return f'{self.year}-{self.month:02}'
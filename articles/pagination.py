@@ -0,0 +1,282 @@
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.http import Http404
+
+
+class InvalidCursor(Exception):
+    """
+    Exception raised when a pagination cursor cannot be decoded.
+    """
+
+
+class KeysetPage:
+    """
+    A single page of objects returned by a 'KeysetPaginator'.
+
+    Unlike Django's 'Page' class, it doesn't know the total number of objects
+    or pages, only whether there are neighbouring pages and the opaque
+    cursors needed to reach them.
+
+    Attributes:
+        object_list: The objects included in the page.
+        has_next: True if there is a page after this one.
+        has_previous: True if there is a page before this one.
+        next_cursor: The cursor of the next page (None if there is not).
+        previous_cursor: The cursor of the previous page (None if there is
+            not).
+    """
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        # The cursors point to the first and last objects, so an empty page
+        # (e.g. after its objects were deleted) has no links
+        self.has_next = bool(object_list) and has_next
+        self.has_previous = bool(object_list) and has_previous
+        self.next_cursor = None
+        self.previous_cursor = None
+        if self.has_next:
+            self.next_cursor = paginator.encode_cursor(object_list[-1])
+        if self.has_previous:
+            self.previous_cursor = paginator.encode_cursor(
+                obj=object_list[0],
+                reverse=True
+            )
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_other_pages(self):
+        """
+        It checks if there are more pages besides this one.
+        :return: True if there is a next or a previous page, False otherwise.
+        """
+        return self.has_next or self.has_previous
+
+
+class KeysetPaginator:
+    """
+    A paginator that uses keyset (cursor) pagination instead of
+    LIMIT/OFFSET.
+
+    The queryset is ordered by the given keys (newest first) and every page
+    is fetched with a 'WHERE (key_1, key_2, ...) < cursor' condition, so
+    with a matching index the cost of any page is the same as the cost of the
+    first one and no 'COUNT(*)' query is ever run.
+
+    The cursors are opaque, URL-safe tokens that encode the keys of the
+    first or last object of a page and the paging direction.
+
+    Attributes:
+        queryset: The queryset to paginate.
+        per_page: The maximum number of objects on each page.
+        keys: The model field names that define a unique, descending order.
+    """
+    def __init__(self, queryset, per_page, keys=('date', 'id')):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.keys = tuple(keys)
+        self.fields = [
+            queryset.model._meta.get_field(key) for key in self.keys
+        ]
+
+    def encode_cursor(self, obj, reverse=False):
+        """
+        It builds the opaque cursor that points after (or before) an object.
+
+        :param obj: The object the cursor points to.
+        :param reverse: True if the cursor is used to fetch the previous page.
+        :return: A URL-safe cursor string.
+        """
+        payload = {
+            'k': [field.value_to_string(obj) for field in self.fields],
+            'r': reverse
+        }
+        token = base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(',', ':')).encode()
+        )
+        return token.decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """
+        It decodes a cursor built by the 'encode_cursor' method.
+
+        :param cursor: The cursor string.
+        :return: A tuple with the list of key values and the reverse flag.
+        :raise InvalidCursor: If the cursor is malformed.
+        """
+        try:
+            padding = '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+            raw_values = payload['k']
+            reverse = bool(payload['r'])
+            if len(raw_values) != len(self.fields):
+                raise InvalidCursor('Cursor does not match the keys.')
+            values = [
+                field.to_python(value)
+                for field, value in zip(self.fields, raw_values)
+            ]
+        except (binascii.Error, ValueError, KeyError, TypeError,
+                ValidationError) as error:
+            raise InvalidCursor('Invalid cursor.') from error
+        return values, reverse
+
+    def _seek_filter(self, values, reverse):
+        """
+        It builds the 'WHERE' condition that selects the objects located
+        after (or before) the given key values.
+
+        :param values: The key values of the cursor.
+        :param reverse: True to select the objects before the cursor.
+        :return: A 'Q' object with the seek condition.
+        """
+        lookup = 'gt' if reverse else 'lt'
+        conditions = []
+        for index, key in enumerate(self.keys):
+            equal_keys = {
+                previous_key: values[position]
+                for position, previous_key in enumerate(self.keys[:index])
+            }
+            conditions.append(
+                Q(**equal_keys, **{f'{key}__{lookup}': values[index]})
+            )
+        return reduce(or_, conditions)
+
+    def _following_queryset(self, obj):
+        """
+        It builds the query that checks if there are objects after an
+        object (older ones).
+
+        :param obj: The object.
+        :return: The queryset of the objects after the object.
+        """
+        values = [field.value_from_object(obj) for field in self.fields]
+        return self.queryset.filter(self._seek_filter(values, reverse=False))
+
+    def _page_queryset(self, cursor):
+        """
+        It builds the query of the page that starts at the given cursor.
+
+        :param cursor: A cursor string or None for the first page.
+        :return: A tuple with the sliced queryset (it fetches one object more
+            than the page size, to know if there are more objects), the
+            reverse flag of the cursor and a flag that indicates whether
+            there is a cursor.
+        :raise InvalidCursor: If the cursor is malformed.
+        """
+        descending = [f'-{key}' for key in self.keys]
+        if not cursor:
+            queryset = self.queryset.order_by(*descending)
+            return queryset[:self.per_page + 1], False, False
+
+        values, reverse = self.decode_cursor(cursor)
+        queryset = self.queryset.filter(self._seek_filter(values, reverse))
+        ordering = self.keys if reverse else descending
+        return queryset.order_by(*ordering)[:self.per_page + 1], reverse, True
+
+    def _build_page(self, rows, reverse, has_cursor, has_following=False):
+        """
+        It builds a page from the objects fetched by its query.
+
+        :param rows: The fetched objects.
+        :param reverse: True if the objects were fetched backwards.
+        :param has_cursor: True if the page was requested with a cursor.
+        :param has_following: True if there are objects after the last
+            object of a page fetched backwards.
+        :return: A 'KeysetPage' object.
+        """
+        has_more = len(rows) > self.per_page
+        if reverse:
+            return KeysetPage(
+                object_list=rows[:self.per_page][::-1],
+                paginator=self,
+                has_next=has_following,
+                has_previous=has_more
+            )
+        return KeysetPage(
+            object_list=rows[:self.per_page],
+            paginator=self,
+            has_next=has_more,
+            has_previous=has_cursor
+        )
+
+    def page(self, cursor=None):
+        """
+        It returns the page that starts at the given cursor.
+
+        :param cursor: A cursor string or None for the first page.
+        :return: A 'KeysetPage' object.
+        :raise InvalidCursor: If the cursor is malformed.
+        """
+        queryset, reverse, has_cursor = self._page_queryset(cursor)
+        rows = list(queryset)
+        # The objects after a page fetched backwards aren't fetched with it
+        has_following = bool(rows) and reverse \
+            and self._following_queryset(rows[0]).exists()
+        return self._build_page(rows, reverse, has_cursor, has_following)
+
+    async def apage(self, cursor=None):
+        """
+        The asynchronous version of the 'page' method, which fetches the
+        objects with the async ORM interface.
+
+        :param cursor: A cursor string or None for the first page.
+        :return: A 'KeysetPage' object.
+        :raise InvalidCursor: If the cursor is malformed.
+        """
+        queryset, reverse, has_cursor = self._page_queryset(cursor)
+        rows = [obj async for obj in queryset]
+        has_following = bool(rows) and reverse \
+            and await self._following_queryset(rows[0]).aexists()
+        return self._build_page(rows, reverse, has_cursor, has_following)
+
+
+class KeysetPaginationMixin:
+    """
+    A mixin for Django 'ListView' views that replaces the default
+    page-number pagination with keyset pagination.
+
+    The page cursor is read from the query string and an invalid cursor
+    results in an HTTP 404 response, just like an invalid page number does
+    with the default pagination.
+
+    Attributes:
+        paginate_by: The number of objects on each page.
+        cursor_kwarg: The query string parameter that holds the cursor.
+        keyset_keys: The model fields that define the pagination order.
+    """
+    paginate_by = 12
+    cursor_kwarg = 'cursor'
+    keyset_keys = ('date', 'id')
+
+    def paginate_queryset(self, queryset, page_size):
+        """
+        It paginates the queryset using a 'KeysetPaginator'.
+
+        :param queryset: The queryset to paginate.
+        :param page_size: The number of objects on each page.
+        :return: A tuple with the paginator, the page, the page objects and
+            a flag that indicates whether there are other pages.
+        """
+        paginator = KeysetPaginator(
+            queryset=queryset,
+            per_page=page_size,
+            keys=self.keyset_keys
+        )
+        cursor = self.request.GET.get(self.cursor_kwarg)
+        try:
+            page = paginator.page(cursor)
+        except InvalidCursor:
+            raise Http404('Invalid page cursor.')
+        return paginator, page, page.object_list, page.has_other_pages()
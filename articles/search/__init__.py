@@ -0,0 +1,50 @@
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connections
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+# Default search backend of every database vendor
+DEFAULT_BACKENDS = {
+    'sqlite': 'articles.search.backends.SQLiteSearchBackend',
+    'postgresql': 'articles.search.backends.PostgreSQLSearchBackend',
+}
+
+
+@lru_cache(maxsize=None)
+def get_search_backend(using='default'):
+    """
+    It returns the article search backend of a database.
+
+    The backend class is taken from the 'ARTICLE_SEARCH_BACKEND' setting or,
+    if it is not set, from the database vendor (the base backend, which
+    has no index, for the vendors without a backend). The backends are
+    created once per database and forgotten when the settings they depend
+    on change (see 'clear_search_backends').
+
+    :param using: The database alias.
+    :return: The search backend instance.
+    """
+    backend_path = settings.ARTICLE_SEARCH_BACKEND
+    if not backend_path:
+        vendor = connections[using].vendor
+        backend_path = DEFAULT_BACKENDS.get(
+            vendor,
+            'articles.search.backends.BaseSearchBackend'
+        )
+    return import_string(backend_path)(using=using)
+
+
+@receiver(setting_changed)
+def clear_search_backends(setting, **kwargs):
+    """
+    It forgets the created search backends when the search backend or the
+    databases settings change (e.g. with 'override_settings' in the tests).
+
+    :param setting: The name of the changed setting.
+    :param kwargs: Additional keyword arguments.
+    """
+    if setting in ('ARTICLE_SEARCH_BACKEND', 'DATABASES'):
+        get_search_backend.cache_clear()
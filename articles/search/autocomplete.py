@@ -0,0 +1,471 @@
+import logging
+import math
+import re
+import sys
+import threading
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left
+
+from django.conf import settings
+from django.db import connections
+
+from articles.cache import bump_cache_version, get_cache_version
+from articles.models import Article
+
+# Cache key that stores the version of the title indexes of all the
+# processes (changed to make them rebuild)
+TITLE_INDEX_VERSION_KEY = 'articles:autocomplete:version'
+
+logger = logging.getLogger(__name__)
+
+# Words of a title or a query
+WORD_PATTERN = re.compile(r'\w+')
+
+
+def normalize_title(title):
+    """
+    It normalizes a title (or a query) for matching: case and accents are
+    removed and the words are separated by single spaces.
+
+    :param title: The title.
+    :return: The normalized title.
+    """
+    text = unicodedata.normalize('NFKD', title.casefold())
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return ' '.join(WORD_PATTERN.findall(text))
+
+
+def invalidate_title_indexes():
+    """
+    It makes the title indexes of all the processes rebuild (in the
+    background) before their maximum age, e.g. after a bulk import, which
+    doesn't run the signal handlers that update them.
+    """
+    bump_cache_version(TITLE_INDEX_VERSION_KEY)
+
+
+def get_trigrams(text, partial=False):
+    """
+    It returns the trigrams of a normalized text.
+
+    Like PostgreSQL's 'pg_trgm' extension, every word is padded with two
+    spaces at the start and one at the end, so the first letters of the
+    words weigh more.
+
+    :param text: The normalized text.
+    :param partial: True if the last word may be incomplete (the user is
+        still typing it), so it isn't padded at the end.
+    :return: A set with the trigrams.
+    """
+    words = text.split()
+    trigrams = set()
+    for position, word in enumerate(words):
+        if partial and position == len(words) - 1:
+            padded = f'  {word}'
+        else:
+            padded = f'  {word} '
+        trigrams.update(
+            padded[index:index + 3] for index in range(len(padded) - 2)
+        )
+    return trigrams
+
+
+class TitleIndex:
+    """
+    An in-memory index of the article titles used to autocomplete them.
+
+    Every worker process keeps its own index, which is built from a single
+    streamed query when the worker starts (see the
+    'ARTICLE_AUTOCOMPLETE_PRELOAD_ENABLED' setting) or else the first time
+    it is used, and updated when the articles of the process are saved or
+    deleted (see 'articles.signals'). As the changes made by other
+    processes aren't seen, the index is rebuilt in a background thread when
+    it is older than the 'ARTICLE_AUTOCOMPLETE_MAX_AGE' setting or when the
+    shared version of the indexes changes (see 'invalidate_title_indexes'),
+    while the requests keep using the current one.
+
+    The titles are matched by prefix, using a sorted array of normalized
+    titles (the flat equivalent of a prefix trie, with a fraction of its
+    memory use), and then by trigram similarity, so titles are found even
+    when the query has typos. Only the newest 'ARTICLE_AUTOCOMPLETE_MAX_TITLES'
+    titles are indexed, which bounds the memory use of every process. The
+    trigrams of every title are stored (as integer ids) when it is indexed,
+    so the searches only compare sets of integers. The titles removed from
+    the index are left in the trigram postings (the searches skip them), so
+    a removal doesn't scan the postings; they are dropped by the next
+    rebuild.
+
+    The index is rebuilt outside its lock, by a single thread at a time:
+    the searches keep using the previous index meanwhile, and the titles
+    added or removed during the rebuild are applied again to the new index
+    when it replaces the previous one.
+
+    Attributes:
+        similarity: The minimum fraction of the query trigrams that a title
+            must contain to be a typo-tolerant match.
+        max_candidates: The maximum number of titles compared with the query
+            trigrams on each search.
+    """
+    similarity = 0.3
+    max_candidates = 500
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._condition = threading.Condition(self._lock)
+        self._rebuilding = False
+        self._pending = None
+        self.clear()
+
+    def clear(self):
+        """
+        It empties the index (it is built again the next time it is used).
+        """
+        with self._lock:
+            self._keys = []
+            self._ids = array('q')
+            self._titles = {}
+            self._normalized = {}
+            self._postings = {}
+            self._trigram_ids = {}
+            self._trigrams = {}
+            self.built_at = None
+            self.build_seconds = None
+            self.version = None
+
+    @property
+    def is_built(self):
+        """
+        It checks if the index has been built.
+
+        :return: True if the index is built, False otherwise.
+        """
+        return self.built_at is not None
+
+    def __len__(self):
+        return len(self._titles)
+
+    def build(self, using='default'):
+        """
+        It builds the index from the articles table, replacing its content.
+
+        The titles are streamed with a server-side cursor (where the database
+        supports it), so the articles are never loaded as model instances or
+        all at once. The new index is built without holding the lock and the
+        changes made meanwhile (see 'add' and 'remove') are applied to it
+        once it replaces the current one.
+
+        :param using: The alias of the database that stores the articles.
+        """
+        started_at = time.perf_counter()
+        version = get_cache_version(TITLE_INDEX_VERSION_KEY)
+        with self._lock:
+            self._pending = []
+        try:
+            built = self._build_structures(using)
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+
+        with self._lock:
+            pending, self._pending = self._pending, None
+            (self._keys, self._ids, self._titles, self._normalized,
+             self._postings, self._trigram_ids, self._trigrams) = built
+            self.built_at = time.monotonic()
+            self.build_seconds = time.perf_counter() - started_at
+            self.version = version
+            for article_id, title in pending:
+                if title is None:
+                    self.remove(article_id)
+                else:
+                    self.add(article_id, title)
+
+    def _build_structures(self, using):
+        """
+        It reads the titles and builds the structures of a new index.
+
+        :param using: The alias of the database that stores the articles.
+        :return: A tuple with the sorted keys, their article ids, the titles,
+            the normalized titles, the trigram postings, the trigram ids and
+            the trigram ids of every title.
+        """
+        rows = (
+            Article.objects
+            .using(using)
+            .order_by('-date', '-id')
+            .values_list('id', 'title')
+            [:settings.ARTICLE_AUTOCOMPLETE_MAX_TITLES]
+            .iterator(chunk_size=2000)
+        )
+
+        titles = {}
+        normalized = {}
+        postings = {}
+        trigram_ids = {}
+        trigrams = {}
+        for article_id, title in rows:
+            key = normalize_title(title)
+            titles[article_id] = title
+            normalized[article_id] = key
+            title_trigrams = get_trigrams(key)
+            for trigram in title_trigrams:
+                postings.setdefault(trigram, array('q')).append(article_id)
+            trigrams[article_id] = array('I', sorted(
+                trigram_ids.setdefault(trigram, len(trigram_ids))
+                for trigram in title_trigrams
+            ))
+
+        # Oldest titles first in the postings, like the titles added later
+        for posting in postings.values():
+            posting.reverse()
+        entries = sorted(
+            (key, article_id) for article_id, key in normalized.items()
+        )
+
+        keys = [key for key, article_id in entries]
+        ids = array('q', (article_id for key, article_id in entries))
+        return (
+            keys, ids, titles, normalized, postings, trigram_ids, trigrams
+        )
+
+    def ensure_built(self):
+        """
+        It builds the index if it hasn't been built yet, or starts its
+        rebuild in a background thread if it is older than the
+        'ARTICLE_AUTOCOMPLETE_MAX_AGE' setting or its version is outdated.
+
+        Only one thread rebuilds the index: the other threads keep using the
+        current index, or wait for the first build if there is none yet. A
+        stale index is used until the background rebuild replaces it, so
+        the requests never wait for a rebuild.
+        """
+        version = get_cache_version(TITLE_INDEX_VERSION_KEY)
+        with self._condition:
+            while self._rebuilding and not self.is_built:
+                self._condition.wait()
+            if self.is_built:
+                max_age = settings.ARTICLE_AUTOCOMPLETE_MAX_AGE
+                expired = bool(max_age) \
+                    and time.monotonic() - self.built_at > max_age
+                if self._rebuilding \
+                        or not (expired or version != self.version):
+                    return
+            background = self.is_built
+            self._rebuilding = True
+
+        if background:
+            threading.Thread(
+                target=self._rebuild_in_background,
+                name='title-index-rebuild',
+                daemon=True
+            ).start()
+        else:
+            self._rebuild()
+
+    def _rebuild(self):
+        """
+        It rebuilds the index and lets the waiting threads use it. It must
+        be called by the thread that set the rebuilding flag.
+        """
+        try:
+            self.build()
+        finally:
+            with self._condition:
+                self._rebuilding = False
+                self._condition.notify_all()
+
+    def _rebuild_in_background(self):
+        """
+        It rebuilds the index in a background thread, closing the database
+        connections of the thread afterwards.
+        """
+        try:
+            self._rebuild()
+        except Exception:
+            logger.exception('The title index could not be rebuilt.')
+        finally:
+            connections.close_all()
+
+    def add(self, article_id, title):
+        """
+        It adds an article title to the index (or replaces its indexed
+        title). Nothing is done if the index hasn't been built yet.
+
+        :param article_id: The id of the article.
+        :param title: The title of the article.
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((article_id, title))
+            if not self.is_built:
+                return
+            if self._titles.get(article_id) == title:
+                return
+            self._remove_title(article_id)
+
+            key = normalize_title(title)
+            position = bisect_left(self._keys, key)
+            self._keys.insert(position, key)
+            self._ids.insert(position, article_id)
+            self._titles[article_id] = title
+            self._normalized[article_id] = key
+            title_trigrams = get_trigrams(key)
+            for trigram in title_trigrams:
+                self._postings.setdefault(
+                    trigram,
+                    array('q')
+                ).append(article_id)
+            self._trigrams[article_id] = array('I', sorted(
+                self._trigram_ids.setdefault(trigram, len(self._trigram_ids))
+                for trigram in title_trigrams
+            ))
+
+    def remove(self, article_id):
+        """
+        It removes an article title from the index.
+
+        :param article_id: The id of the article.
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((article_id, None))
+            self._remove_title(article_id)
+
+    def _remove_title(self, article_id):
+        """
+        It removes an article title from the index structures (its trigram
+        postings are left for the next rebuild). It must be called with the
+        lock held.
+
+        :param article_id: The id of the article.
+        """
+        key = self._normalized.pop(article_id, None)
+        if key is None:
+            return
+        del self._titles[article_id]
+        del self._trigrams[article_id]
+
+        position = bisect_left(self._keys, key)
+        while self._ids[position] != article_id:
+            position += 1
+        del self._keys[position]
+        del self._ids[position]
+
+    def search(self, query, limit=10):
+        """
+        It returns the titles that match a query: first the titles that
+        start with the query (alphabetically) and then the most similar
+        titles (newest first on a tie).
+
+        The candidates of the similarity matching are the titles that
+        contain at least one of the rarest query trigrams (any title that
+        can reach the minimum similarity contains one of them), up to
+        'max_candidates' of the newest ones, so the cost of a search doesn't
+        grow with the number of titles.
+
+        :param query: The text typed by the user.
+        :param limit: The maximum number of titles.
+        :return: A list of tuples with the article ids and titles.
+        """
+        key = normalize_title(query)
+        if not key:
+            return []
+
+        with self._lock:
+            matches = []
+            position = bisect_left(self._keys, key)
+            while (
+                len(matches) < limit
+                and position < len(self._keys)
+                and self._keys[position].startswith(key)
+            ):
+                matches.append(self._ids[position])
+                position += 1
+
+            query_trigrams = get_trigrams(key, partial=True)
+            if len(matches) < limit and query_trigrams:
+                needed = math.ceil(self.similarity * len(query_trigrams))
+                query_ids = {
+                    self._trigram_ids[trigram] for trigram in query_trigrams
+                    if trigram in self._trigram_ids
+                }
+                rarest = sorted(
+                    query_trigrams,
+                    key=lambda trigram: len(self._postings.get(trigram, ()))
+                )
+                candidates = set()
+                for trigram in rarest[:len(query_trigrams) - needed + 1]:
+                    posting = self._postings.get(trigram, ())
+                    candidates.update(
+                        posting[-(self.max_candidates - len(candidates)):]
+                    )
+                    if len(candidates) >= self.max_candidates:
+                        break
+                candidates.difference_update(matches)
+
+                scored = []
+                for article_id in candidates:
+                    if article_id not in self._trigrams:
+                        # Removed title, left in the postings
+                        continue
+                    shared = len(
+                        query_ids.intersection(self._trigrams[article_id])
+                    )
+                    if shared >= needed:
+                        scored.append((-shared, -article_id))
+                scored.sort()
+                matches.extend(
+                    -article_id
+                    for shared, article_id in scored[:limit - len(matches)]
+                )
+
+            return [
+                (article_id, self._titles[article_id])
+                for article_id in matches
+            ]
+
+    def get_memory_usage(self):
+        """
+        It estimates the memory used by the index (its containers and the
+        strings they hold).
+
+        :return: The estimated size in bytes.
+        """
+        with self._lock:
+            size = sum(
+                sys.getsizeof(container) for container in (
+                    self._keys, self._ids, self._titles, self._normalized,
+                    self._postings, self._trigram_ids, self._trigrams
+                )
+            )
+            size += sum(sys.getsizeof(key) for key in self._keys)
+            size += sum(sys.getsizeof(title) for title in self._titles.values())
+            size += sum(
+                sys.getsizeof(trigram) + sys.getsizeof(posting)
+                for trigram, posting in self._postings.items()
+            )
+            size += sum(
+                sys.getsizeof(trigrams) for trigrams in self._trigrams.values()
+            )
+            return size
+
+    def get_stats(self):
+        """
+        It returns the size statistics of the index.
+
+        :return: A dictionary with the number of titles and trigrams, the
+            estimated memory use in bytes and the build time in seconds.
+        """
+        with self._lock:
+            return {
+                'titles': len(self._titles),
+                'trigrams': len(self._postings),
+                'memory_bytes': self.get_memory_usage(),
+                'build_seconds': self.build_seconds,
+            }
+
+
+# Title index of the current process
+title_index = TitleIndex()
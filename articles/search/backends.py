@@ -0,0 +1,260 @@
+import re
+
+from django.db import connections
+from django.db.models import Q
+
+from articles.models import Article
+
+# Words of a search query
+WORD_PATTERN = re.compile(r'\w+')
+
+
+class BaseSearchBackend:
+    """
+    The base class of the article full-text search backends.
+
+    A backend keeps a full-text index of the article titles and bodies up
+    to date (the indexer calls 'index_article' and 'remove_article' when an
+    article is saved or deleted) and returns the ids of the articles that
+    match a query, best matches first.
+
+    This base backend has no index: it is used for the database vendors
+    without a backend, and searches the articles that contain all the words
+    of the query (see 'search').
+
+    Attributes:
+        using: The alias of the database that stores the index.
+    """
+    def __init__(self, using='default'):
+        self.using = using
+
+    @property
+    def connection(self):
+        """
+        It returns the database connection of the backend.
+
+        :return: The database connection.
+        """
+        return connections[self.using]
+
+    def index_article(self, article):
+        """
+        It adds an article to the index or updates its indexed content.
+
+        :param article: The article.
+        """
+
+    def remove_article(self, article_id):
+        """
+        It removes an article from the index.
+
+        :param article_id: The id of the article.
+        """
+
+    def rebuild(self, batch_size=1000):
+        """
+        It rebuilds the whole index from the articles table.
+
+        :param batch_size: The number of articles indexed on each batch.
+        :return: The number of articles indexed.
+        """
+        return 0
+
+    def search(self, query, limit, offset=0):
+        """
+        It returns the ids of the articles that match a query, ordered by
+        relevance (best matches first).
+
+        The base backend scans the articles table for the articles whose
+        title or body contains every word of the query (case-insensitively),
+        newest first, as it has no index to rank the matches with.
+
+        :param query: The search query, as typed by the user.
+        :param limit: The maximum number of ids returned.
+        :param offset: The number of matches skipped.
+        :return: A list of article ids.
+        """
+        words = WORD_PATTERN.findall(query)
+        if not words:
+            return []
+        queryset = Article.objects.using(self.using)
+        for word in words:
+            queryset = queryset.filter(
+                Q(title__icontains=word) | Q(body__icontains=word)
+            )
+        return list(
+            queryset
+            .order_by('-date', '-id')
+            .values_list('pk', flat=True)[offset:offset + limit]
+        )
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    """
+    A search backend that uses a SQLite FTS5 virtual table.
+
+    The virtual table (created by the articles migrations) stores a copy of
+    the title and body of every article, using the article id as its rowid.
+    The matches are ranked with the BM25 algorithm, with a higher weight
+    for the words in the title.
+
+    Attributes:
+        table_name: The name of the FTS5 virtual table.
+        title_weight: The BM25 weight of the title column.
+        body_weight: The BM25 weight of the body column.
+    """
+    table_name = 'articles_article_fts'
+    title_weight = 10.0
+    body_weight = 1.0
+
+    def index_article(self, article):
+        """
+        It adds an article to the index or updates its indexed content.
+
+        :param article: The article.
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {self.table_name} WHERE rowid = %s',
+                [article.pk]
+            )
+            cursor.execute(
+                f'INSERT INTO {self.table_name} (rowid, title, body) '
+                f'VALUES (%s, %s, %s)',
+                [article.pk, article.title, article.body]
+            )
+
+    def remove_article(self, article_id):
+        """
+        It removes an article from the index.
+
+        :param article_id: The id of the article.
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {self.table_name} WHERE rowid = %s',
+                [article_id]
+            )
+
+    def rebuild(self, batch_size=1000):
+        """
+        It rebuilds the whole index from the articles table, batch by batch.
+
+        :param batch_size: The number of articles indexed on each batch.
+        :return: The number of articles indexed.
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table_name}')
+
+        indexed = 0
+        last_pk = 0
+        while True:
+            batch = list(
+                Article.objects.using(self.using)
+                .filter(pk__gt=last_pk)
+                .order_by('pk')
+                .values_list('pk', 'title', 'body')[:batch_size]
+            )
+            if not batch:
+                break
+            with self.connection.cursor() as cursor:
+                cursor.executemany(
+                    f'INSERT INTO {self.table_name} (rowid, title, body) '
+                    f'VALUES (%s, %s, %s)',
+                    batch
+                )
+            last_pk = batch[-1][0]
+            indexed += len(batch)
+        return indexed
+
+    def build_match_query(self, query):
+        """
+        It converts a user query into a FTS5 'MATCH' expression.
+
+        Every word is quoted, so the FTS5 query syntax (operators, column
+        filters, etc.) can't be used (or broken) by the users, and all the
+        words must match.
+
+        :param query: The search query, as typed by the user.
+        :return: The 'MATCH' expression, or an empty string if the query has
+            no words.
+        """
+        words = WORD_PATTERN.findall(query)
+        return ' '.join(f'"{word}"' for word in words)
+
+    def search(self, query, limit, offset=0):
+        """
+        It returns the ids of the articles that match a query, ordered by
+        relevance (best matches first).
+
+        :param query: The search query, as typed by the user.
+        :param limit: The maximum number of ids returned.
+        :param offset: The number of matches skipped.
+        :return: A list of article ids.
+        """
+        match_query = self.build_match_query(query)
+        if not match_query:
+            return []
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM {self.table_name} '
+                f'WHERE {self.table_name} MATCH %s '
+                f'ORDER BY bm25({self.table_name}, %s, %s), rowid DESC '
+                f'LIMIT %s OFFSET %s',
+                [
+                    match_query,
+                    self.title_weight,
+                    self.body_weight,
+                    limit,
+                    offset
+                ]
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class PostgreSQLSearchBackend(BaseSearchBackend):
+    """
+    A search backend that uses the PostgreSQL full-text search.
+
+    The articles are matched against the 'search_vector' column, a stored
+    'tsvector' generated from the title and the body (title words weighted
+    above body words) and backed by a GIN index, both created by the
+    articles migrations. PostgreSQL keeps the column and the index up to
+    date by itself, so indexing an article requires no work from the
+    backend, and the matches are ranked from the stored vectors without
+    parsing their text again.
+
+    The matches are ranked with the 'ts_rank_cd' function and the queries
+    are parsed with 'websearch_to_tsquery', so users can type quoted phrases
+    and '-excluded' words.
+
+    Attributes:
+        config: The text search configuration (language) of the queries. It
+            must match the configuration of the 'search_vector' column (see
+            the '0010_article_search_vector' migration), so changing it
+            requires a migration.
+    """
+    config = 'english'
+
+    def search(self, query, limit, offset=0):
+        """
+        It returns the ids of the articles that match a query, ordered by
+        relevance (best matches first).
+
+        :param query: The search query, as typed by the user.
+        :param limit: The maximum number of ids returned.
+        :param offset: The number of matches skipped.
+        :return: A list of article ids.
+        """
+        if not WORD_PATTERN.search(query):
+            return []
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT id FROM articles_article, '
+                'websearch_to_tsquery(%s::regconfig, %s) AS query '
+                'WHERE search_vector @@ query '
+                'ORDER BY ts_rank_cd(search_vector, query) DESC, id DESC '
+                'LIMIT %s OFFSET %s',
+                [self.config, query, limit, offset]
+            )
+            return [row[0] for row in cursor.fetchall()]
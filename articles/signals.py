@@ -0,0 +1,324 @@
+import functools
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_init, post_save, \
+    pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from articles.cache import bump_article_version, \
+    invalidate_archive_months, invalidate_author_article_count
+from articles.feeds import invalidate_article_feeds
+from articles.models import Article, ArticleArchiveMonth, Comment
+from articles.search import get_search_backend
+from articles.search.autocomplete import title_index
+from articles.sitemaps import invalidate_article_sitemap
+
+
+def _add_to_comment_count(article_id, amount):
+    """
+    It adds an amount to the comment counter of an article and sets its
+    modification date (used by the conditional GET validators).
+
+    The update is done with an F-expression, so it is a single atomic
+    'UPDATE' statement and concurrent comments can't overwrite each other's
+    increments. The counter never goes below zero, even if it has drifted
+    (see the 'reconcile_comment_counts' command). The modification date
+    comes from the Python clock, like the one set by 'Article.save', as the
+    database clock may be less precise (one second on SQLite) and two
+    changes in the same second must give different validators.
+
+    :param article_id: The id of the article.
+    :param amount: The amount to add (negative to subtract).
+    """
+    Article.objects.filter(pk=article_id).update(
+        comment_count=Greatest(F('comment_count') + amount, 0),
+        updated_at=timezone.now()
+    )
+
+
+def _on_commit(function, *args, using):
+    """
+    It calls a cache invalidation function once the current transaction of
+    a database is committed (right away if there is none), so concurrent
+    requests can't cache the data of the transaction before it is visible
+    under the new version, and rolled back changes don't invalidate
+    anything.
+
+    :param function: The invalidation function.
+    :param args: The arguments of the function.
+    :param using: The database alias.
+    """
+    transaction.on_commit(functools.partial(function, *args), using=using)
+
+
+def _add_to_archive_month(date, amount):
+    """
+    It adds an amount to the article counter of the month of a date (in the
+    project time zone), creating the counter if it doesn't exist yet.
+
+    :param date: The publication date of an article.
+    :param amount: The amount to add (negative to subtract).
+    """
+    local_date = timezone.localtime(date, timezone.get_default_timezone())
+    month = ArticleArchiveMonth.objects.filter(
+        year=local_date.year,
+        month=local_date.month
+    )
+    updated = month.update(
+        article_count=Greatest(F('article_count') + amount, 0)
+    )
+    if not updated and amount > 0:
+        try:
+            with transaction.atomic():
+                ArticleArchiveMonth.objects.create(
+                    year=local_date.year,
+                    month=local_date.month,
+                    article_count=amount
+                )
+        except IntegrityError:
+            # Created meanwhile by a concurrent request
+            month.update(article_count=F('article_count') + amount)
+    invalidate_archive_months()
+
+
+@receiver(post_init, sender=Comment)
+def remember_comment_article(sender, instance, **kwargs):
+    """
+    It remembers the article of a comment when the comment is loaded, so the
+    counters can be fixed if the comment is moved to another article.
+
+    :param sender: The 'Comment' model.
+    :param instance: The comment being initialized.
+    :param kwargs: Additional keyword arguments.
+    """
+    instance._counted_article_id = instance.article_id
+
+
+@receiver(post_save, sender=Comment)
+def count_saved_comment(sender, instance, created, using, **kwargs):
+    """
+    It updates the comment counter of the article of a saved comment.
+
+    :param sender: The 'Comment' model.
+    :param instance: The saved comment.
+    :param created: True if the comment has just been created.
+    :param using: The database alias.
+    :param kwargs: Additional keyword arguments.
+    """
+    previous_article_id = instance._counted_article_id
+    if created:
+        _add_to_comment_count(instance.article_id, 1)
+    elif previous_article_id != instance.article_id:
+        _add_to_comment_count(previous_article_id, -1)
+        _add_to_comment_count(instance.article_id, 1)
+        _on_commit(bump_article_version, previous_article_id, using=using)
+    _on_commit(bump_article_version, instance.article_id, using=using)
+    instance._counted_article_id = instance.article_id
+
+
+@receiver(pre_delete, sender=Article)
+def mark_deleted_article(sender, instance, origin=None, **kwargs):
+    """
+    It records the id of an article about to be deleted on the origin of
+    the deletion (the deleted instance or queryset), so the comments
+    deleted in cascade don't update its counter (see
+    'count_deleted_comment').
+
+    The pre-delete signals of all the collected objects are sent before
+    anything is deleted, so the ids are recorded before the comments are
+    deleted, and they are dropped with the origin when the deletion ends.
+
+    :param sender: The 'Article' model.
+    :param instance: The article about to be deleted.
+    :param origin: The instance or queryset whose deletion was requested.
+    :param kwargs: Additional keyword arguments.
+    """
+    if origin is not None:
+        origin.__dict__.setdefault('_deleted_article_ids', set()).add(
+            instance.pk
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def count_deleted_comment(sender, instance, using, origin=None, **kwargs):
+    """
+    It updates the comment counter of the article of a deleted comment.
+
+    Comments deleted in cascade with their article are skipped, as the
+    article (with its counter and its cached fragments) is deleted too: one
+    'UPDATE' and one cache version change per comment would be wasted.
+
+    :param sender: The 'Comment' model.
+    :param instance: The deleted comment.
+    :param using: The database alias.
+    :param origin: The instance or queryset whose deletion was requested.
+    :param kwargs: Additional keyword arguments.
+    """
+    deleted_article_ids = getattr(origin, '_deleted_article_ids', ())
+    if instance.article_id in deleted_article_ids:
+        return
+    _add_to_comment_count(instance.article_id, -1)
+    _on_commit(bump_article_version, instance.article_id, using=using)
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def invalidate_article_fragments(sender, instance, using, **kwargs):
+    """
+    It invalidates the cached template fragments of a saved or deleted
+    article.
+
+    :param sender: The 'Article' model.
+    :param instance: The saved or deleted article.
+    :param using: The database alias.
+    :param kwargs: Additional keyword arguments.
+    """
+    _on_commit(bump_article_version, instance.pk, using=using)
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def invalidate_author_count(sender, instance, using, **kwargs):
+    """
+    It invalidates the cached number of articles of the author of a saved or
+    deleted article.
+
+    :param sender: The 'Article' model.
+    :param instance: The saved or deleted article.
+    :param using: The database alias.
+    :param kwargs: Additional keyword arguments.
+    """
+    _on_commit(
+        invalidate_author_article_count,
+        instance.author_id,
+        using=using
+    )
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def invalidate_feeds(sender, instance, **kwargs):
+    """
+    It invalidates the cached feeds that include a saved or deleted article.
+
+    :param sender: The 'Article' model.
+    :param instance: The saved or deleted article.
+    :param kwargs: Additional keyword arguments.
+    """
+    invalidate_article_feeds(instance)
+
+
+@receiver(post_save, sender=Article)
+def invalidate_saved_article_sitemap(sender, instance, created, **kwargs):
+    """
+    It invalidates the cached sitemap of a saved article.
+
+    :param sender: The 'Article' model.
+    :param instance: The saved article.
+    :param created: True if the article has been created.
+    :param kwargs: Additional keyword arguments.
+    """
+    invalidate_article_sitemap(instance, created=created)
+
+
+@receiver(post_delete, sender=Article)
+def invalidate_deleted_article_sitemap(sender, instance, **kwargs):
+    """
+    It invalidates the cached sitemap of a deleted article.
+
+    :param sender: The 'Article' model.
+    :param instance: The deleted article.
+    :param kwargs: Additional keyword arguments.
+    """
+    invalidate_article_sitemap(instance)
+
+
+@receiver(post_save, sender=Article)
+def count_created_article(sender, instance, created, **kwargs):
+    """
+    It adds a new article to the article counter of its month.
+
+    :param sender: The 'Article' model.
+    :param instance: The saved article.
+    :param created: True if the article has been created.
+    :param kwargs: Additional keyword arguments.
+    """
+    if created:
+        _add_to_archive_month(instance.date, 1)
+
+
+@receiver(post_delete, sender=Article)
+def count_deleted_article(sender, instance, **kwargs):
+    """
+    It subtracts a deleted article from the article counter of its month.
+
+    :param sender: The 'Article' model.
+    :param instance: The deleted article.
+    :param kwargs: Additional keyword arguments.
+    """
+    _add_to_archive_month(instance.date, -1)
+
+
+@receiver(post_save, sender=Article)
+def index_saved_article(sender, instance, using, update_fields=None,
+                        **kwargs):
+    """
+    It adds a saved article to the full-text search index (or updates its
+    indexed content). Saves that change neither the title nor the body are
+    skipped.
+
+    :param sender: The 'Article' model.
+    :param instance: The saved article.
+    :param using: The database alias.
+    :param update_fields: The updated fields (None if all of them).
+    :param kwargs: Additional keyword arguments.
+    """
+    if update_fields is not None \
+            and not {'title', 'body'}.intersection(update_fields):
+        return
+    get_search_backend(using).index_article(instance)
+
+
+@receiver(post_delete, sender=Article)
+def unindex_deleted_article(sender, instance, using, **kwargs):
+    """
+    It removes a deleted article from the full-text search index.
+
+    :param sender: The 'Article' model.
+    :param instance: The deleted article.
+    :param using: The database alias.
+    :param kwargs: Additional keyword arguments.
+    """
+    get_search_backend(using).remove_article(instance.pk)
+
+
+@receiver(post_save, sender=Article)
+def update_title_index(sender, instance, update_fields=None, **kwargs):
+    """
+    It adds the title of a saved article to the autocomplete index of the
+    current process (saves that don't change the title are skipped).
+
+    :param sender: The 'Article' model.
+    :param instance: The saved article.
+    :param update_fields: The updated fields (None if all of them).
+    :param kwargs: Additional keyword arguments.
+    """
+    if update_fields is not None and 'title' not in update_fields:
+        return
+    title_index.add(instance.pk, instance.title)
+
+
+@receiver(post_delete, sender=Article)
+def remove_from_title_index(sender, instance, **kwargs):
+    """
+    It removes the title of a deleted article from the autocomplete index of
+    the current process.
+
+    :param sender: The 'Article' model.
+    :param instance: The deleted article.
+    :param kwargs: Additional keyword arguments.
+    """
+    title_index.remove(instance.pk)
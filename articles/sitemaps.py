@@ -0,0 +1,138 @@
+from django.conf import settings
+from django.contrib.sitemaps import Sitemap
+from django.core.cache import cache
+from django.db.models import Max
+
+from articles.cache import bump_cache_version, get_cache_version
+from articles.models import Article
+
+# Cache key that stores the version of the sitemap index
+SITEMAP_INDEX_VERSION_KEY = 'articles:sitemap:index:version'
+
+
+def get_sitemap_shard(article_id):
+    """
+    It returns the sitemap shard that contains an article.
+
+    The articles are split into shards of 'ARTICLE_SITEMAP_SHARD_SIZE'
+    consecutive ids, so an article never changes of shard.
+
+    :param article_id: The id of the article.
+    :return: The shard number (starting at 0).
+    """
+    return (article_id - 1) // settings.ARTICLE_SITEMAP_SHARD_SIZE
+
+
+def get_sitemap_shard_range(shard):
+    """
+    It returns the first and last article ids of a sitemap shard.
+
+    :param shard: The shard number.
+    :return: A tuple with the first and last ids (both included).
+    """
+    size = settings.ARTICLE_SITEMAP_SHARD_SIZE
+    return shard * size + 1, (shard + 1) * size
+
+
+def get_sitemap_shard_count():
+    """
+    It returns the number of sitemap shards (the shard of the highest
+    article id plus one).
+
+    The number is cached until an article is created (see
+    'invalidate_article_sitemap').
+
+    :return: The number of shards.
+    """
+    version = get_cache_version(SITEMAP_INDEX_VERSION_KEY)
+    key = f'articles:sitemap:shards:{version}'
+    shard_count = cache.get(key)
+    if shard_count is None:
+        max_id = Article.objects.aggregate(max_id=Max('id'))['max_id']
+        shard_count = get_sitemap_shard(max_id) + 1 if max_id else 0
+        cache.set(
+            key,
+            shard_count,
+            timeout=settings.ARTICLE_SITEMAP_CACHE_TIMEOUT
+        )
+    return shard_count
+
+
+def sitemap_shard_version_key(shard):
+    """
+    It returns the cache key that stores the version of a sitemap shard.
+
+    :param shard: The shard number.
+    :return: The cache key.
+    """
+    return f'articles:sitemap:shard:{shard}:version'
+
+
+def invalidate_article_sitemap(article, created=False):
+    """
+    It invalidates the cached sitemap shard of a saved or deleted article
+    (and the sitemap index if the article is new, as it may need a new
+    shard).
+
+    :param article: The saved or deleted article.
+    :param created: True if the article has been created.
+    """
+    shard = get_sitemap_shard(article.pk)
+    bump_cache_version(sitemap_shard_version_key(shard))
+    if created:
+        bump_cache_version(SITEMAP_INDEX_VERSION_KEY)
+
+
+def invalidate_sitemaps(article_ids=None):
+    """
+    It invalidates the cached sitemap index and the sitemap shards of some
+    articles (all the shards if the articles aren't known), e.g. after a
+    bulk import, which doesn't run the signal handlers.
+
+    :param article_ids: The ids of the articles, or None.
+    """
+    bump_cache_version(SITEMAP_INDEX_VERSION_KEY)
+    if article_ids is None:
+        shards = range(get_sitemap_shard_count())
+    else:
+        shards = {get_sitemap_shard(article_id) for article_id in article_ids}
+    for shard in shards:
+        bump_cache_version(sitemap_shard_version_key(shard))
+
+
+class ArticleShardSitemap(Sitemap):
+    """
+    The sitemap of the articles of a shard (a range of article ids).
+
+    Attributes:
+        shard: The shard number.
+        limit: The maximum number of URLs of a sitemap page (the shard size,
+            so every shard is a single page).
+    """
+
+    def __init__(self, shard):
+        self.shard = shard
+        self.limit = settings.ARTICLE_SITEMAP_SHARD_SIZE
+
+    def items(self):
+        """
+        It returns the articles of the shard, loading only the columns used
+        by the sitemap.
+
+        :return: The articles queryset.
+        """
+        return (
+            Article.objects
+            .filter(pk__range=get_sitemap_shard_range(self.shard))
+            .order_by('pk')
+            .only('id', 'updated_at')
+        )
+
+    def lastmod(self, item):
+        """
+        It returns the last modification date of an article.
+
+        :param item: The article.
+        :return: The article modification date.
+        """
+        return item.updated_at
@@ -0,0 +1,320 @@
+import datetime
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from articles.models import Article, ArticleArchiveMonth
+from articles.tests.utils import TestUtils
+
+
+class ArticleArchiveTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the article
+    archive views and the monthly article counters.
+
+    These tests ensure that the year, month and day pages show the articles
+    published in their period and that the counters used by the archive
+    navigation follow the article changes.
+    """
+    # URLs
+    ARTICLE_ARCHIVE_URL = reverse('article_archive')
+
+    # Utility methods
+    utils = TestUtils()
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'ArticleArchiveTestCase' class, this method is run and set up the
+        test data that all the tests will use.
+
+        This method creates a test user and test articles published in
+        different months, and counts them with the 'rebuild_archive_counts'
+        command (the publication dates are changed with an 'UPDATE'
+        statement, which doesn't update the counters).
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test user
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+        # Test articles
+        cls.march_first = cls.create_article('March 1', 2023, 3, 1)
+        cls.march_second = cls.create_article('March 2', 2023, 3, 2)
+        cls.april = cls.create_article('April', 2023, 4, 15)
+        cls.last_year = cls.create_article('Last year', 2022, 12, 31)
+
+        call_command('rebuild_archive_counts', stdout=StringIO())
+
+    @classmethod
+    def create_article(cls, title, year, month, day):
+        """
+        It creates a test article published on a date.
+
+        :param title: The title of the article.
+        :param year: The publication year.
+        :param month: The publication month.
+        :param day: The publication day.
+        :return: The test article.
+        """
+        article = Article.objects.create(
+            title=title,
+            body='Test Body',
+            author=cls.user
+        )
+        article.date = timezone.make_aware(
+            datetime.datetime(year, month, day, 12)
+        )
+        Article.objects.filter(pk=article.pk).update(date=article.date)
+        return article
+
+    def setUp(self):
+        """
+        It logs in with the test user and empties the cache (which stores
+        the monthly counters) before every test.
+        """
+        cache.clear()
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+
+    def get_archive(self, viewname, **kwargs):
+        """
+        It sends a GET request to an archive page.
+
+        :param viewname: The name of the archive view.
+        :param kwargs: The date in the URL.
+        :return: The HTTP response.
+        """
+        return self.client.get(
+            path=reverse(
+                viewname=viewname,
+                kwargs=kwargs
+            )
+        )
+
+    def test_archive_user_not_authenticated(self):
+        """
+        Checks that non-authenticated users are redirected to the login page.
+        """
+        self.client.logout()
+
+        # HTTP Response
+        response = self.client.get(
+            path=self.ARTICLE_ARCHIVE_URL,
+            follow=True
+        )
+
+        self.utils.check_login_redirect(
+            response=response,
+            target_url=self.ARTICLE_ARCHIVE_URL
+        )
+
+    def test_archive_navigation(self):
+        """
+        Checks that the archive navigation shows the years and months that
+        have articles with their number of articles.
+        """
+        # HTTP Response
+        response = self.client.get(path=self.ARTICLE_ARCHIVE_URL)
+
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
+        self.assertTemplateUsed(
+            response=response,
+            template_name='articles/article_archive_index.html'
+        )
+        self.assertEqual(
+            first=response.context['archive_years'],
+            second=[
+                {
+                    'year': 2023,
+                    'article_count': 3,
+                    'months': [
+                        {
+                            'date': datetime.date(2023, 4, 1),
+                            'article_count': 1
+                        },
+                        {
+                            'date': datetime.date(2023, 3, 1),
+                            'article_count': 2
+                        },
+                    ]
+                },
+                {
+                    'year': 2022,
+                    'article_count': 1,
+                    'months': [
+                        {
+                            'date': datetime.date(2022, 12, 1),
+                            'article_count': 1
+                        },
+                    ]
+                },
+            ]
+        )
+        self.assertContains(
+            response=response,
+            text='March'
+        )
+
+    def test_archive_periods(self):
+        """
+        Checks that the year, month and day pages show the articles
+        published in their period, newest first.
+        """
+        # Year page
+        response = self.get_archive('article_year_archive', year=2023)
+        self.assertTemplateUsed(
+            response=response,
+            template_name='articles/article_archive.html'
+        )
+        self.assertEqual(
+            first=list(response.context['article_list']),
+            second=[self.april, self.march_second, self.march_first]
+        )
+
+        # Month page
+        response = self.get_archive(
+            'article_month_archive',
+            year=2023,
+            month=3
+        )
+        self.assertEqual(
+            first=list(response.context['article_list']),
+            second=[self.march_second, self.march_first]
+        )
+        self.assertContains(
+            response=response,
+            text='Archive: March 2023'
+        )
+
+        # Day page
+        response = self.get_archive(
+            'article_day_archive',
+            year=2022,
+            month=12,
+            day=31
+        )
+        self.assertEqual(
+            first=list(response.context['article_list']),
+            second=[self.last_year]
+        )
+
+    def test_archive_invalid_dates(self):
+        """
+        Checks that invalid dates return an HTTP 404 (Not Found) status code.
+        """
+        responses = [
+            self.get_archive('article_year_archive', year=0),
+            self.get_archive('article_month_archive', year=2023, month=13),
+            self.get_archive(
+                'article_day_archive',
+                year=2023,
+                month=2,
+                day=30
+            ),
+        ]
+
+        for response in responses:
+            self.assertEqual(
+                first=response.status_code,
+                second=404
+            )
+
+    def test_archive_query_count(self):
+        """
+        Checks that the archive navigation is rendered without counting the
+        articles.
+
+        The expected queries are the session and user lookups of the
+        authenticated user, the articles query and, only the first time,
+        the monthly counters query.
+        """
+        with self.assertNumQueries(4):
+            self.get_archive('article_year_archive', year=2023)
+
+        with self.assertNumQueries(3):
+            self.get_archive('article_year_archive', year=2023)
+
+    def test_archive_counters_follow_article_changes(self):
+        """
+        Checks that the monthly counters are updated when articles are
+        created or deleted.
+        """
+        now = timezone.localtime()
+        self.client.get(path=self.ARTICLE_ARCHIVE_URL)
+
+        # New article
+        article = Article.objects.create(
+            title='New Article',
+            body='Test Body',
+            author=self.user
+        )
+        month = ArticleArchiveMonth.objects.get(
+            year=now.year,
+            month=now.month
+        )
+        self.assertEqual(
+            first=month.article_count,
+            second=1
+        )
+        response = self.client.get(path=self.ARTICLE_ARCHIVE_URL)
+        self.assertEqual(
+            first=response.context['archive_years'][0]['year'],
+            second=now.year
+        )
+
+        # Deleted articles
+        article.delete()
+        self.march_first.delete()
+        self.assertEqual(
+            first=ArticleArchiveMonth.objects.get(
+                year=now.year,
+                month=now.month
+            ).article_count,
+            second=0
+        )
+        self.assertEqual(
+            first=ArticleArchiveMonth.objects.get(
+                year=2023,
+                month=3
+            ).article_count,
+            second=1
+        )
+
+    def test_rebuild_archive_counts_command(self):
+        """
+        Checks that the 'rebuild_archive_counts' command fixes the counters.
+        """
+        ArticleArchiveMonth.objects.update(article_count=10)
+
+        output = StringIO()
+        call_command('rebuild_archive_counts', stdout=output)
+
+        self.assertEqual(
+            first=dict(
+                ArticleArchiveMonth.objects
+                .values_list('month', 'article_count')
+            ),
+            second={3: 2, 4: 1, 12: 1}
+        )
+        self.assertIn(
+            member='3 months counted',
+            container=output.getvalue()
+        )
@@ -0,0 +1,251 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from articles.async_views import AsyncArticleListView
+from articles.models import Article, Comment
+from articles.tests.utils import TestUtils
+
+
+class AsyncArticleViewsTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the
+    'AsyncArticleListView' and 'AsyncArticleDetailView' views.
+
+    These tests ensure that the async views render the same pages as the
+    synchronous ones, with the user loaded before the handlers run.
+    """
+    # Number of articles on each page
+    PAGE_SIZE = AsyncArticleListView.paginate_by
+
+    # URLs
+    ARTICLE_LIST_URL = reverse('article_list_async')
+
+    # Utility methods
+    utils = TestUtils()
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'AsyncArticleViewsTestCase' class, this method is run and set up the
+        test data that all the tests will use.
+
+        This method creates a test user, more articles than fit in a page
+        and a few comments of the newest article.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test user
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+        # Test articles
+        Article.objects.bulk_create([
+            Article(
+                title=f'Test Article {number}',
+                body=f'Test Body {number}',
+                author=cls.user
+            )
+            for number in range(cls.PAGE_SIZE + 1)
+        ])
+        cls.ordered_articles = list(Article.objects.order_by('-date', '-id'))
+        cls.article = cls.ordered_articles[0]
+
+        # Test comments
+        for number in range(3):
+            Comment.objects.create(
+                article=cls.article,
+                author=cls.user,
+                comment=f'Test Comment {number}'
+            )
+
+        cls.ARTICLE_DETAIL_URL = reverse(
+            viewname='article_detail_async',
+            kwargs={
+                'pk': cls.article.pk
+            }
+        )
+
+    def setUp(self):
+        """
+        It logs in with the test user and empties the cache (which stores
+        the template fragments) before every test.
+        """
+        cache.clear()
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+
+    def test_async_views_user_not_authenticated(self):
+        """
+        Checks that non-authenticated users are redirected to the login page.
+        """
+        self.client.logout()
+
+        for url in (self.ARTICLE_LIST_URL, self.ARTICLE_DETAIL_URL):
+            with self.subTest(url=url):
+                # HTTP Response
+                response = self.client.get(path=url, follow=True)
+
+                self.utils.check_login_redirect(
+                    response=response,
+                    target_url=url
+                )
+
+    def test_async_article_list_pages(self):
+        """
+        Checks that the articles are shown newest first and page by page,
+        and that an invalid cursor returns an HTTP 404 (Not Found) status
+        code.
+        """
+        # First page
+        response = self.client.get(path=self.ARTICLE_LIST_URL)
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
+        self.assertTemplateUsed(
+            response=response,
+            template_name='articles/article_list.html'
+        )
+        self.assertEqual(
+            first=list(response.context['article_list']),
+            second=self.ordered_articles[:self.PAGE_SIZE]
+        )
+        self.assertContains(
+            response=response,
+            text=self.article.title
+        )
+
+        # Second page
+        response = self.client.get(
+            path=self.ARTICLE_LIST_URL,
+            data={'cursor': response.context['page_obj'].next_cursor}
+        )
+        self.assertEqual(
+            first=list(response.context['article_list']),
+            second=self.ordered_articles[self.PAGE_SIZE:]
+        )
+
+        # Invalid cursor
+        response = self.client.get(
+            path=self.ARTICLE_LIST_URL,
+            data={'cursor': 'invalid'}
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=404
+        )
+
+    def test_async_article_detail(self):
+        """
+        Checks that the article details, its comments, the comment form and
+        the owner buttons are shown.
+        """
+        # HTTP Response
+        response = self.client.get(path=self.ARTICLE_DETAIL_URL)
+
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
+        self.assertTemplateUsed(
+            response=response,
+            template_name='articles/article_detail.html'
+        )
+        self.assertTrue(response.context['article'].is_owner)
+        self.assertContains(
+            response=response,
+            text=self.article.body
+        )
+        self.assertContains(
+            response=response,
+            text='Test Comment 2'
+        )
+        self.assertContains(
+            response=response,
+            text=reverse('article_edit', kwargs={'pk': self.article.pk})
+        )
+
+    def test_async_article_detail_not_found(self):
+        """
+        Checks that an unknown article and an invalid comments cursor return
+        an HTTP 404 (Not Found) status code.
+        """
+        unknown_url = reverse(
+            viewname='article_detail_async',
+            kwargs={
+                'pk': self.article.pk + 1000
+            }
+        )
+        response = self.client.get(path=unknown_url)
+        self.assertEqual(
+            first=response.status_code,
+            second=404
+        )
+
+        response = self.client.get(
+            path=self.ARTICLE_DETAIL_URL,
+            data={'comments': 'invalid'}
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=404
+        )
+
+    def test_async_article_detail_cached_comments(self):
+        """
+        Checks that the comments aren't fetched again while their template
+        fragment is cached.
+
+        The expected queries are the session and user lookups of the
+        authenticated user, the article query and the comments query (only
+        the first time).
+        """
+        with self.assertNumQueries(4):
+            self.client.get(path=self.ARTICLE_DETAIL_URL)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(path=self.ARTICLE_DETAIL_URL)
+        self.assertContains(
+            response=response,
+            text='Test Comment 2'
+        )
+
+    def test_async_article_detail_post_comment(self):
+        """
+        Checks that a comment posted to the async view is saved and that the
+        user is redirected to the article details page.
+        """
+        # HTTP Response
+        response = self.client.post(
+            path=self.ARTICLE_DETAIL_URL,
+            data={'comment': 'New Comment'}
+        )
+
+        self.assertRedirects(
+            response=response,
+            expected_url=reverse(
+                viewname='article_detail',
+                kwargs={
+                    'pk': self.article.pk
+                }
+            ),
+            status_code=302,
+            target_status_code=200
+        )
+        self.assertTrue(
+            Comment.objects.filter(
+                article=self.article,
+                author=self.user,
+                comment='New Comment'
+            ).exists()
+        )
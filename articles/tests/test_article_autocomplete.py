@@ -0,0 +1,333 @@
+import threading
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from articles.models import Article
+from articles.search.autocomplete import title_index
+from articles.tests.utils import TestUtils
+from newspaper.preload import preload_title_index
+
+
+class ArticleAutocompleteTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the
+    'ArticleAutocompleteView' view and the in-memory title index.
+
+    These tests ensure that titles are found by prefix and with typos, and
+    that the index follows the article changes.
+    """
+    # URLs
+    ARTICLE_AUTOCOMPLETE_URL = reverse('article_autocomplete')
+
+    # Utility methods
+    utils = TestUtils()
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'ArticleAutocompleteTestCase' class, this method is run and set up
+        the test data that all the tests will use.
+
+        This method creates a test user and several test articles.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test user
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+        # Test articles
+        cls.harbour = Article.objects.create(
+            title='Harbour expansion approved',
+            body='Test Body',
+            author=cls.user
+        )
+        cls.budget = Article.objects.create(
+            title='Budget for the new harbour',
+            body='Test Body',
+            author=cls.user
+        )
+        cls.football = Article.objects.create(
+            title='Football results',
+            body='Test Body',
+            author=cls.user
+        )
+
+    def setUp(self):
+        """
+        It logs in with the test user and empties the title index (which is
+        kept by the process between tests) before every test.
+        """
+        title_index.clear()
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+
+    def autocomplete(self, query):
+        """
+        It sends an autocomplete request and returns the matching titles.
+
+        :param query: The typed text.
+        :return: A list with the matching titles.
+        """
+        response = self.client.get(
+            path=self.ARTICLE_AUTOCOMPLETE_URL,
+            data={'q': query}
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
+        return [result['title'] for result in response.json()['results']]
+
+    def test_autocomplete_user_not_authenticated(self):
+        """
+        Checks that non-authenticated users are redirected to the login page.
+        """
+        self.client.logout()
+
+        # HTTP Response
+        response = self.client.get(
+            path=self.ARTICLE_AUTOCOMPLETE_URL,
+            follow=True
+        )
+
+        self.utils.check_login_redirect(
+            response=response,
+            target_url=self.ARTICLE_AUTOCOMPLETE_URL
+        )
+
+    def test_autocomplete_prefix_and_typos(self):
+        """
+        Checks that the titles that start with the query are returned first,
+        followed by the similar titles, and that typos are tolerated.
+        """
+        self.assertEqual(
+            first=self.autocomplete('harb'),
+            second=[self.harbour.title, self.budget.title]
+        )
+        self.assertEqual(
+            first=self.autocomplete('Fotball resul'),
+            second=[self.football.title]
+        )
+        self.assertEqual(
+            first=self.autocomplete(''),
+            second=[]
+        )
+
+    def test_autocomplete_result_urls(self):
+        """
+        Checks that the results include the URL of the article detail page.
+        """
+        response = self.client.get(
+            path=self.ARTICLE_AUTOCOMPLETE_URL,
+            data={'q': 'football'}
+        )
+
+        self.assertEqual(
+            first=response.json()['results'],
+            second=[{
+                'id': self.football.pk,
+                'title': self.football.title,
+                'url': reverse(
+                    viewname='article_detail',
+                    kwargs={
+                        'pk': self.football.pk
+                    }
+                )
+            }]
+        )
+
+    def test_autocomplete_without_queries(self):
+        """
+        Checks that, once the index is built, the titles are returned
+        without querying the database.
+        """
+        self.autocomplete('harbour')
+
+        with self.assertNumQueries(2):
+            # Session and user queries only
+            self.autocomplete('harbour')
+
+    def test_index_follows_article_changes(self):
+        """
+        Checks that new, updated and deleted articles are updated in the
+        index.
+        """
+        self.autocomplete('harbour')
+
+        # New article
+        article = Article.objects.create(
+            title='Basketball league',
+            body='Test Body',
+            author=self.user
+        )
+        self.assertEqual(
+            first=self.autocomplete('basket'),
+            second=[article.title]
+        )
+
+        # Updated article
+        article.title = 'Tennis tournament'
+        article.save()
+        self.assertEqual(
+            first=self.autocomplete('basket'),
+            second=[]
+        )
+        self.assertEqual(
+            first=self.autocomplete('tennis'),
+            second=[article.title]
+        )
+
+        # Deleted article
+        article.delete()
+        self.assertEqual(
+            first=self.autocomplete('tennis'),
+            second=[]
+        )
+
+    def test_index_rebuilt_without_blocking(self):
+        """
+        Checks that the index is rebuilt without blocking the other threads,
+        which keep using the current index, and that the titles added or
+        removed during the rebuild are kept in the new index.
+        """
+        title_index.build()
+        build_structures = title_index._build_structures
+
+        def build_with_changes(using):
+            def change_index():
+                title_index.add(1000, 'Concurrent title')
+                title_index.remove(self.football.pk)
+                results.extend(title_index.search('harbour'))
+
+            results = []
+            thread = threading.Thread(target=change_index)
+            thread.start()
+            thread.join(timeout=5)
+            self.assertFalse(thread.is_alive())
+            self.assertEqual(
+                first=len(results),
+                second=2
+            )
+            return build_structures(using)
+
+        with mock.patch.object(
+            title_index,
+            '_build_structures',
+            side_effect=build_with_changes
+        ):
+            title_index.build()
+
+        self.assertEqual(
+            first=title_index.search('concurrent'),
+            second=[(1000, 'Concurrent title')]
+        )
+        self.assertEqual(
+            first=title_index.search('football'),
+            second=[]
+        )
+
+    def test_stale_index_rebuilt_in_background(self):
+        """
+        Checks that a stale index is rebuilt by a background thread, while
+        the request is served with the current index, and that only one
+        rebuild is started.
+        """
+        title_index.build()
+        Article.objects.create(
+            title='Harbour closed for repairs',
+            body='Test Body',
+            author=self.user
+        )
+        title_index.remove(self.harbour.pk)
+
+        with mock.patch(
+            'articles.search.autocomplete.threading.Thread'
+        ) as thread_class, override_settings(ARTICLE_AUTOCOMPLETE_MAX_AGE=-1):
+            self.assertEqual(
+                first=self.autocomplete('harbour'),
+                second=['Harbour closed for repairs', self.budget.title]
+            )
+            self.autocomplete('harbour')
+
+        thread_class.assert_called_once_with(
+            target=title_index._rebuild_in_background,
+            name='title-index-rebuild',
+            daemon=True
+        )
+        thread_class.return_value.start.assert_called_once_with()
+
+        # The background thread rebuilds the index from the database
+        with mock.patch(
+            'articles.search.autocomplete.connections.close_all'
+        ) as close_all:
+            title_index._rebuild_in_background()
+        close_all.assert_called_once_with()
+        self.assertIn(
+            member=self.harbour.title,
+            container=self.autocomplete('harbour')
+        )
+
+    def test_index_preloaded(self):
+        """
+        Checks that the worker start hook builds the index, so the first
+        autocomplete request doesn't query the articles table.
+        """
+        with mock.patch('newspaper.preload.connections.close_all'):
+            preload_title_index()
+        self.assertTrue(title_index.is_built)
+
+        with self.assertNumQueries(2):
+            # Session and user queries only
+            self.autocomplete('harbour')
+
+    @override_settings(ARTICLE_AUTOCOMPLETE_MAX_TITLES=2)
+    def test_index_size_is_bounded(self):
+        """
+        Checks that only the newest titles are indexed.
+        """
+        title_index.build()
+
+        self.assertEqual(
+            first=len(title_index),
+            second=2
+        )
+        self.assertNotIn(
+            member=self.harbour.title,
+            container=self.autocomplete('harbour expansion')
+        )
+
+    def test_measure_autocomplete_index_command(self):
+        """
+        Checks that the 'measure_autocomplete_index' command reports the
+        size of the index and the query times.
+        """
+        output = StringIO()
+        call_command(
+            'measure_autocomplete_index',
+            query=['harb'],
+            repeat=1,
+            stdout=output
+        )
+
+        self.assertIn(
+            member='Titles: 3',
+            container=output.getvalue()
+        )
+        self.assertIn(
+            member="Query 'harb': 2 matches",
+            container=output.getvalue()
+        )
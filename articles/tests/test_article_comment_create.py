@@ -0,0 +1,231 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from articles.models import Article, Comment
+from articles.tests.utils import TestUtils
+
+
+class ArticleCommentCreateTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the
+    'ArticleCommentCreateView' view.
+
+    These tests ensure that comments sent form-encoded or as JSON are saved
+    and returned as a rendered fragment or as JSON, without redirecting to
+    the article page.
+    """
+    # Utility methods
+    utils = TestUtils()
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'ArticleCommentCreateTestCase' class, this method is run and set up
+        the test data that all the tests will use.
+
+        This method creates a test user and a test article.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test user
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+        # Test article
+        cls.article = Article.objects.create(
+            title='Test Article',
+            body='Test Body',
+            author=cls.user
+        )
+
+        # URLs
+        cls.COMMENT_CREATE_URL = reverse(
+            viewname='article_comment_create',
+            kwargs={
+                'pk': cls.article.pk
+            }
+        )
+
+    def setUp(self):
+        """
+        It logs in with the test user and empties the cache (which stores
+        the template fragments) before every test.
+        """
+        cache.clear()
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+
+    def test_comment_create_user_not_authenticated(self):
+        """
+        Checks that non-authenticated users are redirected to the login page
+        and that no comment is saved.
+        """
+        self.client.logout()
+
+        # HTTP Response
+        response = self.client.post(
+            path=self.COMMENT_CREATE_URL,
+            data={'comment': 'Test Comment'},
+            follow=True
+        )
+
+        self.utils.check_login_redirect(
+            response=response,
+            target_url=self.COMMENT_CREATE_URL
+        )
+        self.assertFalse(Comment.objects.exists())
+
+    def test_comment_create_fragment(self):
+        """
+        Checks that a form-encoded comment is saved and returned as a
+        rendered fragment, and that the article page shows it.
+        """
+        # HTTP Response
+        response = self.client.post(
+            path=self.COMMENT_CREATE_URL,
+            data={'comment': 'Test Comment'}
+        )
+
+        self.assertEqual(
+            first=response.status_code,
+            second=201
+        )
+        self.assertTemplateUsed(
+            response=response,
+            template_name='articles/partials/comment.html'
+        )
+        self.assertTemplateNotUsed(
+            response=response,
+            template_name='articles/article_detail.html'
+        )
+        self.assertContains(
+            response=response,
+            text='Test Comment',
+            status_code=201
+        )
+        comment = Comment.objects.get()
+        self.assertEqual(
+            first=(comment.article, comment.author),
+            second=(self.article, self.user)
+        )
+
+        # Article page (its cached comments fragment is invalidated)
+        response = self.client.get(
+            path=reverse(
+                viewname='article_detail',
+                kwargs={
+                    'pk': self.article.pk
+                }
+            )
+        )
+        self.assertContains(
+            response=response,
+            text='Test Comment'
+        )
+        self.assertContains(
+            response=response,
+            text=f'data-comment-url="{self.COMMENT_CREATE_URL}"'
+        )
+
+    def test_comment_create_json(self):
+        """
+        Checks that a comment sent as JSON is saved and returned as JSON.
+        """
+        # HTTP Response
+        response = self.client.post(
+            path=self.COMMENT_CREATE_URL,
+            data=json.dumps({'comment': 'Test Comment'}),
+            content_type='application/json'
+        )
+
+        self.assertEqual(
+            first=response.status_code,
+            second=201
+        )
+        comment = Comment.objects.get()
+        data = response.json()
+        self.assertEqual(
+            first=(data['id'], data['author'], data['comment']),
+            second=(comment.pk, 'test_user', 'Test Comment')
+        )
+
+    def test_comment_create_invalid(self):
+        """
+        Checks that invalid comments aren't saved and return an HTTP 400
+        (Bad Request) status code with the form errors.
+        """
+        # Rendered form
+        response = self.client.post(
+            path=self.COMMENT_CREATE_URL,
+            data={'comment': ''}
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=400
+        )
+        self.assertTemplateUsed(
+            response=response,
+            template_name='articles/partials/comment_form.html'
+        )
+        self.assertTrue(response.context['form'].errors)
+
+        # JSON
+        response = self.client.post(
+            path=self.COMMENT_CREATE_URL,
+            data=json.dumps({'comment': 'x' * 151}),
+            content_type='application/json'
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=400
+        )
+        self.assertIn(
+            member='comment',
+            container=response.json()['errors']
+        )
+
+        # Malformed JSON
+        response = self.client.post(
+            path=self.COMMENT_CREATE_URL,
+            data='{"comment":',
+            content_type='application/json'
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=400
+        )
+        self.assertFalse(Comment.objects.exists())
+
+    def test_comment_create_unknown_article(self):
+        """
+        Checks that commenting an unknown article returns an HTTP 404 (Not
+        Found) status code.
+        """
+        # HTTP Response
+        response = self.client.post(
+            path=reverse(
+                viewname='article_comment_create',
+                kwargs={
+                    'pk': self.article.pk + 1
+                }
+            ),
+            data={'comment': 'Test Comment'}
+        )
+
+        self.assertEqual(
+            first=response.status_code,
+            second=404
+        )
+        self.assertFalse(Comment.objects.exists())
@@ -0,0 +1,210 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from articles.models import Article, Comment
+
+
+class ArticleConditionalGetTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the
+    conditional GET requests to the 'ArticleListView' and
+    'ArticleDetailView' views.
+
+    These tests ensure that the views return an HTTP 304 (Not Modified)
+    response while the pages don't change, and a full response when the
+    articles, their comments or the user change.
+    """
+    # URLs
+    ARTICLE_LIST_URL = reverse('article_list')
+    ARTICLE_DETAIL_URL = reverse(
+        viewname='article_detail',
+        kwargs={
+            'pk': 1
+        }
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'ArticleConditionalGetTestCase' class, this method is run and set up
+        the test data that all the tests will use.
+
+        This method creates two test users and a test article.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test users
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+        cls.user_2 = user_model.objects.create_user(
+            username='test_user_2',
+            password='test_pass',
+            email='test2@example.net',
+            age=81
+        )
+
+        # Test article
+        cls.article = Article.objects.create(
+            pk=1,
+            title='Test Article',
+            body='Test Body',
+            author=cls.user
+        )
+
+    def setUp(self):
+        """
+        It clears the cached template fragments and logs in with the test
+        user before every test.
+        """
+        cache.clear()
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+
+    def test_article_detail_not_modified(self):
+        """
+        Checks that the article detail page returns an HTTP 304 (Not
+        Modified) response for both validators while the article doesn't
+        change.
+        """
+        response = self.client.get(path=self.ARTICLE_DETAIL_URL)
+
+        # Request with the ETag
+        etag_response = self.client.get(
+            path=self.ARTICLE_DETAIL_URL,
+            HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(
+            first=etag_response.status_code,
+            second=304
+        )
+
+        # Request with the last modification date
+        last_modified_response = self.client.get(
+            path=self.ARTICLE_DETAIL_URL,
+            HTTP_IF_MODIFIED_SINCE=response['Last-Modified']
+        )
+        self.assertEqual(
+            first=last_modified_response.status_code,
+            second=304
+        )
+
+    def test_article_detail_modified_by_comment(self):
+        """
+        Checks that the article detail page returns a full response after a
+        new comment is added to the article.
+        """
+        response = self.client.get(path=self.ARTICLE_DETAIL_URL)
+
+        Comment.objects.create(
+            comment='New comment',
+            article=self.article,
+            author=self.user_2
+        )
+
+        # HTTP Response
+        response = self.client.get(
+            path=self.ARTICLE_DETAIL_URL,
+            HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
+        self.assertContains(
+            response=response,
+            text='New comment'
+        )
+
+    def test_article_detail_modified_by_consecutive_comments(self):
+        """
+        Checks that every comment changes the ETag of the article detail
+        page, even if two comments are posted in the same second.
+        """
+        etags = []
+        for number in range(2):
+            self.client.post(
+                path=self.ARTICLE_DETAIL_URL,
+                data={'comment': f'Comment {number}'}
+            )
+            previous_etag = etags[-1] if etags else ''
+            response = self.client.get(
+                path=self.ARTICLE_DETAIL_URL,
+                HTTP_IF_NONE_MATCH=previous_etag
+            )
+            self.assertEqual(
+                first=response.status_code,
+                second=200
+            )
+            self.assertContains(
+                response=response,
+                text=f'Comment {number}'
+            )
+            etags.append(response['ETag'])
+
+        self.assertNotEqual(
+            first=etags[0],
+            second=etags[1]
+        )
+
+    def test_article_detail_modified_by_user(self):
+        """
+        Checks that the article detail page ETag of a user is not valid for
+        another user.
+        """
+        response = self.client.get(path=self.ARTICLE_DETAIL_URL)
+
+        self.client.login(
+            username='test_user_2',
+            password='test_pass'
+        )
+
+        # HTTP Response
+        response = self.client.get(
+            path=self.ARTICLE_DETAIL_URL,
+            HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
+
+    def test_article_list_not_modified(self):
+        """
+        Checks that the article list returns an HTTP 304 (Not Modified)
+        response while the articles don't change, and a full response after
+        an article is updated.
+        """
+        response = self.client.get(path=self.ARTICLE_LIST_URL)
+        etag = response['ETag']
+
+        # Not modified
+        response = self.client.get(
+            path=self.ARTICLE_LIST_URL,
+            HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=304
+        )
+
+        # Modified
+        self.article.title = 'Updated title'
+        self.article.save()
+        response = self.client.get(
+            path=self.ARTICLE_LIST_URL,
+            HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
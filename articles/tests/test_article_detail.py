@@ -1,10 +1,14 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from articles.forms import CommentForm
 from articles.models import Article, Comment
 from articles.tests.utils import TestUtils
+from articles.views import ArticleDetailGet
 
 
 class ArticleDetailTestCase(TestCase):
@@ -260,3 +264,151 @@ class ArticleDetailTestCase(TestCase):
             member='comment',
             container=response.context['form'].errors
         )
+
+
+class ArticleDetailCommentsTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the comments
+    shown by the 'ArticleDetailView' view.
+
+    These tests ensure that the comments are shown newest first, page by
+    page, and that they are loaded together with their authors.
+    """
+    # URLS
+    ARTICLE_DETAIL_URL = reverse(
+        'article_detail',
+        kwargs={
+            'pk': 1
+        }
+    )
+
+    # Pagination
+    PAGE_SIZE = ArticleDetailGet.comments_per_page
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'ArticleDetailCommentsTestCase' class, this method is run and set up
+        the test data that all the tests will use.
+
+        This method creates a test user, a test article, and more comments by
+        different authors than fit in a page.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test users
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+        cls.user_2 = user_model.objects.create_user(
+            username='test_user_2',
+            password='test_pass',
+            email='test2@example.net',
+            age=81
+        )
+
+        # Test article
+        cls.article = Article.objects.create(
+            pk=1,
+            title='Test Article',
+            body='Test Body',
+            author=cls.user
+        )
+
+        # Test comments
+        for number in range(cls.PAGE_SIZE + 5):
+            Comment.objects.create(
+                comment=f'Test comment {number}',
+                article=cls.article,
+                author=cls.user if number % 2 else cls.user_2
+            )
+
+        # Expected order (newest first)
+        cls.ordered_comments = list(
+            Comment.objects.order_by('-created_at', '-id')
+        )
+
+    def setUp(self):
+        """
+        It clears the cached template fragments and logs in with the test
+        user before every test.
+        """
+        cache.clear()
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+
+    def test_article_detail_comments_pages(self):
+        """
+        Checks that the first page shows the newest comments and that the
+        "load more" cursor shows the older ones.
+        """
+        # HTTP Response
+        response = self.client.get(path=self.ARTICLE_DETAIL_URL)
+
+        # Checks that the first page contains the newest comments
+        self.assertEqual(
+            first=list(response.context['comments']),
+            second=self.ordered_comments[:self.PAGE_SIZE]
+        )
+        comment_page = response.context['comment_page']
+        self.assertTrue(expr=comment_page.has_next)
+
+        # HTTP Response ("load more" link)
+        response = self.client.get(
+            path=self.ARTICLE_DETAIL_URL,
+            data={'comments': comment_page.next_cursor}
+        )
+
+        # Checks that the second page contains the older comments
+        self.assertEqual(
+            first=list(response.context['comments']),
+            second=self.ordered_comments[self.PAGE_SIZE:]
+        )
+        self.assertFalse(expr=response.context['comment_page'].has_next)
+
+    def test_article_detail_comments_single_query(self):
+        """
+        Checks that the comments and their authors are fetched with a single
+        query, regardless of the number of comment authors.
+        """
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(path=self.ARTICLE_DETAIL_URL)
+
+        comment_queries = [
+            query['sql'] for query in context.captured_queries
+            if 'articles_comment' in query['sql']
+        ]
+        self.assertEqual(
+            first=len(comment_queries),
+            second=1
+        )
+
+        # Checks that the comment authors are joined in the same query
+        self.assertIn(
+            member='accounts_customuser',
+            container=comment_queries[0]
+        )
+
+    def test_article_detail_invalid_comments_cursor(self):
+        """
+        Checks that an invalid comments page cursor returns an HTTP 404
+        (Not Found) status code.
+        """
+        # HTTP Response
+        response = self.client.get(
+            path=self.ARTICLE_DETAIL_URL,
+            data={'comments': 'not-a-valid-cursor'}
+        )
+
+        # Checks that an HTTP 404 (Not Found) status code is returned.
+        self.assertEqual(
+            first=response.status_code,
+            second=404
+        )
@@ -0,0 +1,211 @@
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from articles.export import iter_gzip
+from articles.models import Article, Comment
+
+
+class ArticleExportTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the article and
+    comment exports (the 'export_articles' command and the
+    'ArticleExportView' view).
+
+    These tests ensure that the exports contain all the rows, in the
+    requested format and compressed, and that only staff members can
+    download them.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'ArticleExportTestCase' class, this method is run and set up the
+        test data that all the tests will use.
+
+        This method creates a staff user, a regular user, test articles and
+        a test comment.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test users
+        cls.staff_user = user_model.objects.create_user(
+            username='staff_user',
+            password='test_pass',
+            email='staff@example.net',
+            age=30,
+            is_staff=True
+        )
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+        # Test articles
+        cls.articles = [
+            Article.objects.create(
+                title=f'Test Article {number}',
+                body=f'Test Body, "quoted" {number}',
+                author=cls.user
+            )
+            for number in range(3)
+        ]
+
+        # Test comment
+        cls.comment = Comment.objects.create(
+            comment='Test Comment',
+            article=cls.articles[0],
+            author=cls.staff_user
+        )
+
+        # URLs
+        cls.ARTICLES_CSV_URL = reverse(
+            viewname='article_export',
+            kwargs={
+                'dataset': 'articles',
+                'format': 'csv'
+            }
+        )
+
+    def test_export_command_ndjson(self):
+        """
+        Checks that the 'export_articles' command writes all the rows as
+        gzip-compressed NDJSON.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'comments.ndjson.gz')
+            call_command(
+                'export_articles',
+                'comments',
+                output=path,
+                chunk_size=1
+            )
+            with gzip.open(path, 'rt') as export:
+                rows = [json.loads(line) for line in export]
+
+        self.assertEqual(
+            first=len(rows),
+            second=1
+        )
+        self.assertEqual(
+            first=rows[0]['comment'],
+            second=self.comment.comment
+        )
+        self.assertEqual(
+            first=rows[0]['author__username'],
+            second='staff_user'
+        )
+
+    def test_export_command_uncompressed_csv(self):
+        """
+        Checks that the 'export_articles' command can write uncompressed CSV.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'articles.csv')
+            call_command(
+                'export_articles',
+                'articles',
+                format='csv',
+                gzip=False,
+                output=path
+            )
+            with open(path, newline='') as export:
+                rows = list(csv.DictReader(export))
+
+        self.assertEqual(
+            first=[row['body'] for row in rows],
+            second=[article.body for article in self.articles]
+        )
+
+    def test_export_view_staff(self):
+        """
+        Checks that staff members can download the exports as a stream of
+        gzip-compressed data.
+        """
+        self.client.login(
+            username='staff_user',
+            password='test_pass'
+        )
+
+        # HTTP Response
+        response = self.client.get(path=self.ARTICLES_CSV_URL)
+
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
+        self.assertTrue(expr=response.streaming)
+        self.assertEqual(
+            first=response['Content-Disposition'],
+            second='attachment; filename="articles.csv.gz"'
+        )
+        content = gzip.decompress(b''.join(response.streaming_content))
+        rows = list(csv.DictReader(io.StringIO(content.decode())))
+        self.assertEqual(
+            first=[int(row['id']) for row in rows],
+            second=[article.pk for article in self.articles]
+        )
+
+    def test_export_view_not_staff(self):
+        """
+        Checks that users who aren't staff members get an HTTP 403
+        (Forbidden) status code and that unknown exports return an HTTP 404
+        (Not Found) status code.
+        """
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+        response = self.client.get(path=self.ARTICLES_CSV_URL)
+        self.assertEqual(
+            first=response.status_code,
+            second=403
+        )
+
+        self.client.login(
+            username='staff_user',
+            password='test_pass'
+        )
+        response = self.client.get(
+            path=reverse(
+                viewname='article_export',
+                kwargs={
+                    'dataset': 'users',
+                    'format': 'csv'
+                }
+            )
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=404
+        )
+
+    def test_gzip_stream_blocks(self):
+        """
+        Checks that the compressed stream is split into blocks as it is
+        produced and that the blocks form a single gzip member.
+        """
+        lines = [f'line {number}\n' for number in range(20000)]
+
+        blocks = list(iter_gzip(iter(lines), level=1, min_size=1024))
+
+        self.assertGreater(
+            a=len(blocks),
+            b=1
+        )
+        self.assertEqual(
+            first=gzip.decompress(b''.join(blocks)).decode(),
+            second=''.join(lines)
+        )
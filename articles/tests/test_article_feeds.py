@@ -0,0 +1,237 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from articles.feeds import CachedArticleFeed, invalidate_article_feeds
+from articles.models import Article
+
+
+class ArticleFeedTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the RSS and
+    Atom article feeds.
+
+    These tests ensure that the feeds contain the newest articles of their
+    scope, that they are served from the cache (and answer conditional
+    requests) and that they are only regenerated when an article of their
+    scope changes.
+    """
+    # URLs
+    ARTICLE_FEED_URL = reverse('article_feed')
+    ARTICLE_ATOM_FEED_URL = reverse('article_atom_feed')
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'ArticleFeedTestCase' class, this method is run and set up the test
+        data that all the tests will use.
+
+        This method creates two test users and an article of each one.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test users
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+        cls.other_user = user_model.objects.create_user(
+            username='other_user',
+            password='test_pass',
+            email='other@example.net',
+            age=25
+        )
+
+        # Test articles
+        cls.article = Article.objects.create(
+            title='Test Article',
+            body='Test Body',
+            author=cls.user
+        )
+        cls.other_article = Article.objects.create(
+            title='Other Article',
+            body='Other Body',
+            author=cls.other_user
+        )
+
+        # URLs
+        cls.AUTHOR_FEED_URL = reverse(
+            viewname='author_article_feed',
+            kwargs={
+                'username': cls.user.username
+            }
+        )
+
+    def setUp(self):
+        """
+        It empties the cache (which stores the feeds) before every test.
+        """
+        cache.clear()
+
+    def test_latest_feeds(self):
+        """
+        Checks that the RSS and Atom feeds of the latest articles are public
+        and contain the newest articles.
+        """
+        # RSS feed
+        response = self.client.get(path=self.ARTICLE_FEED_URL)
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
+        self.assertTrue(
+            expr=response['Content-Type'].startswith('application/rss+xml')
+        )
+        self.assertContains(
+            response=response,
+            text='<title>Test Article</title>'
+        )
+        self.assertContains(
+            response=response,
+            text='<title>Other Article</title>'
+        )
+
+        # Atom feed
+        response = self.client.get(path=self.ARTICLE_ATOM_FEED_URL)
+        self.assertTrue(
+            expr=response['Content-Type'].startswith('application/atom+xml')
+        )
+        self.assertContains(
+            response=response,
+            text='Test Article'
+        )
+
+    def test_author_feeds(self):
+        """
+        Checks that the feeds of an author only contain its articles and
+        that the feeds of unknown authors return an HTTP 404 (Not Found)
+        status code.
+        """
+        # HTTP Response
+        response = self.client.get(path=self.AUTHOR_FEED_URL)
+
+        self.assertContains(
+            response=response,
+            text='Test Article'
+        )
+        self.assertNotContains(
+            response=response,
+            text='Other Article'
+        )
+
+        # Unknown author
+        response = self.client.get(
+            path=reverse(
+                viewname='author_article_atom_feed',
+                kwargs={
+                    'username': 'unknown_user'
+                }
+            )
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=404
+        )
+
+    def test_feeds_served_from_cache(self):
+        """
+        Checks that the feeds are served from the cache without querying the
+        database and that conditional requests are answered with an HTTP
+        304 (Not Modified) status code.
+        """
+        response = self.client.get(path=self.ARTICLE_FEED_URL)
+
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(path=self.ARTICLE_FEED_URL)
+        self.assertEqual(
+            first=cached_response.content,
+            second=response.content
+        )
+
+        # Conditional requests
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                path=self.ARTICLE_FEED_URL,
+                HTTP_IF_NONE_MATCH=response['ETag']
+            )
+        self.assertEqual(
+            first=response.status_code,
+            second=304
+        )
+
+    def test_feeds_invalidated_by_articles_of_their_scope(self):
+        """
+        Checks that the feeds are regenerated when an article of their scope
+        changes, but not when an article of another scope changes.
+        """
+        self.client.get(path=self.ARTICLE_FEED_URL)
+        self.client.get(path=self.AUTHOR_FEED_URL)
+
+        # An article of another author only changes the latest articles
+        self.other_article.title = 'Updated Article'
+        self.other_article.save()
+
+        response = self.client.get(path=self.ARTICLE_FEED_URL)
+        self.assertContains(
+            response=response,
+            text='Updated Article'
+        )
+        with self.assertNumQueries(0):
+            self.client.get(path=self.AUTHOR_FEED_URL)
+
+        # A deleted article of the author changes both feeds
+        self.article.delete()
+        response = self.client.get(path=self.AUTHOR_FEED_URL)
+        self.assertNotContains(
+            response=response,
+            text='Test Article'
+        )
+
+    @mock.patch.object(CachedArticleFeed, 'item_count', 1)
+    def test_feeds_not_invalidated_by_older_articles(self):
+        """
+        Checks that changes to articles older than the ones of a full feed
+        don't regenerate it.
+        """
+        self.client.get(path=self.ARTICLE_FEED_URL)
+
+        # The first article isn't in the feed
+        self.article.title = 'Updated Article'
+        self.article.save()
+
+        with self.assertNumQueries(0):
+            response = self.client.get(path=self.ARTICLE_FEED_URL)
+        self.assertContains(
+            response=response,
+            text='Other Article'
+        )
+
+    def test_feeds_invalidated_without_loading_the_author(self):
+        """
+        Checks that saving an article loaded with its author doesn't query
+        the author again to invalidate the feeds, and that the author feeds
+        are invalidated when the author isn't loaded.
+        """
+        self.client.get(path=self.AUTHOR_FEED_URL)
+
+        article = Article.objects.select_related('author').get(
+            pk=self.article.pk
+        )
+        with self.assertNumQueries(0):
+            invalidate_article_feeds(article)
+
+        article = Article.objects.get(pk=self.article.pk)
+        article.title = 'Renamed Article'
+        article.save()
+        self.assertFalse(Article.author.is_cached(article))
+        self.assertContains(
+            response=self.client.get(path=self.AUTHOR_FEED_URL),
+            text='Renamed Article'
+        )
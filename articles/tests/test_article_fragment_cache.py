@@ -0,0 +1,181 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from articles.models import Article, Comment
+
+
+class ArticleFragmentCacheTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the cached
+    template fragments of the article detail page.
+
+    These tests ensure that the article table and the comments are served
+    from the cache, that they are invalidated when the article or its
+    comments change, and that the per-user parts of the page are never
+    cached.
+    """
+    # URLs
+    ARTICLE_DETAIL_URL = reverse(
+        viewname='article_detail',
+        kwargs={
+            'pk': 1
+        }
+    )
+    ARTICLE_UPDATE_URL = reverse(
+        viewname='article_edit',
+        kwargs={
+            'pk': 1
+        }
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'ArticleFragmentCacheTestCase' class, this method is run and set up
+        the test data that all the tests will use.
+
+        This method creates two test users, a test article and a comment.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test users
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+        cls.user_2 = user_model.objects.create_user(
+            username='test_user_2',
+            password='test_pass',
+            email='test2@example.net',
+            age=81
+        )
+
+        # Test article
+        cls.article = Article.objects.create(
+            pk=1,
+            title='Test Article',
+            body='Test Body',
+            author=cls.user
+        )
+
+        # Test comment
+        Comment.objects.create(
+            comment='First comment',
+            article=cls.article,
+            author=cls.user_2
+        )
+
+    def setUp(self):
+        """
+        It clears the cached template fragments and logs in with the test
+        user before every test.
+        """
+        cache.clear()
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+
+    def test_comments_served_from_cache(self):
+        """
+        Checks that the comments are not fetched again once the comments
+        fragment is cached.
+        """
+        # First request (renders and caches the fragments)
+        self.client.get(path=self.ARTICLE_DETAIL_URL)
+
+        # Second request
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(path=self.ARTICLE_DETAIL_URL)
+
+        comment_queries = [
+            query for query in context.captured_queries
+            if 'articles_comment' in query['sql']
+        ]
+        self.assertEqual(
+            first=comment_queries,
+            second=[]
+        )
+        self.assertContains(
+            response=response,
+            text='First comment'
+        )
+
+    def test_new_comment_invalidates_cache(self):
+        """
+        Checks that a new comment is shown right after it is posted.
+        """
+        # First request (renders and caches the fragments)
+        self.client.get(path=self.ARTICLE_DETAIL_URL)
+
+        # HTTP Response
+        response = self.client.post(
+            path=self.ARTICLE_DETAIL_URL,
+            data={
+                'comment': 'Second comment'
+            },
+            follow=True
+        )
+
+        self.assertContains(
+            response=response,
+            text='Second comment'
+        )
+
+    def test_article_update_invalidates_cache(self):
+        """
+        Checks that the article changes are shown right after the article
+        is updated.
+        """
+        # First request (renders and caches the fragments)
+        self.client.get(path=self.ARTICLE_DETAIL_URL)
+
+        # HTTP Response
+        response = self.client.post(
+            path=self.ARTICLE_UPDATE_URL,
+            data={
+                'title': 'Updated title',
+                'body': 'Updated Body'
+            },
+            follow=True
+        )
+
+        self.assertContains(
+            response=response,
+            text='Updated Body'
+        )
+
+    def test_owner_buttons_not_cached(self):
+        """
+        Checks that the owner buttons cached for the article author are not
+        shown to other users.
+        """
+        # The author caches the fragments
+        response = self.client.get(path=self.ARTICLE_DETAIL_URL)
+        self.assertContains(
+            response=response,
+            text=self.ARTICLE_UPDATE_URL
+        )
+
+        # Another user gets the cached fragments
+        self.client.login(
+            username='test_user_2',
+            password='test_pass'
+        )
+        response = self.client.get(path=self.ARTICLE_DETAIL_URL)
+        self.assertNotContains(
+            response=response,
+            text=self.ARTICLE_UPDATE_URL
+        )
+        self.assertContains(
+            response=response,
+            text='Welcome, test_user_2'
+        )
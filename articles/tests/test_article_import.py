@@ -0,0 +1,294 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from articles.cache import article_version_key, get_cache_version
+from articles.feeds import author_feed_scope, latest_feed_scope
+from articles.models import Article, ArticleArchiveMonth, Comment
+from articles.search import get_search_backend
+from articles.search.autocomplete import TITLE_INDEX_VERSION_KEY
+from articles.sitemaps import SITEMAP_INDEX_VERSION_KEY, \
+    get_sitemap_shard, sitemap_shard_version_key
+
+
+class ArticleImportTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the
+    'import_articles' command.
+
+    These tests ensure that the exported articles and comments can be
+    imported back with their ids and dates, that the records of unknown
+    authors are skipped, that interrupted imports are resumed from their
+    checkpoint and that the derived data is rebuilt.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'ArticleImportTestCase' class, this method is run and set up the
+        test data that all the tests will use.
+
+        This method creates a test user.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test user
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+    def setUp(self):
+        """
+        It creates a temporary directory for the import files before every
+        test.
+        """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write_records(self, name, records):
+        """
+        It writes records to an NDJSON file of the temporary directory.
+
+        :param name: The file name.
+        :param records: The records (dictionaries).
+        :return: The path of the file.
+        """
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as file:
+            for record in records:
+                file.write(json.dumps(record) + '\n')
+        return path
+
+    def import_file(self, dataset, path, **options):
+        """
+        It runs the 'import_articles' command.
+
+        :param dataset: The imported data ('articles' or 'comments').
+        :param path: The path of the file.
+        :param options: Additional command options.
+        :return: The output of the command.
+        """
+        output = StringIO()
+        call_command(
+            'import_articles',
+            dataset,
+            path,
+            stdout=output,
+            **options
+        )
+        return output.getvalue()
+
+    def test_import_exported_data(self):
+        """
+        Checks that the articles and comments written by the
+        'export_articles' command are imported back with the same ids and
+        dates, and that the derived data is rebuilt.
+        """
+        article = Article.objects.create(
+            title='Harbour news',
+            body='The harbour will be expanded.',
+            author=self.user
+        )
+        Comment.objects.create(
+            comment='Test Comment',
+            article=article,
+            author=self.user
+        )
+        article.refresh_from_db()
+        articles_path = os.path.join(self.directory, 'articles.ndjson.gz')
+        comments_path = os.path.join(self.directory, 'comments.csv')
+        call_command('export_articles', 'articles', output=articles_path)
+        call_command(
+            'export_articles',
+            'comments',
+            format='csv',
+            gzip=False,
+            output=comments_path
+        )
+        Article.objects.all().delete()
+        ArticleArchiveMonth.objects.all().delete()
+
+        output = self.import_file('articles', articles_path)
+        self.import_file('comments', comments_path)
+
+        self.assertIn(
+            member='Done: 1 articles imported, 0 records skipped.',
+            container=output
+        )
+        imported = Article.objects.get()
+        self.assertEqual(
+            first=(imported.pk, imported.date, imported.excerpt),
+            second=(article.pk, article.date, article.excerpt)
+        )
+        self.assertEqual(
+            first=imported.comment_count,
+            second=1
+        )
+        self.assertEqual(
+            first=get_search_backend().search('harbour', limit=10),
+            second=[article.pk]
+        )
+        self.assertEqual(
+            first=ArticleArchiveMonth.objects.get().article_count,
+            second=1
+        )
+        self.assertFalse(
+            expr=os.path.exists(f'{articles_path}.checkpoint')
+        )
+
+        # New articles don't reuse the imported ids
+        new_article = Article.objects.create(
+            title='New Article',
+            body='New Body',
+            author=self.user
+        )
+        self.assertGreater(
+            a=new_article.pk,
+            b=article.pk
+        )
+
+    def test_import_invalidates_caches(self):
+        """
+        Checks that the caches invalidated by the signal handlers are
+        invalidated by the imports too, and that importing comments changes
+        the modification date of their articles.
+        """
+        version_keys = [
+            SITEMAP_INDEX_VERSION_KEY,
+            sitemap_shard_version_key(get_sitemap_shard(500)),
+            f'{latest_feed_scope()}:version',
+            f'{author_feed_scope(self.user.username)}:version',
+            TITLE_INDEX_VERSION_KEY,
+            article_version_key(500),
+        ]
+        versions = [get_cache_version(key) for key in version_keys]
+
+        path = self.write_records('articles.ndjson', [
+            {'id': 500, 'title': 'Article', 'body': 'Body',
+             'author': 'test_user'},
+        ])
+        self.import_file('articles', path)
+
+        for key, version in zip(version_keys, versions):
+            with self.subTest(key=key):
+                self.assertNotEqual(
+                    first=get_cache_version(key),
+                    second=version
+                )
+
+        updated_at = Article.objects.get(pk=500).updated_at
+        article_version = get_cache_version(article_version_key(500))
+        path = self.write_records('comments.ndjson', [
+            {'comment': 'Comment', 'article_id': 500, 'author': 'test_user'},
+        ])
+        self.import_file('comments', path)
+
+        self.assertGreater(
+            a=Article.objects.get(pk=500).updated_at,
+            b=updated_at
+        )
+        self.assertNotEqual(
+            first=get_cache_version(article_version_key(500)),
+            second=article_version
+        )
+
+    def test_import_skips_unknown_authors(self):
+        """
+        Checks that the records of unknown authors (or comments of unknown
+        articles) are skipped.
+        """
+        path = self.write_records('articles.ndjson', [
+            {'title': 'Article 1', 'body': 'Body', 'author': 'test_user'},
+            {'title': 'Article 2', 'body': 'Body', 'author': 'unknown'},
+            {'title': 'Article 3', 'body': 'Body', 'author_id': self.user.pk},
+        ])
+        output = self.import_file('articles', path)
+
+        self.assertEqual(
+            first=sorted(Article.objects.values_list('title', flat=True)),
+            second=['Article 1', 'Article 3']
+        )
+        self.assertIn(
+            member='Done: 2 articles imported, 1 records skipped.',
+            container=output
+        )
+
+        path = self.write_records('comments.ndjson', [
+            {'comment': 'Comment', 'article_id': 0, 'author': 'test_user'},
+        ])
+        self.import_file('comments', path)
+        self.assertFalse(expr=Comment.objects.exists())
+
+    def test_import_resumes_from_checkpoint(self):
+        """
+        Checks that an interrupted import is resumed after the records
+        processed by the last committed batch.
+        """
+        path = self.write_records('articles.ndjson', [
+            {'id': 100 + number, 'title': f'Article {number}', 'body': 'Body',
+             'author': 'test_user'}
+            for number in range(5)
+        ])
+
+        # First two records imported by an interrupted import
+        Article.objects.bulk_create([
+            Article(id=100, title='Article 0', body='Body', author=self.user),
+            Article(id=101, title='Article 1', body='Body', author=self.user),
+        ])
+        with open(f'{path}.checkpoint', 'w') as checkpoint_file:
+            json.dump(
+                {'path': os.path.abspath(path), 'processed': 1},
+                checkpoint_file
+            )
+
+        output = self.import_file('articles', path, batch_size=2)
+
+        self.assertIn(
+            member='Resuming after 1 records.',
+            container=output
+        )
+        self.assertEqual(
+            first=list(
+                Article.objects.order_by('pk').values_list('pk', flat=True)
+            ),
+            second=[100, 101, 102, 103, 104]
+        )
+
+    def test_import_rebuilds_on_its_database(self):
+        """
+        Checks that the derived data is rebuilt on the database where the
+        records are imported.
+        """
+        for dataset, record, commands in [
+            ('articles', {'title': 'Article', 'body': 'Body',
+                          'author': 'test_user'},
+             ['rebuild_search_index', 'rebuild_archive_counts']),
+            ('comments', {'comment': 'Comment', 'article_id': 0,
+                          'author': 'test_user'},
+             ['reconcile_comment_counts']),
+        ]:
+            path = self.write_records(f'{dataset}.ndjson', [record])
+            with self.subTest(dataset=dataset), mock.patch(
+                'articles.management.commands.import_articles.call_command'
+            ) as rebuild_command:
+                self.import_file(dataset, path, database='default')
+
+                self.assertEqual(
+                    first=[
+                        (call.args[0], call.kwargs['database'])
+                        for call in rebuild_command.call_args_list
+                    ],
+                    second=[(command, 'default') for command in commands]
+                )
@@ -4,6 +4,7 @@ from django.urls import reverse
 
 from articles.models import Article
 from articles.tests.utils import TestUtils
+from articles.views import ArticleListView
 
 
 class ArticleListTestCase(TestCase):
@@ -124,3 +125,229 @@ class ArticleListTestCase(TestCase):
             response=response,
             template_name='articles/article_list.html'
         )
+
+
+class ArticleListPaginationTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the keyset
+    pagination of the "ArticleListView" view.
+
+    These tests ensure that the articles are split into pages (newest
+    first), that the next and previous page cursors work as expected, and
+    that invalid cursors are rejected.
+    """
+    # URLs
+    ARTICLE_LIST_URL = reverse('article_list')
+
+    # Pagination
+    PAGE_SIZE = ArticleListView.paginate_by
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'ArticleListPaginationTestCase' class, this method is run and set up
+        the test data that all the tests will use.
+
+        This method creates a test user and more test articles than fit in
+        two pages. Most of them share the same creation date to check that
+        the article id breaks the ties.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test user
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+        # Test articles
+        Article.objects.bulk_create([
+            Article(
+                title=f'Test Article {number}',
+                body=f'Test Body {number}',
+                author=cls.user
+            )
+            for number in range(cls.PAGE_SIZE * 2 + 1)
+        ])
+
+        # Expected order (newest first)
+        cls.ordered_articles = list(Article.objects.order_by('-date', '-id'))
+
+    def setUp(self):
+        """
+        It logs in with the test user before every test.
+        """
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+
+    def test_article_list_first_page(self):
+        """
+        Checks that the first page contains the newest articles and links to
+        the next page but not to a previous one.
+        """
+        # HTTP Response
+        response = self.client.get(path=self.ARTICLE_LIST_URL)
+
+        # Checks that the first page contains the newest articles
+        self.assertEqual(
+            first=list(response.context['article_list']),
+            second=self.ordered_articles[:self.PAGE_SIZE]
+        )
+
+        # Checks the page navigation
+        page = response.context['page_obj']
+        self.assertTrue(expr=page.has_next)
+        self.assertFalse(expr=page.has_previous)
+        self.assertTrue(expr=response.context['is_paginated'])
+
+    def test_article_list_next_and_previous_pages(self):
+        """
+        Checks that the next page cursors walk through all the articles
+        without repetitions and that the previous page cursor goes back to
+        the first page.
+        """
+        # First page
+        response = self.client.get(path=self.ARTICLE_LIST_URL)
+        next_cursor = response.context['page_obj'].next_cursor
+
+        # Second page
+        response = self.client.get(
+            path=self.ARTICLE_LIST_URL,
+            data={'cursor': next_cursor}
+        )
+        self.assertEqual(
+            first=list(response.context['article_list']),
+            second=self.ordered_articles[self.PAGE_SIZE:self.PAGE_SIZE * 2]
+        )
+        second_page = response.context['page_obj']
+        self.assertTrue(expr=second_page.has_next)
+        self.assertTrue(expr=second_page.has_previous)
+
+        # Last page
+        response = self.client.get(
+            path=self.ARTICLE_LIST_URL,
+            data={'cursor': second_page.next_cursor}
+        )
+        self.assertEqual(
+            first=list(response.context['article_list']),
+            second=self.ordered_articles[self.PAGE_SIZE * 2:]
+        )
+        self.assertFalse(expr=response.context['page_obj'].has_next)
+
+        # Back to the first page
+        response = self.client.get(
+            path=self.ARTICLE_LIST_URL,
+            data={'cursor': second_page.previous_cursor}
+        )
+        self.assertEqual(
+            first=list(response.context['article_list']),
+            second=self.ordered_articles[:self.PAGE_SIZE]
+        )
+        self.assertFalse(expr=response.context['page_obj'].has_previous)
+
+    def test_article_list_previous_page_links(self):
+        """
+        Checks that a previous page only links to a next page if there are
+        older articles, and that an empty previous page has no links.
+        """
+        response = self.client.get(path=self.ARTICLE_LIST_URL)
+        response = self.client.get(
+            path=self.ARTICLE_LIST_URL,
+            data={'cursor': response.context['page_obj'].next_cursor}
+        )
+        second_page = response.context['page_obj']
+
+        # The articles of the second page and after it are deleted
+        Article.objects.filter(
+            pk__in=[article.pk for article in self.ordered_articles[
+                self.PAGE_SIZE:
+            ]]
+        ).delete()
+        response = self.client.get(
+            path=self.ARTICLE_LIST_URL,
+            data={'cursor': second_page.previous_cursor}
+        )
+        page = response.context['page_obj']
+        self.assertEqual(
+            first=list(page),
+            second=self.ordered_articles[:self.PAGE_SIZE]
+        )
+        self.assertFalse(expr=page.has_next)
+        self.assertIsNone(obj=page.next_cursor)
+
+        # The articles of the previous page are deleted too
+        Article.objects.all().delete()
+        response = self.client.get(
+            path=self.ARTICLE_LIST_URL,
+            data={'cursor': second_page.previous_cursor}
+        )
+        page = response.context['page_obj']
+        self.assertFalse(expr=page.has_next)
+        self.assertFalse(expr=page.has_previous)
+        self.assertNotContains(
+            response=response,
+            text='cursor=None'
+        )
+
+    def test_article_list_invalid_cursor(self):
+        """
+        Checks that an invalid page cursor returns an HTTP 404 (Not Found)
+        status code.
+        """
+        # HTTP Response
+        response = self.client.get(
+            path=self.ARTICLE_LIST_URL,
+            data={'cursor': 'not-a-valid-cursor'}
+        )
+
+        # Checks that an HTTP 404 (Not Found) status code is returned.
+        self.assertEqual(
+            first=response.status_code,
+            second=404
+        )
+
+    def test_article_list_query_count(self):
+        """
+        Checks that the number of queries needed to render a page doesn't
+        depend on the number of articles or authors on it.
+
+        The expected queries are the session and user lookups of the
+        authenticated user, the page validators (ETag) query and the
+        articles (with their authors) query.
+        """
+        # Another author for some articles of the page
+        user_model = get_user_model()
+        other_user = user_model.objects.create_user(
+            username='other_user',
+            password='test_pass',
+            email='other@example.net',
+            age=25
+        )
+        Article.objects.bulk_create([
+            Article(
+                title=f'Other Article {number}',
+                body=f'Other Body {number}',
+                author=other_user
+            )
+            for number in range(3)
+        ])
+
+        # Checks the number of queries
+        with self.assertNumQueries(4):
+            response = self.client.get(path=self.ARTICLE_LIST_URL)
+
+        # Checks that the authors are rendered
+        self.assertContains(
+            response=response,
+            text='other_user'
+        )
+        self.assertContains(
+            response=response,
+            text='test_user'
+        )
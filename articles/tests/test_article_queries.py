@@ -0,0 +1,219 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from articles.models import Article, Comment
+
+
+class ArticleObjectQueriesTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the number of
+    queries run by the views that work on a single article (detail, comment,
+    update and delete views).
+
+    These tests ensure that the article is fetched only once per request and
+    that the ownership checks don't load any additional object.
+    """
+    # URLs
+    ARTICLE_DETAIL_URL = reverse(
+        viewname='article_detail',
+        kwargs={
+            'pk': 1
+        }
+    )
+    ARTICLE_UPDATE_URL = reverse(
+        viewname='article_edit',
+        kwargs={
+            'pk': 1
+        }
+    )
+    ARTICLE_DELETE_URL = reverse(
+        viewname='article_delete',
+        kwargs={
+            'pk': 1
+        }
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'ArticleObjectQueriesTestCase' class, this method is run and set up
+        the test data that all the tests will use.
+
+        This method creates two test users, a test article and a comment.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test users
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+        cls.user_2 = user_model.objects.create_user(
+            username='test_user_2',
+            password='test_pass',
+            email='test2@example.net',
+            age=81
+        )
+
+        # Test article
+        cls.article = Article.objects.create(
+            pk=1,
+            title='Test Article',
+            body='Test Body',
+            author=cls.user
+        )
+
+        # Test comment
+        Comment.objects.create(
+            comment='Test comment',
+            article=cls.article,
+            author=cls.user_2
+        )
+
+    def setUp(self):
+        """
+        It clears the cached template fragments before every test.
+        """
+        cache.clear()
+
+    def login(self, username='test_user'):
+        """
+        It logs in with one of the test users.
+
+        :param username: The username of the test user.
+        """
+        self.client.login(
+            username=username,
+            password='test_pass'
+        )
+
+    def assertArticleFetchedOnce(self, context):
+        """
+        It checks that the article was fetched with a single query.
+
+        :param context: The 'CaptureQueriesContext' of the request.
+        """
+        article_selects = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('SELECT')
+            and 'FROM "articles_article"' in query['sql']
+        ]
+        self.assertEqual(
+            first=len(article_selects),
+            second=1
+        )
+
+    def test_article_detail_get_queries(self):
+        """
+        Checks the queries of the article detail page: the session, the
+        user, the page validators (article modification date), the article
+        (with its author) and the comments (with their authors).
+        """
+        self.login()
+
+        with self.assertNumQueries(5):
+            response = self.client.get(path=self.ARTICLE_DETAIL_URL)
+
+        # Checks that the owner buttons are shown
+        self.assertContains(
+            response=response,
+            text=self.ARTICLE_UPDATE_URL
+        )
+
+    def test_article_detail_get_queries_not_owner(self):
+        """
+        Checks that the article detail page of another user's article runs
+        the same queries and doesn't show the owner buttons.
+        """
+        self.login(username='test_user_2')
+
+        with self.assertNumQueries(5):
+            response = self.client.get(path=self.ARTICLE_DETAIL_URL)
+
+        self.assertNotContains(
+            response=response,
+            text=self.ARTICLE_UPDATE_URL
+        )
+
+    def test_add_comment_queries(self):
+        """
+        Checks that the article is fetched only once when a comment is
+        added.
+        """
+        self.login()
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                path=self.ARTICLE_DETAIL_URL,
+                data={
+                    'comment': 'some valid comment'
+                }
+            )
+
+        self.assertEqual(
+            first=response.status_code,
+            second=302
+        )
+        self.assertArticleFetchedOnce(context)
+
+    def test_article_update_queries(self):
+        """
+        Checks the queries of the article update form (the session, the user
+        and the article) and that the article is fetched only once when the
+        form is submitted.
+        """
+        self.login()
+
+        with self.assertNumQueries(3):
+            self.client.get(path=self.ARTICLE_UPDATE_URL)
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(
+                path=self.ARTICLE_UPDATE_URL,
+                data={
+                    'title': 'Updated title',
+                    'body': 'Updated Body'
+                }
+            )
+        self.assertArticleFetchedOnce(context)
+
+    def test_article_update_queries_not_owner(self):
+        """
+        Checks that the ownership test of the article update view doesn't
+        run any additional query.
+        """
+        self.login(username='test_user_2')
+
+        with self.assertNumQueries(3):
+            response = self.client.get(path=self.ARTICLE_UPDATE_URL)
+
+        self.assertEqual(
+            first=response.status_code,
+            second=403
+        )
+
+    def test_article_delete_queries(self):
+        """
+        Checks the queries of the article delete confirmation (the session,
+        the user and the article) and that the article is fetched only once
+        when it is deleted.
+        """
+        self.login()
+
+        with self.assertNumQueries(3):
+            self.client.get(path=self.ARTICLE_DELETE_URL)
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(path=self.ARTICLE_DELETE_URL)
+        self.assertArticleFetchedOnce(context)
+        self.assertFalse(
+            expr=Article.objects.filter(pk=1).exists()
+        )
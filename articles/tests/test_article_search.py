@@ -0,0 +1,266 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from articles.models import Article
+from articles.search import get_search_backend
+from articles.tests.utils import TestUtils
+from articles.views import ArticleSearchView
+
+
+class ArticleSearchTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the
+    'ArticleSearchView' view and the article full-text search index.
+
+    These tests ensure that the matching articles are shown best matches
+    first, page by page, and that the index follows the article changes.
+    """
+    # URLs
+    ARTICLE_SEARCH_URL = reverse('article_search')
+
+    # Utility methods
+    utils = TestUtils()
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'ArticleSearchTestCase' class, this method is run and set up the
+        test data that all the tests will use.
+
+        This method creates a test user and several test articles.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test user
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+        # Test articles
+        cls.body_match = Article.objects.create(
+            title='City council news',
+            body='The budget for the new harbour was approved.',
+            author=cls.user
+        )
+        cls.title_match = Article.objects.create(
+            title='Harbour expansion approved',
+            body='The works will start next year.',
+            author=cls.user
+        )
+        cls.no_match = Article.objects.create(
+            title='Football results',
+            body='The local team won again.',
+            author=cls.user
+        )
+
+    def setUp(self):
+        """
+        It logs in with the test user before every test.
+        """
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+
+    def search(self, query, **params):
+        """
+        It sends a search request and returns the HTTP response.
+
+        :param query: The search query.
+        :param params: Additional query string parameters.
+        :return: The HTTP response.
+        """
+        return self.client.get(
+            path=self.ARTICLE_SEARCH_URL,
+            data={'q': query, **params}
+        )
+
+    def test_search_user_not_authenticated(self):
+        """
+        Checks that non-authenticated users are redirected to the login page.
+        """
+        self.client.logout()
+
+        # HTTP Response
+        response = self.client.get(
+            path=self.ARTICLE_SEARCH_URL,
+            follow=True
+        )
+
+        self.utils.check_login_redirect(
+            response=response,
+            target_url=self.ARTICLE_SEARCH_URL
+        )
+
+    def test_search_ranked_results(self):
+        """
+        Checks that only the matching articles are shown and that a match
+        in the title ranks above a match in the body.
+        """
+        # HTTP Response
+        response = self.search('harbour')
+
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
+        self.assertTemplateUsed(
+            response=response,
+            template_name='articles/article_search.html'
+        )
+        self.assertEqual(
+            first=response.context['article_list'],
+            second=[self.title_match, self.body_match]
+        )
+
+    def test_search_query_syntax_is_escaped(self):
+        """
+        Checks that the words of a query are searched literally, without
+        breaking the search.
+        """
+        # HTTP Response
+        response = self.search('harbour" (approved*')
+
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
+        self.assertEqual(
+            first=set(response.context['article_list']),
+            second={self.title_match, self.body_match}
+        )
+
+    def test_search_without_query(self):
+        """
+        Checks that the search page without a query shows no articles.
+        """
+        # HTTP Response
+        response = self.search('')
+
+        self.assertEqual(
+            first=response.context['article_list'],
+            second=[]
+        )
+
+    def test_search_pages(self):
+        """
+        Checks that the results are split into pages and that invalid page
+        numbers return an HTTP 404 (Not Found) status code.
+        """
+        Article.objects.bulk_create([
+            Article(
+                title=f'Harbour article {number}',
+                body='Test Body',
+                author=self.user
+            )
+            for number in range(ArticleSearchView.paginate_by)
+        ])
+        get_search_backend().rebuild()
+
+        # First page
+        response = self.search('harbour')
+        self.assertEqual(
+            first=len(response.context['article_list']),
+            second=ArticleSearchView.paginate_by
+        )
+        self.assertTrue(expr=response.context['has_next'])
+
+        # Second page
+        response = self.search('harbour', page=2)
+        self.assertEqual(
+            first=len(response.context['article_list']),
+            second=2
+        )
+        self.assertFalse(expr=response.context['has_next'])
+
+        # Invalid pages
+        for page in ('0', 'abc', ArticleSearchView.max_page + 1):
+            response = self.search('harbour', page=page)
+            self.assertEqual(
+                first=response.status_code,
+                second=404
+            )
+
+    def test_index_follows_article_changes(self):
+        """
+        Checks that updated and deleted articles are updated in (and removed
+        from) the search index.
+        """
+        # Updated article
+        self.no_match.body = 'The team will play at the harbour.'
+        self.no_match.save()
+        response = self.search('harbour team')
+        self.assertEqual(
+            first=response.context['article_list'],
+            second=[self.no_match]
+        )
+
+        # Deleted article
+        self.no_match.delete()
+        response = self.search('harbour team')
+        self.assertEqual(
+            first=response.context['article_list'],
+            second=[]
+        )
+
+    def test_index_skips_other_fields(self):
+        """
+        Checks that saves that change neither the title nor the body don't
+        update the search index.
+        """
+        backend = get_search_backend('default')
+        with mock.patch.object(backend, 'index_article') as index_article:
+            self.no_match.save(update_fields=['updated_at'])
+            index_article.assert_not_called()
+
+            self.no_match.save(update_fields=['title'])
+            index_article.assert_called_once_with(self.no_match)
+
+    @override_settings(
+        ARTICLE_SEARCH_BACKEND='articles.search.backends.BaseSearchBackend'
+    )
+    def test_search_without_backend(self):
+        """
+        Checks that the articles are searched without an index (newest
+        first) on the database vendors without a search backend.
+        """
+        response = self.search('harbour')
+
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
+        self.assertEqual(
+            first=response.context['article_list'],
+            second=[self.title_match, self.body_match]
+        )
+
+    def test_rebuild_search_index_command(self):
+        """
+        Checks that the 'rebuild_search_index' command indexes the articles
+        that are not in the index.
+        """
+        if connection.vendor != 'sqlite':
+            self.skipTest('The index is maintained by the database.')
+
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM articles_article_fts')
+
+        call_command('rebuild_search_index', stdout=StringIO())
+
+        response = self.search('football')
+        self.assertEqual(
+            first=response.context['article_list'],
+            second=[self.no_match]
+        )
@@ -0,0 +1,157 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from articles.models import Article
+from articles.sitemaps import get_sitemap_shard
+
+
+@override_settings(ARTICLE_SITEMAP_SHARD_SIZE=2)
+class ArticleSitemapTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the sharded
+    article sitemaps.
+
+    These tests ensure that the sitemap index lists a sitemap for every
+    shard, that every shard lists the URLs of its articles, and that the
+    shards are served from the cache until one of their articles changes.
+    """
+    # URLs
+    SITEMAP_INDEX_URL = reverse('article_sitemap_index')
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'ArticleSitemapTestCase' class, this method is run and set up the
+        test data that all the tests will use.
+
+        This method creates a test user and test articles.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test user
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+        # Test articles
+        cls.articles = [
+            Article.objects.create(
+                title=f'Test Article {number}',
+                body=f'Test Body {number}',
+                author=cls.user
+            )
+            for number in range(3)
+        ]
+
+    def setUp(self):
+        """
+        It empties the cache (which stores the sitemaps) before every test.
+        """
+        cache.clear()
+
+    def get_shard_url(self, article):
+        """
+        It returns the URL of the sitemap shard of an article.
+
+        :param article: The article.
+        :return: The sitemap URL.
+        """
+        return reverse(
+            viewname='article_sitemap',
+            kwargs={
+                'shard': get_sitemap_shard(article.pk)
+            }
+        )
+
+    def test_sitemap_index(self):
+        """
+        Checks that the sitemap index lists the sitemap of every shard.
+        """
+        # HTTP Response
+        response = self.client.get(path=self.SITEMAP_INDEX_URL)
+
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
+        self.assertEqual(
+            first=response['Content-Type'],
+            second='application/xml'
+        )
+        last_shard = get_sitemap_shard(self.articles[-1].pk)
+        for shard in range(last_shard + 1):
+            self.assertContains(
+                response=response,
+                text=f'http://testserver/sitemap-articles-{shard}.xml'
+            )
+        self.assertNotContains(
+            response=response,
+            text=f'sitemap-articles-{last_shard + 1}.xml'
+        )
+
+    def test_sitemap_shards(self):
+        """
+        Checks that every shard lists the URLs of its articles only and that
+        unknown shards return an HTTP 404 (Not Found) status code.
+        """
+        for article in self.articles:
+            response = self.client.get(path=self.get_shard_url(article))
+            self.assertContains(
+                response=response,
+                text=f'http://testserver{article.get_absolute_url()}</loc>'
+            )
+            for other_article in self.articles:
+                if get_sitemap_shard(other_article.pk) != get_sitemap_shard(
+                        article.pk):
+                    self.assertNotContains(
+                        response=response,
+                        text=f'{other_article.get_absolute_url()}</loc>'
+                    )
+
+        # Unknown shard
+        response = self.client.get(
+            path=reverse(
+                viewname='article_sitemap',
+                kwargs={
+                    'shard': get_sitemap_shard(self.articles[-1].pk) + 1
+                }
+            )
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=404
+        )
+
+    def test_sitemap_shards_regenerated_on_change(self):
+        """
+        Checks that the shards are served from the cache and that only the
+        shard of a changed article is regenerated.
+        """
+        first_url = self.get_shard_url(self.articles[0])
+        last_url = self.get_shard_url(self.articles[-1])
+        self.client.get(path=first_url)
+        self.client.get(path=last_url)
+
+        with self.assertNumQueries(0):
+            self.client.get(path=first_url)
+            self.client.get(path=self.SITEMAP_INDEX_URL)
+            self.client.get(path=self.SITEMAP_INDEX_URL)
+
+        # Change to an article of the last shard
+        deleted_url = self.articles[-1].get_absolute_url()
+        self.articles[-1].delete()
+
+        with self.assertNumQueries(0):
+            self.client.get(path=first_url)
+        response = self.client.get(path=last_url)
+        self.assertNotContains(
+            response=response,
+            text=f'{deleted_url}</loc>'
+        )
@@ -0,0 +1,187 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from articles.models import Article
+
+
+class ArticleSummaryTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the summary
+    fields (excerpt, word count and reading time) of the 'Article' model.
+
+    These tests ensure that the summary fields are kept up to date when an
+    article is saved, that the article list shows the excerpt instead of the
+    full body, and that the 'backfill_article_summaries' command fills the
+    summary fields of existing articles.
+    """
+    # URLs
+    ARTICLE_LIST_URL = reverse('article_list')
+    ARTICLE_UPDATE_URL = reverse(
+        viewname='article_edit',
+        kwargs={
+            'pk': 1
+        }
+    )
+
+    # Test data
+    LONG_BODY = ' '.join(f'word{number}' for number in range(450))
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'ArticleSummaryTestCase' class, this method is run and set up the
+        test data that all the tests will use.
+
+        This method creates a test user and a test article with a long body.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test user
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+        # Test article
+        cls.test_article = Article.objects.create(
+            pk=1,
+            title='Test Article',
+            body=cls.LONG_BODY,
+            author=cls.user
+        )
+
+    def test_summary_fields_on_create(self):
+        """
+        Checks that the summary fields are computed when an article is
+        created.
+        """
+        article = Article.objects.get(pk=1)
+
+        self.assertEqual(
+            first=article.word_count,
+            second=450
+        )
+        self.assertEqual(
+            first=article.reading_time,
+            second=3
+        )
+        self.assertLessEqual(
+            a=len(article.excerpt),
+            b=Article.EXCERPT_LENGTH
+        )
+        self.assertTrue(
+            expr=self.LONG_BODY.startswith(article.excerpt.rstrip('…'))
+        )
+
+    def test_summary_fields_on_update_fields_save(self):
+        """
+        Checks that the summary fields are saved when only the body of an
+        article is saved (via the 'update_fields' argument).
+        """
+        self.test_article.body = 'Short body'
+        self.test_article.save(update_fields=['body'])
+
+        article = Article.objects.get(pk=1)
+        self.assertEqual(
+            first=article.excerpt,
+            second='Short body'
+        )
+        self.assertEqual(
+            first=article.word_count,
+            second=2
+        )
+        self.assertEqual(
+            first=article.reading_time,
+            second=1
+        )
+
+    def test_summary_fields_on_article_update_view(self):
+        """
+        Checks that the summary fields are updated when an article is edited
+        through the 'ArticleUpdateView' view.
+        """
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+
+        # HTTP Response
+        self.client.post(
+            path=self.ARTICLE_UPDATE_URL,
+            data={
+                'title': 'Updated title',
+                'body': 'Updated   body\nwith new lines'
+            }
+        )
+
+        article = Article.objects.get(pk=1)
+        self.assertEqual(
+            first=article.excerpt,
+            second='Updated body with new lines'
+        )
+        self.assertEqual(
+            first=article.word_count,
+            second=5
+        )
+
+    def test_article_list_shows_excerpt(self):
+        """
+        Checks that the article list shows the article excerpt instead of the
+        full article body.
+        """
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+
+        # HTTP Response
+        response = self.client.get(path=self.ARTICLE_LIST_URL)
+
+        self.assertContains(
+            response=response,
+            text=self.test_article.excerpt
+        )
+        self.assertNotContains(
+            response=response,
+            text=self.LONG_BODY
+        )
+
+    def test_backfill_article_summaries_command(self):
+        """
+        Checks that the 'backfill_article_summaries' command computes the
+        summary fields of the articles that don't have them.
+        """
+        # Clears the summary fields (as in rows created before the fields)
+        Article.objects.update(
+            excerpt='',
+            word_count=0,
+            reading_time=0
+        )
+
+        call_command(
+            'backfill_article_summaries',
+            batch_size=1,
+            stdout=StringIO()
+        )
+
+        article = Article.objects.get(pk=1)
+        self.assertEqual(
+            first=article.word_count,
+            second=450
+        )
+        self.assertEqual(
+            first=article.reading_time,
+            second=3
+        )
+        self.assertNotEqual(
+            first=article.excerpt,
+            second=''
+        )
@@ -0,0 +1,246 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.urls import reverse
+
+from articles.models import Article
+from articles.tests.utils import TestUtils
+from articles.views import AuthorArticleListView
+
+
+class AuthorArticleListTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the
+    'AuthorArticleListView' view.
+
+    These tests ensure that only the articles of the requested author are
+    shown, page by page, and that the cached number of articles of the
+    author is kept up to date.
+    """
+    # Number of articles on each page
+    PAGE_SIZE = AuthorArticleListView.paginate_by
+
+    # Utility methods
+    utils = TestUtils()
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'AuthorArticleListTestCase' class, this method is run and set up the
+        test data that all the tests will use.
+
+        This method creates two test users, more articles of the first one
+        than fit in a page and a few articles of the second one.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test users
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+        cls.other_user = user_model.objects.create_user(
+            username='other_user',
+            password='test_pass',
+            email='other@example.net',
+            age=25
+        )
+
+        # Test articles
+        Article.objects.bulk_create([
+            Article(
+                title=f'Test Article {number}',
+                body=f'Test Body {number}',
+                author=cls.user
+            )
+            for number in range(cls.PAGE_SIZE + 1)
+        ])
+        Article.objects.bulk_create([
+            Article(
+                title=f'Other Article {number}',
+                body=f'Other Body {number}',
+                author=cls.other_user
+            )
+            for number in range(3)
+        ])
+
+        # URLs
+        cls.AUTHOR_ARTICLE_LIST_URL = reverse(
+            viewname='author_article_list',
+            kwargs={
+                'username': cls.user.username
+            }
+        )
+
+        # Expected order (newest first)
+        cls.ordered_articles = list(
+            Article.objects.filter(author=cls.user).order_by('-date', '-id')
+        )
+
+    def setUp(self):
+        """
+        It logs in with the test user and empties the cache (which stores
+        the article counts) before every test.
+        """
+        cache.clear()
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+
+    def test_author_article_list_user_not_authenticated(self):
+        """
+        Checks that non-authenticated users are redirected to the login page.
+        """
+        self.client.logout()
+
+        # HTTP Response
+        response = self.client.get(
+            path=self.AUTHOR_ARTICLE_LIST_URL,
+            follow=True
+        )
+
+        self.utils.check_login_redirect(
+            response=response,
+            target_url=self.AUTHOR_ARTICLE_LIST_URL
+        )
+
+    def test_author_article_list_pages(self):
+        """
+        Checks that only the articles of the author are shown, newest first
+        and page by page, together with the number of articles.
+        """
+        # First page
+        response = self.client.get(path=self.AUTHOR_ARTICLE_LIST_URL)
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
+        self.assertTemplateUsed(
+            response=response,
+            template_name='articles/author_article_list.html'
+        )
+        self.assertEqual(
+            first=list(response.context['article_list']),
+            second=self.ordered_articles[:self.PAGE_SIZE]
+        )
+        self.assertEqual(
+            first=response.context['article_count'],
+            second=self.PAGE_SIZE + 1
+        )
+        self.assertContains(
+            response=response,
+            text=f'{self.PAGE_SIZE + 1} articles'
+        )
+
+        # Second page
+        response = self.client.get(
+            path=self.AUTHOR_ARTICLE_LIST_URL,
+            data={'cursor': response.context['page_obj'].next_cursor}
+        )
+        self.assertEqual(
+            first=list(response.context['article_list']),
+            second=self.ordered_articles[self.PAGE_SIZE:]
+        )
+
+    def test_author_article_list_unknown_author(self):
+        """
+        Checks that the page of an unknown author returns an HTTP 404 (Not
+        Found) status code.
+        """
+        # HTTP Response
+        response = self.client.get(
+            path=reverse(
+                viewname='author_article_list',
+                kwargs={
+                    'username': 'unknown_user'
+                }
+            )
+        )
+
+        self.assertEqual(
+            first=response.status_code,
+            second=404
+        )
+
+    def test_author_article_list_query_count(self):
+        """
+        Checks that the number of queries needed to render a page doesn't
+        depend on the number of articles on it and that the number of
+        articles is only counted once.
+
+        The expected queries are the session and user lookups of the
+        authenticated user, the author lookup and the articles query (plus
+        the count query the first time).
+        """
+        with self.assertNumQueries(5):
+            self.client.get(path=self.AUTHOR_ARTICLE_LIST_URL)
+
+        with self.assertNumQueries(4):
+            self.client.get(path=self.AUTHOR_ARTICLE_LIST_URL)
+
+    def test_author_article_count_invalidation(self):
+        """
+        Checks that the cached number of articles is updated when an article
+        of the author is created or deleted.
+        """
+        self.client.get(path=self.AUTHOR_ARTICLE_LIST_URL)
+
+        # New article
+        with self.captureOnCommitCallbacks(execute=True):
+            article = Article.objects.create(
+                title='New Article',
+                body='New Body',
+                author=self.user
+            )
+        response = self.client.get(path=self.AUTHOR_ARTICLE_LIST_URL)
+        self.assertEqual(
+            first=response.context['article_count'],
+            second=self.PAGE_SIZE + 2
+        )
+
+        # Deleted article
+        with self.captureOnCommitCallbacks(execute=True):
+            article.delete()
+        response = self.client.get(path=self.AUTHOR_ARTICLE_LIST_URL)
+        self.assertEqual(
+            first=response.context['article_count'],
+            second=self.PAGE_SIZE + 1
+        )
+
+    def test_author_article_count_invalidated_after_commit(self):
+        """
+        Checks that the cached number of articles is only invalidated once
+        the transaction that changes it is committed, and not at all if it
+        is rolled back.
+        """
+        with mock.patch(
+            'articles.signals.invalidate_author_article_count'
+        ) as invalidate:
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                Article.objects.create(
+                    title='New Article',
+                    body='New Body',
+                    author=self.user
+                )
+                raise IntegrityError('Rolled back')
+            invalidate.assert_not_called()
+
+            with self.captureOnCommitCallbacks() as callbacks:
+                Article.objects.create(
+                    title='New Article',
+                    body='New Body',
+                    author=self.user
+                )
+            invalidate.assert_not_called()
+
+            for callback in callbacks:
+                callback()
+            invalidate.assert_called_once_with(self.user.pk)
@@ -0,0 +1,238 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from articles.models import Article, Comment
+
+
+class CommentCountTestCase(TestCase):
+    """
+    A Django 'TestCase' subclass that contains unit tests for the comment
+    counter of the 'Article' model.
+
+    These tests ensure that the counter is updated when comments are
+    created, moved or deleted, and that the 'reconcile_comment_counts'
+    command fixes counters that have drifted.
+    """
+    # URLs
+    ARTICLE_DETAIL_URL = reverse(
+        'article_detail',
+        kwargs={
+            'pk': 1
+        }
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Before the execution of all test methods in the
+        'CommentCountTestCase' class, this method is run and set up the test
+        data that all the tests will use.
+
+        This method creates a test user and two test articles.
+        """
+        # Project custom user model
+        user_model = get_user_model()
+
+        # Test user
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+        # Test articles
+        cls.article = Article.objects.create(
+            pk=1,
+            title='Test Article',
+            body='Test Body',
+            author=cls.user
+        )
+        cls.other_article = Article.objects.create(
+            pk=2,
+            title='Other Article',
+            body='Other Body',
+            author=cls.user
+        )
+
+    def get_comment_count(self, article):
+        """
+        It returns the comment counter of an article stored in the database.
+
+        :param article: The article.
+        :return: The comment counter.
+        """
+        article.refresh_from_db(fields=['comment_count'])
+        return article.comment_count
+
+    def test_comment_count_on_comment_view(self):
+        """
+        Checks that the counter is increased when a comment is added through
+        the 'ArticleDetailView' view.
+        """
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+
+        # HTTP Response
+        self.client.post(
+            path=self.ARTICLE_DETAIL_URL,
+            data={
+                'comment': 'some valid comment'
+            }
+        )
+
+        self.assertEqual(
+            first=self.get_comment_count(self.article),
+            second=1
+        )
+
+    def test_comment_count_on_delete(self):
+        """
+        Checks that the counter is decreased when comments are deleted, one
+        by one or in bulk (as the admin does).
+        """
+        comments = [
+            Comment.objects.create(
+                comment=f'Comment {number}',
+                article=self.article,
+                author=self.user
+            )
+            for number in range(3)
+        ]
+        self.assertEqual(
+            first=self.get_comment_count(self.article),
+            second=3
+        )
+
+        # Single comment deletion
+        comments[0].delete()
+        self.assertEqual(
+            first=self.get_comment_count(self.article),
+            second=2
+        )
+
+        # Bulk deletion
+        Comment.objects.filter(article=self.article).delete()
+        self.assertEqual(
+            first=self.get_comment_count(self.article),
+            second=0
+        )
+
+    def test_comment_count_on_article_delete(self):
+        """
+        Checks that deleting an article doesn't update its counter once per
+        comment deleted in cascade: the number of queries doesn't depend on
+        the number of comments.
+        """
+        queries = []
+        for article, comments in [(self.article, 1), (self.other_article, 20)]:
+            Comment.objects.bulk_create([
+                Comment(
+                    comment=f'Comment {number}',
+                    article=article,
+                    author=self.user
+                )
+                for number in range(comments)
+            ])
+            with CaptureQueriesContext(connection) as context:
+                article.delete()
+            queries.append(context.captured_queries)
+
+        self.assertEqual(
+            first=len(queries[1]),
+            second=len(queries[0])
+        )
+        self.assertFalse(
+            any(
+                query['sql'].startswith('UPDATE "articles_article"')
+                for query in queries[1]
+            )
+        )
+        self.assertFalse(Comment.objects.exists())
+
+    def test_comment_count_on_stale_article_save(self):
+        """
+        Checks that saving an article loaded before a comment was added
+        doesn't write its stale counter back to the database.
+        """
+        article = Article.objects.get(pk=1)
+        Comment.objects.create(
+            comment='New comment',
+            article=self.article,
+            author=self.user
+        )
+
+        article.title = 'New Title'
+        article.save()
+
+        self.assertEqual(
+            first=self.get_comment_count(self.article),
+            second=1
+        )
+        self.article.refresh_from_db(fields=['title'])
+        self.assertEqual(
+            first=self.article.title,
+            second='New Title'
+        )
+
+    def test_comment_count_on_article_change(self):
+        """
+        Checks that both counters are updated when a comment is moved to
+        another article.
+        """
+        comment = Comment.objects.create(
+            comment='Moved comment',
+            article=self.article,
+            author=self.user
+        )
+
+        comment = Comment.objects.get(pk=comment.pk)
+        comment.article = self.other_article
+        comment.save()
+
+        self.assertEqual(
+            first=self.get_comment_count(self.article),
+            second=0
+        )
+        self.assertEqual(
+            first=self.get_comment_count(self.other_article),
+            second=1
+        )
+
+    def test_reconcile_comment_counts_command(self):
+        """
+        Checks that the 'reconcile_comment_counts' command fixes the counters
+        that don't match the number of comments.
+        """
+        Comment.objects.create(
+            comment='Some comment',
+            article=self.article,
+            author=self.user
+        )
+
+        # Counters drift (e.g. after a manual database change)
+        Article.objects.filter(pk=1).update(comment_count=5)
+        Article.objects.filter(pk=2).update(comment_count=2)
+
+        call_command(
+            'reconcile_comment_counts',
+            batch_size=1,
+            stdout=StringIO()
+        )
+
+        self.assertEqual(
+            first=self.get_comment_count(self.article),
+            second=1
+        )
+        self.assertEqual(
+            first=self.get_comment_count(self.other_article),
+            second=0
+        )
@@ -1,7 +1,15 @@
 from django.urls import path
 
+from articles.async_views import AsyncArticleListView, \
+    AsyncArticleDetailView
+from articles.feeds import LatestArticlesFeed, LatestArticlesAtomFeed, \
+    AuthorArticlesFeed, AuthorArticlesAtomFeed
+
 from articles.views import ArticleListView, ArticleDetailView, \
-    ArticleCreateView, ArticleUpdateView, ArticleDeleteView
+    ArticleCreateView, ArticleUpdateView, ArticleDeleteView, \
+    ArticleSearchView, ArticleAutocompleteView, AuthorArticleListView, \
+    ArticleArchiveView, ArticleYearArchiveView, ArticleMonthArchiveView, \
+    ArticleDayArchiveView, ArticleExportView, ArticleCommentCreateView
 
 urlpatterns = [
     path(
@@ -9,11 +17,86 @@ urlpatterns = [
         view=ArticleListView.as_view(),
         name='article_list'
     ),
+    path(
+        route='feed/',
+        view=LatestArticlesFeed(),
+        name='article_feed'
+    ),
+    path(
+        route='atom/',
+        view=LatestArticlesAtomFeed(),
+        name='article_atom_feed'
+    ),
+    path(
+        route='by/<str:username>/feed/',
+        view=AuthorArticlesFeed(),
+        name='author_article_feed'
+    ),
+    path(
+        route='by/<str:username>/atom/',
+        view=AuthorArticlesAtomFeed(),
+        name='author_article_atom_feed'
+    ),
+    path(
+        route='by/<str:username>/',
+        view=AuthorArticleListView.as_view(),
+        name='author_article_list'
+    ),
+    path(
+        route='archive/',
+        view=ArticleArchiveView.as_view(),
+        name='article_archive'
+    ),
+    path(
+        route='archive/<int:year>/',
+        view=ArticleYearArchiveView.as_view(),
+        name='article_year_archive'
+    ),
+    path(
+        route='archive/<int:year>/<int:month>/',
+        view=ArticleMonthArchiveView.as_view(),
+        name='article_month_archive'
+    ),
+    path(
+        route='archive/<int:year>/<int:month>/<int:day>/',
+        view=ArticleDayArchiveView.as_view(),
+        name='article_day_archive'
+    ),
+    path(
+        route='export/<slug:dataset>.<slug:format>.gz',
+        view=ArticleExportView.as_view(),
+        name='article_export'
+    ),
+    path(
+        route='search/',
+        view=ArticleSearchView.as_view(),
+        name='article_search'
+    ),
+    path(
+        route='autocomplete/',
+        view=ArticleAutocompleteView.as_view(),
+        name='article_autocomplete'
+    ),
     path(
         route='details/<int:pk>',
         view=ArticleDetailView.as_view(),
         name='article_detail'
     ),
+    path(
+        route='details/<int:pk>/comments/',
+        view=ArticleCommentCreateView.as_view(),
+        name='article_comment_create'
+    ),
+    path(
+        route='async/',
+        view=AsyncArticleListView.as_view(),
+        name='article_list_async'
+    ),
+    path(
+        route='async/details/<int:pk>',
+        view=AsyncArticleDetailView.as_view(),
+        name='article_detail_async'
+    ),
     path(
         route='new/',
         view=ArticleCreateView.as_view(),
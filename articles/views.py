@@ -1,15 +1,94 @@
+import datetime
+import json
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.db.models import BooleanField, ExpressionWrapper, Q, Value
+from django.contrib.sitemaps.views import SitemapIndexItem, sitemap
+from django.core.cache import cache
+from django.http import Http404, HttpResponse, JsonResponse, \
+    StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.template.response import TemplateResponse
 from django.urls import reverse, reverse_lazy
+from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
 from django.views import View
 from django.views.generic import ListView, DetailView, FormView, CreateView, \
-    UpdateView, DeleteView
+    UpdateView, DeleteView, TemplateView
 from django.views.generic.detail import SingleObjectMixin
 
+from articles.cache import comments_fragment_vary_on, get_archive_months, \
+    get_article_version, get_author_article_count, get_cache_version
+from articles.conditional import ConditionalGetMixin, \
+    get_user_validator_parts, make_etag
+from articles.export import EXPORT_DATASETS, EXPORT_FORMATS, iter_export
 from articles.forms import CommentForm
-from articles.models import Article
+from articles.models import Article, Comment
+from articles.pagination import InvalidCursor, KeysetPaginationMixin, \
+    KeysetPaginator
+from articles.search import get_search_backend
+from articles.sitemaps import SITEMAP_INDEX_VERSION_KEY, \
+    ArticleShardSitemap, get_sitemap_shard_count, sitemap_shard_version_key
+from articles.search.autocomplete import title_index
+from newspaper.db.mixins import ReplicaReadMixin
+
+# Article fields shown by the article cards
+ARTICLE_CARD_FIELDS = (
+    'title',
+    'excerpt',
+    'reading_time',
+    'comment_count',
+    'date',
+    'author__username'
+)
+
+
+def annotate_is_owner(queryset, user):
+    """
+    It adds the author and an 'is_owner' flag to an articles queryset. The
+    flag is computed inside the query by comparing the 'author_id' of every
+    article with the id of a user.
+
+    :param queryset: The articles queryset.
+    :param user: The current user (it may be anonymous).
+    :return: The annotated queryset.
+    """
+    if user.pk is None:
+        is_owner = Value(False)
+    else:
+        is_owner = ExpressionWrapper(
+            Q(author_id=user.pk),
+            output_field=BooleanField()
+        )
+    return queryset.select_related('author').annotate(is_owner=is_owner)
+
 
+def get_comments_paginator(article_id, per_page):
+    """
+    It returns a paginator over the comments of an article, newest first,
+    together with their authors (it uses the '(article, created_at, id)'
+    index).
 
-class ArticleListView(LoginRequiredMixin, ListView):
+    :param article_id: The id of the article.
+    :param per_page: The number of comments on each page.
+    :return: A 'KeysetPaginator' object.
+    """
+    return KeysetPaginator(
+        queryset=(
+            Comment.objects
+            .filter(article_id=article_id)
+            .select_related('author')
+            .only('comment', 'created_at', 'article_id', 'author__username')
+        ),
+        per_page=per_page,
+        keys=('created_at', 'id')
+    )
+
+
+class ArticleListView(LoginRequiredMixin, ReplicaReadMixin,
+                      ConditionalGetMixin, KeysetPaginationMixin, ListView):
     """
     A class-based view in Django that displays a list of "Article" objects.
 
@@ -17,15 +96,690 @@ class ArticleListView(LoginRequiredMixin, ListView):
     mixin) and uses the template "article_list.html" to render the list of
     articles.
 
+    The articles are shown newest first and split into pages with keyset
+    pagination (via the "KeysetPaginationMixin" mixin), so every page costs
+    the same regardless of its position and no 'COUNT(*)' query is run.
+
+    Conditional GET requests are answered with an ETag computed from the
+    ids and modification dates of the page articles (via the
+    "ConditionalGetMixin" mixin).
+
+    The articles are read from the database replicas, if any (via the
+    "ReplicaReadMixin" mixin).
+
     Attributes:
         model: The model that the view is using.
         template_name: The template name used to render the view.
+        paginate_by: The number of articles on each page.
     """
     model = Article
     template_name = 'articles/article_list.html'
+    paginate_by = 12
+
+    def get_queryset(self):
+        """
+        It returns the articles queryset used by the view.
+
+        The authors are fetched in the same query (with a SQL join) and only
+        the columns shown in the article cards are loaded, so the page is
+        rendered with a constant number of queries.
+
+        :return: The articles queryset.
+        """
+        queryset = super().get_queryset()
+        return queryset.select_related('author').only(*ARTICLE_CARD_FIELDS)
 
+    def get_etag(self, request, *args, **kwargs):
+        """
+        It returns the ETag of the requested page of articles.
+
+        The ETag is computed from the ids and modification dates of the
+        articles on the page, fetched with a narrow query over the same
+        index used by the pagination. There is no 'Last-Modified' validator
+        because it couldn't reflect the articles removed from the page.
 
-class ArticleDetailGet(DetailView):
+        :param request: The incoming GET request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The ETag, or None if the page cursor is invalid.
+        """
+        paginator = KeysetPaginator(
+            queryset=Article.objects.only('id', 'date', 'updated_at'),
+            per_page=self.paginate_by,
+            keys=self.keyset_keys
+        )
+        try:
+            page = paginator.page(request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            return None
+        return make_etag(
+            *get_user_validator_parts(request.user),
+            *[(article.pk, article.updated_at) for article in page],
+            page.has_next,
+            page.has_previous
+        )
+
+
+class AuthorArticleListView(LoginRequiredMixin, KeysetPaginationMixin,
+                            ListView):
+    """
+    A class-based view in Django that displays the articles of an author.
+
+    This view requires the user to be logged in (via the "LoginRequiredMixin"
+    mixin) and uses the template "author_article_list.html" to render the
+    list of articles.
+
+    The articles are shown newest first and split into pages with keyset
+    pagination (via the "KeysetPaginationMixin" mixin) over the
+    '(author, date, id)' index, so the pages of prolific authors cost the
+    same as the first one. The number of articles of the author is cached
+    (see 'articles.cache').
+
+    Attributes:
+        model: The model that the view is using.
+        template_name: The template name used to render the view.
+        paginate_by: The number of articles on each page.
+    """
+    model = Article
+    template_name = 'articles/author_article_list.html'
+    paginate_by = 12
+
+    def get_author(self):
+        """
+        It returns the author whose username is in the URL.
+
+        :return: The author.
+        :raise Http404: If there is no user with the username.
+        """
+        if not hasattr(self, '_author'):
+            self._author = get_object_or_404(
+                get_user_model().objects.only('id', 'username'),
+                username=self.kwargs['username']
+            )
+        return self._author
+
+    def get_queryset(self):
+        """
+        It returns the articles of the author.
+
+        The author is already known, so the articles are fetched without
+        joining the users table and only the columns shown in the article
+        cards are loaded.
+
+        :return: The articles queryset.
+        """
+        author = self.get_author()
+        queryset = super().get_queryset().filter(author=author)
+        return queryset.only(
+            *[
+                field for field in ARTICLE_CARD_FIELDS
+                if not field.startswith('author__')
+            ],
+            'author_id'
+        )
+
+    def get_context_data(self, **kwargs):
+        """
+        This method adds the author and its number of articles to the
+        context data passed to the template when rendering the view.
+
+        The author of every article is set to the same author object, so
+        rendering the article cards doesn't query the users table.
+
+        :param kwargs: Additional keywords arguments.
+        :return: This method returns a dictionary with the context data used
+            in the template rendering.
+        """
+        context = super().get_context_data(**kwargs)
+        author = self.get_author()
+        for article in context['article_list']:
+            article.author = author
+        context['author'] = author
+        context['article_count'] = get_author_article_count(author.pk)
+        return context
+
+
+class ArchiveNavigationMixin:
+    """
+    A mixin for class-based views that adds the archive navigation (the
+    months that have articles, grouped by year) to the context data.
+
+    The navigation is built from the cached monthly article counters (see
+    the 'ArticleArchiveMonth' model), so the articles are never counted
+    when a page is rendered.
+    """
+
+    def get_archive_years(self):
+        """
+        It returns the years and months that have articles, newest first.
+
+        :return: A list of dictionaries with the year, its number of
+            articles and its months (with their first day and number of
+            articles).
+        """
+        years = []
+        for year, month, article_count in get_archive_months():
+            if not years or years[-1]['year'] != year:
+                years.append({
+                    'year': year,
+                    'article_count': 0,
+                    'months': []
+                })
+            years[-1]['article_count'] += article_count
+            years[-1]['months'].append({
+                'date': datetime.date(year, month, 1),
+                'article_count': article_count
+            })
+        return years
+
+    def get_context_data(self, **kwargs):
+        """
+        This method adds the archive navigation to the context data passed
+        to the template when rendering the view.
+
+        :param kwargs: Additional keywords arguments.
+        :return: This method returns a dictionary with the context data used
+            in the template rendering.
+        """
+        context = super().get_context_data(**kwargs)
+        context['archive_years'] = self.get_archive_years()
+        return context
+
+
+class ArticleArchiveView(LoginRequiredMixin, ArchiveNavigationMixin,
+                         TemplateView):
+    """
+    A class-based view in Django that displays the archive navigation, the
+    entry point of the year, month and day archive pages.
+
+    This view requires the user to be logged in (via the "LoginRequiredMixin"
+    mixin) and uses the template "article_archive_index.html".
+
+    Attributes:
+        template_name: The template name used to render the view.
+    """
+    template_name = 'articles/article_archive_index.html'
+
+
+class ArticleDateArchiveMixin(LoginRequiredMixin, ArchiveNavigationMixin,
+                              KeysetPaginationMixin):
+    """
+    A mixin for the archive views that display the articles published in a
+    period (a year, month or day of the project time zone).
+
+    The articles are fetched with a date range condition over the
+    '(date, id)' index and split into pages with keyset pagination, so the
+    pages of busy periods cost the same as the first one. Invalid dates
+    result in an HTTP 404 response.
+
+    Subclasses define the period by implementing the 'get_period' method.
+
+    Attributes:
+        model: The model that the view is using.
+        template_name: The template name used to render the view.
+        paginate_by: The number of articles on each page.
+        date_format: The format of the period shown as the page title.
+    """
+    model = Article
+    template_name = 'articles/article_archive.html'
+    paginate_by = 12
+    date_format = None
+
+    def get_period(self):
+        """
+        It returns the first day of the period and the first day of the next
+        period.
+
+        :return: A tuple with two 'date' objects.
+        """
+        raise NotImplementedError(
+            'Subclasses of ArticleDateArchiveMixin must provide a '
+            'get_period() method.'
+        )
+
+    def get_date_range(self):
+        """
+        It returns the start (included) and the end (excluded) of the period
+        in the project time zone.
+
+        :return: A tuple with two aware 'datetime' objects.
+        :raise Http404: If the date in the URL is invalid.
+        """
+        try:
+            start, end = self.get_period()
+        except (ValueError, OverflowError):
+            raise Http404('Invalid date.')
+        tzinfo = timezone.get_default_timezone()
+        return tuple(
+            timezone.make_aware(
+                datetime.datetime.combine(day, datetime.time.min),
+                tzinfo
+            )
+            for day in (start, end)
+        )
+
+    def get_queryset(self):
+        """
+        It returns the articles published in the period.
+
+        The authors are fetched in the same query (with a SQL join) and only
+        the columns shown in the article cards are loaded.
+
+        :return: The articles queryset.
+        """
+        start, end = self.get_date_range()
+        queryset = super().get_queryset().filter(date__gte=start, date__lt=end)
+        return queryset.select_related('author').only(*ARTICLE_CARD_FIELDS)
+
+    def get_context_data(self, **kwargs):
+        """
+        This method adds the period to the context data passed to the
+        template when rendering the view.
+
+        :param kwargs: Additional keywords arguments.
+        :return: This method returns a dictionary with the context data used
+            in the template rendering.
+        """
+        context = super().get_context_data(**kwargs)
+        context['period_start'] = self.get_period()[0]
+        context['date_format'] = self.date_format
+        return context
+
+
+class ArticleYearArchiveView(ArticleDateArchiveMixin, ListView):
+    """
+    A class-based view in Django that displays the articles published in a
+    year (via the "ArticleDateArchiveMixin" mixin).
+    """
+    date_format = 'Y'
+
+    def get_period(self):
+        """
+        It returns the first day of the year and of the next year.
+
+        :return: A tuple with two 'date' objects.
+        """
+        year = self.kwargs['year']
+        return datetime.date(year, 1, 1), datetime.date(year + 1, 1, 1)
+
+
+class ArticleMonthArchiveView(ArticleDateArchiveMixin, ListView):
+    """
+    A class-based view in Django that displays the articles published in a
+    month (via the "ArticleDateArchiveMixin" mixin).
+    """
+    date_format = 'F Y'
+
+    def get_period(self):
+        """
+        It returns the first day of the month and of the next month.
+
+        :return: A tuple with two 'date' objects.
+        """
+        start = datetime.date(self.kwargs['year'], self.kwargs['month'], 1)
+        end = (start + datetime.timedelta(days=31)).replace(day=1)
+        return start, end
+
+
+class ArticleDayArchiveView(ArticleDateArchiveMixin, ListView):
+    """
+    A class-based view in Django that displays the articles published in a
+    day (via the "ArticleDateArchiveMixin" mixin).
+    """
+    date_format = 'F j, Y'
+
+    def get_period(self):
+        """
+        It returns the day and the next day.
+
+        :return: A tuple with two 'date' objects.
+        """
+        start = datetime.date(
+            self.kwargs['year'],
+            self.kwargs['month'],
+            self.kwargs['day']
+        )
+        return start, start + datetime.timedelta(days=1)
+
+
+class ArticleSearchView(LoginRequiredMixin, ListView):
+    """
+    A class-based view in Django that displays the articles that match a
+    full-text search query, best matches first.
+
+    This view requires the user to be logged in (via the "LoginRequiredMixin"
+    mixin). The matches are found by the search backend of the database
+    (see the 'articles.search' package), page by page, and only the
+    articles of the requested page are fetched from the articles table.
+
+    The results are split into numbered pages, but the total number of
+    matches is never counted and the number of pages is limited, so deep
+    pages can't be used to make the database rank huge numbers of matches.
+
+    Attributes:
+        model: The model that the view is using.
+        template_name: The template name used to render the view.
+        context_object_name: The context name of the matching articles.
+        paginate_by: The number of articles on each page.
+        max_page: The maximum page number.
+        query_kwarg: The query string parameter that holds the query.
+        page_kwarg: The query string parameter that holds the page number.
+    """
+    model = Article
+    template_name = 'articles/article_search.html'
+    context_object_name = 'article_list'
+    paginate_by = 12
+    max_page = 50
+    query_kwarg = 'q'
+    page_kwarg = 'page'
+
+    def get_search_query(self):
+        """
+        It returns the search query of the request.
+
+        :return: The search query (empty if there is not).
+        """
+        return self.request.GET.get(self.query_kwarg, '').strip()
+
+    def get_page_number(self):
+        """
+        It returns the requested page number.
+
+        :return: The page number.
+        :raise Http404: If the page number is invalid or too high.
+        """
+        try:
+            page_number = int(self.request.GET.get(self.page_kwarg, 1))
+        except ValueError:
+            raise Http404('Invalid page number.')
+        if not 1 <= page_number <= self.max_page:
+            raise Http404('Invalid page number.')
+        return page_number
+
+    def get_queryset(self):
+        """
+        It returns the articles of the requested page of results, best
+        matches first.
+
+        :return: A list with the matching articles.
+        """
+        self.page_number = self.get_page_number()
+        self.has_next = False
+        query = self.get_search_query()
+        if not query:
+            return []
+
+        article_ids = get_search_backend().search(
+            query=query,
+            limit=self.paginate_by + 1,
+            offset=(self.page_number - 1) * self.paginate_by
+        )
+        self.has_next = (
+            len(article_ids) > self.paginate_by
+            and self.page_number < self.max_page
+        )
+        article_ids = article_ids[:self.paginate_by]
+
+        articles = (
+            Article.objects
+            .select_related('author')
+            .only(*ARTICLE_CARD_FIELDS)
+            .in_bulk(article_ids)
+        )
+        return [
+            articles[article_id] for article_id in article_ids
+            if article_id in articles
+        ]
+
+    def get_paginate_by(self, queryset):
+        """
+        It disables the default pagination (the search backend already
+        returns a single page of results).
+
+        :param queryset: The matching articles.
+        :return: None.
+        """
+        return None
+
+    def get_context_data(self, **kwargs):
+        """
+        This method adds the search query and the page navigation data to
+        the context data passed to the template when rendering the view.
+
+        :param kwargs: Additional keywords arguments.
+        :return: This method returns a dictionary with the context data used
+            in the template rendering.
+        """
+        context = super().get_context_data(**kwargs)
+        context['query'] = self.get_search_query()
+        context['page_number'] = self.page_number
+        context['has_next'] = self.has_next
+        context['has_previous'] = self.page_number > 1
+        return context
+
+
+class ArticleAutocompleteView(LoginRequiredMixin, View):
+    """
+    A class-based view in Django that returns the article titles that
+    match the text typed by the user in the search box, as JSON.
+
+    This view requires the user to be logged in (via the "LoginRequiredMixin"
+    mixin). The titles are found in the in-memory title index of the
+    process (see 'articles.search.autocomplete'), so the database is only
+    queried when the index has to be built.
+
+    Attributes:
+        limit: The maximum number of titles returned.
+        max_query_length: The maximum number of query characters used.
+        query_kwarg: The query string parameter that holds the query.
+    """
+    limit = 10
+    max_query_length = 100
+    query_kwarg = 'q'
+
+    def get(self, request, *args, **kwargs):
+        """
+        It handles GET requests, returning the matching titles and the URLs
+        of their articles.
+
+        :param request: The incoming GET request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: A JSON response with the matching titles.
+        """
+        query = request.GET.get(self.query_kwarg, '')[:self.max_query_length]
+        title_index.ensure_built()
+        results = [
+            {
+                'id': article_id,
+                'title': title,
+                'url': reverse(
+                    viewname='article_detail',
+                    kwargs={
+                        'pk': article_id
+                    }
+                )
+            }
+            for article_id, title in title_index.search(query, self.limit)
+        ]
+        return JsonResponse({'results': results})
+
+
+class ArticleObjectMixin(SingleObjectMixin):
+    """
+    A mixin for the views that work on a single "Article" object (detail,
+    comment, update and delete views).
+
+    The article is fetched only once per request, together with its author
+    and an 'is_owner' flag computed inside the query by comparing its
+    'author_id' with the current user id. Later calls to 'get_object'
+    during the same request reuse the fetched article, so the ownership
+    tests and the generic views don't load it again.
+
+    Attributes:
+        model: The model that the view is using.
+    """
+    model = Article
+
+    def get_queryset(self):
+        """
+        It returns the queryset used to fetch the article.
+
+        :return: The articles queryset, with the author and the 'is_owner'
+            flag of the current user.
+        """
+        return annotate_is_owner(super().get_queryset(), self.request.user)
+
+    def get_object(self, queryset=None):
+        """
+        It returns the article of the request, fetching it only the first
+        time it is called.
+
+        :param queryset: An optional queryset to fetch the article from (it
+            bypasses the fetched article).
+        :return: The article.
+        :raise Http404: If the article doesn't exist.
+        """
+        if queryset is not None:
+            return super().get_object(queryset)
+        if not hasattr(self, '_article'):
+            self._article = super().get_object()
+        return self._article
+
+
+class ArticleOwnerMixin(UserPassesTestMixin):
+    """
+    A mixin for the views that only the author of an article can access.
+
+    It must be combined with the 'ArticleObjectMixin' mixin (or a view that
+    includes it), which provides the 'is_owner' flag of the article.
+    """
+
+    def test_func(self):
+        """
+        A test method to check if the current user is the article author.
+
+        The ownership is checked by the article query itself (the
+        'is_owner' flag), so no user object is loaded and the article isn't
+        fetched again by the view.
+
+        :return: True, if the current authenticated user is the article author,
+            False otherwise.
+        """
+        return self.get_object().is_owner
+
+
+class ArticleCommentsMixin:
+    """
+    A mixin for the article detail views that adds a page of the article
+    comments to the context data.
+
+    The comments are fetched newest first, together with their authors, in a
+    single query that uses the '(article, created_at, id)' index. Older
+    comments are loaded with the cursor of the "load more" link.
+
+    Attributes:
+        comments_per_page: The number of comments on each page.
+        comments_cursor_kwarg: The query string parameter that holds the
+            comments page cursor.
+    """
+    comments_per_page = 20
+    comments_cursor_kwarg = 'comments'
+
+    def get_comments_page(self):
+        """
+        It returns the requested page of comments of the current article.
+
+        The cursor is validated right away, but the comments are fetched
+        only when the page is used, so no query is run when the comments
+        template fragment is served from the cache.
+
+        :return: A lazy 'KeysetPage' object with the comments.
+        :raise Http404: If the comments page cursor is invalid.
+        """
+        paginator = get_comments_paginator(
+            article_id=self.object.pk,
+            per_page=self.comments_per_page
+        )
+        cursor = self.get_comments_cursor()
+        if cursor:
+            try:
+                paginator.decode_cursor(cursor)
+            except InvalidCursor:
+                raise Http404('Invalid comments page cursor.')
+        return SimpleLazyObject(lambda: paginator.page(cursor))
+
+    def get_comments_cursor(self):
+        """
+        It returns the comments page cursor of the request.
+
+        :return: The cursor string (empty for the first page).
+        """
+        return self.request.GET.get(self.comments_cursor_kwarg, '')
+
+    def get_context_data(self, **kwargs):
+        """
+        This method adds the page of comments to the context data passed to
+        the template when rendering the view.
+
+        :param kwargs: Additional keywords arguments.
+        :return: This method returns a dictionary with the context data used
+            in the template rendering.
+        """
+        context = super().get_context_data(**kwargs)
+        comment_page = self.get_comments_page()
+        context['comment_page'] = comment_page
+        context['comments'] = SimpleLazyObject(
+            lambda: comment_page.object_list
+        )
+        context['comments_cursor'] = self.get_comments_cursor()
+        return context
+
+
+class ArticleFragmentCacheMixin:
+    """
+    A mixin for the article detail views that adds the data needed to cache
+    the article template fragments (the article table and the comments) to
+    the context data.
+
+    The fragments are cached with the article cache version in their keys.
+    The version changes every time the article is saved or deleted and
+    every time one of its comments is created or deleted, so the cached
+    fragments never have to expire to show fresh data. The modification
+    date of the article is in the keys too, so a fragment rendered from a
+    replica that hasn't received the last change yet is never cached as
+    the fresh one.
+
+    The per-user parts of the page (the comment form and the owner buttons)
+    are never cached.
+    """
+
+    def get_context_data(self, **kwargs):
+        """
+        This method adds the article cache version, the values the comments
+        fragment varies on and the fragments cache timeout to the context
+        data passed to the template when rendering
+        the view.
+
+        :param kwargs: Additional keywords arguments.
+        :return: This method returns a dictionary with the context data used
+            in the template rendering.
+        """
+        context = super().get_context_data(**kwargs)
+        article_version = get_article_version(self.object.pk)
+        context['article_version'] = article_version
+        context['comments_fragment_vary_on'] = comments_fragment_vary_on(
+            article=self.object,
+            article_version=article_version,
+            cursor=context['comments_cursor']
+        )
+        context['fragment_cache_timeout'] = \
+            settings.ARTICLE_FRAGMENT_CACHE_TIMEOUT
+        return context
+
+
+class ArticleDetailGet(ArticleFragmentCacheMixin, ArticleCommentsMixin,
+                       ArticleObjectMixin, DetailView):
     """
     A class-based view in Django that displays the details of a
     single "Article" object.
@@ -56,12 +810,13 @@ class ArticleDetailGet(DetailView):
         return context
 
 
-class ArticleDetailPost(SingleObjectMixin, FormView):
+class ArticleDetailPost(ArticleFragmentCacheMixin, ArticleCommentsMixin,
+                        ArticleObjectMixin, FormView):
     """
     A class-based view in Django that handles form submission for adding
     comments to a single "Article" object.
 
-    This view uses the 'SingleObjectMixin' to retrieve the commented
+    This view uses the 'ArticleObjectMixin' to retrieve the commented
     'Article' object and the 'CommentForm' form to handle comment submissions.
 
     Attributes:
@@ -112,24 +867,37 @@ class ArticleDetailPost(SingleObjectMixin, FormView):
         :return: It returns the URL for the detail page of the
             commented article.
         """
-        article = self.get_object()
         success_url = reverse(
             viewname='article_detail',
             kwargs={
-                'pk': article.pk
+                'pk': self.object.pk
             }
         )
         return success_url
 
 
-class ArticleDetailView(LoginRequiredMixin, View):
+class ArticleDetailView(LoginRequiredMixin, ReplicaReadMixin,
+                        ConditionalGetMixin, View):
     """
     A class-based view in Django that handles both GET and POST requests for the detail page of an 'Article' object.
 
     This view requires the user to be logged in (via the 'LoginRequiredMixin'
     mixin) and uses the 'ArticleDetailGet' and 'ArticleDetailPost' views
     to handle the GET and POST requests, respectively.
+
+    Conditional GET requests are answered (via the 'ConditionalGetMixin'
+    mixin) with validators computed from the article modification date,
+    which also changes when a comment is added or deleted.
+
+    GET requests read from the database replicas, if any (via the
+    'ReplicaReadMixin' mixin), while POST requests use the primary database.
+
+    Attributes:
+        get_view: The 'ArticleDetailGet' view function (built only once).
+        post_view: The 'ArticleDetailPost' view function (built only once).
     """
+    get_view = staticmethod(ArticleDetailGet.as_view())
+    post_view = staticmethod(ArticleDetailPost.as_view())
 
     def get(self, request, *args, **kwargs):
         """
@@ -140,10 +908,65 @@ class ArticleDetailView(LoginRequiredMixin, View):
         :param request: The incoming GET request.
         :param args: Positional arguments.
         :param kwargs: Keyword arguments.
-        :return: The HTTP response.n:
+        :return: The HTTP response.
+        """
+        return self.get_view(request, *args, **kwargs)
+
+    def get_article_updated_at(self, pk):
+        """
+        It returns the modification date of the requested article, running
+        the query only once per request.
+
+        :param pk: The id of the article.
+        :return: The modification date, or None if the article doesn't exist.
+        """
+        if not hasattr(self, '_article_updated_at'):
+            self._article_updated_at = (
+                Article.objects
+                .filter(pk=pk)
+                .values_list('updated_at', flat=True)
+                .first()
+            )
+        return self._article_updated_at
+
+    def get_etag(self, request, *args, **kwargs):
+        """
+        It returns the ETag of the requested article page.
+
+        :param request: The incoming GET request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The ETag, or None if the article doesn't exist.
+        """
+        updated_at = self.get_article_updated_at(kwargs['pk'])
+        if updated_at is None:
+            return None
+        return make_etag(
+            *get_user_validator_parts(request.user),
+            kwargs['pk'],
+            updated_at,
+            request.GET.get(ArticleDetailGet.comments_cursor_kwarg, '')
+        )
+
+    def get_last_modified(self, request, *args, **kwargs):
         """
-        view = ArticleDetailGet.as_view()
-        return view(request, *args, **kwargs)
+        It returns the last modification date of the requested article page
+        (the article modification date or the user's last login date, if
+        later).
+
+        :param request: The incoming GET request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The last modification date, or None if the article doesn't
+            exist.
+        """
+        updated_at = self.get_article_updated_at(kwargs['pk'])
+        if updated_at is None:
+            return None
+        last_login = request.user.last_login
+        if last_login is not None and last_login > updated_at:
+            return last_login
+        return updated_at
 
     def post(self, request, *args, **kwargs):
         """
@@ -156,8 +979,120 @@ class ArticleDetailView(LoginRequiredMixin, View):
         :param kwargs: Keyword arguments.
         :return: The HTTP response.
         """
-        view = ArticleDetailPost.as_view()
-        return view(request, *args, **kwargs)
+        return self.post_view(request, *args, **kwargs)
+
+
+class ArticleCommentCreateView(LoginRequiredMixin, View):
+    """
+    A class-based view in Django that adds a comment to an article and
+    returns only the new comment, so the page doesn't have to be reloaded.
+
+    The comment is sent form-encoded (like the comment form of the article
+    detail page) or as a JSON object, and the response is the rendered
+    comment fragment (HTTP 201) or, if the client accepts JSON or sent
+    JSON, the comment as JSON. Invalid comments get an HTTP 400 response
+    with the form errors (the rendered form or JSON). The clients without
+    JavaScript keep posting the form to the 'ArticleDetailView' view.
+
+    Attributes:
+        template_name: The template of the comment fragment.
+        form_template_name: The template of the comment form fragment.
+    """
+    template_name = 'articles/partials/comment.html'
+    form_template_name = 'articles/partials/comment_form.html'
+
+    def is_json_request(self, request):
+        """
+        It checks if the comment has been sent as JSON.
+
+        :param request: The incoming request.
+        :return: True if the request body is JSON, False otherwise.
+        """
+        return request.content_type == 'application/json'
+
+    def accepts_json(self, request):
+        """
+        It checks if the response must be JSON.
+
+        :param request: The incoming request.
+        :return: True if the client sent or accepts JSON, False otherwise.
+        """
+        return self.is_json_request(request) or \
+            'application/json' in request.headers.get('Accept', '')
+
+    def get_form_data(self, request):
+        """
+        It returns the submitted comment data.
+
+        :param request: The incoming request.
+        :return: A dictionary with the submitted data, or None if the JSON
+            body is malformed.
+        """
+        if not self.is_json_request(request):
+            return request.POST
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    def post(self, request, *args, **kwargs):
+        """
+        It handles POST requests, saving the comment and returning it.
+
+        :param request: The incoming POST request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The HTTP response.
+        :raise Http404: If the article doesn't exist.
+        """
+        article = get_object_or_404(
+            Article.objects.only('id'),
+            pk=kwargs['pk']
+        )
+        data = self.get_form_data(request)
+        if data is None:
+            return JsonResponse(
+                data={'errors': {'__all__': [{'message': 'Invalid JSON.'}]}},
+                status=400
+            )
+
+        form = CommentForm(data)
+        if not form.is_valid():
+            if self.accepts_json(request):
+                return JsonResponse(
+                    data={'errors': form.errors.get_json_data()},
+                    status=400
+                )
+            return TemplateResponse(
+                request=request,
+                template=self.form_template_name,
+                context={'form': form, 'article': article},
+                status=400
+            )
+
+        comment = form.save(commit=False)
+        comment.article = article
+        comment.author = request.user
+        comment.save()
+
+        if self.accepts_json(request):
+            return JsonResponse(
+                data={
+                    'id': comment.pk,
+                    'article': article.pk,
+                    'author': request.user.get_username(),
+                    'comment': comment.comment,
+                    'created_at': comment.created_at,
+                },
+                status=201
+            )
+        return TemplateResponse(
+            request=request,
+            template=self.template_name,
+            context={'comment': comment},
+            status=201
+        )
 
 
 class ArticleCreateView(LoginRequiredMixin, CreateView):
@@ -194,13 +1129,14 @@ class ArticleCreateView(LoginRequiredMixin, CreateView):
         return super().form_valid(form)
 
 
-class ArticleUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class ArticleUpdateView(LoginRequiredMixin, ArticleOwnerMixin,
+                        ArticleObjectMixin, UpdateView):
     """
     A class-based view for updating an article.
 
     This view extends the Django's 'LoginRequiredMixin' mixin to ensure
     that only authenticated users can access it and the
-    'UserPassesTestMixin' mixin to ensure that only the author of an
+    'ArticleOwnerMixin' mixin to ensure that only the author of an
     article can edit its info. It also uses the built-in Django generic
     view 'UpdateView' to handle the update of an existing article.
 
@@ -213,27 +1149,14 @@ class ArticleUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     fields = ('title', 'body')
     template_name = 'articles/article_edit.html'
 
-    def test_func(self):
-        """
-        A test method to check if the current user is the article author.
-
-        The method checks if the current authenticated user is the article
-        author by comparing it with the 'obj.author' (obj is the instance of
-        the article to be updated).
-
-        :return: True, if the current authenticated user is the article author,
-            False otherwise.
-        """
-        obj = self.get_object()
-        return obj.author == self.request.user
-
 
-class ArticleDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
+class ArticleDeleteView(LoginRequiredMixin, ArticleOwnerMixin,
+                        ArticleObjectMixin, DeleteView):
     """
     A class-based view for deleting an article.
 
     This view extends the Django's 'LoginRequiredMixin' mixin to ensure that
-    only authenticated users can access it and the 'UserPassesTestMixin'
+    only authenticated users can access it and the 'ArticleOwnerMixin'
     mixin to ensure that only the author of an article can delete it.
     It also uses the built-in Django generic view 'DeleteView' to handle
     the article deletion process.
@@ -247,16 +1170,187 @@ class ArticleDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
     template_name = 'articles/article_delete.html'
     success_url = reverse_lazy('article_list')
 
+
+class ArticleExportView(LoginRequiredMixin, UserPassesTestMixin, View):
+    """
+    A class-based view in Django that downloads a gzip-compressed export of
+    the articles or the comments, as NDJSON or CSV.
+
+    This view requires the user to be logged in (via the "LoginRequiredMixin"
+    mixin) and to be a staff member (via the "UserPassesTestMixin" mixin).
+
+    The export is streamed: the rows are fetched from the database in
+    chunks and compressed as they are sent (see 'articles.export'), so the
+    memory use doesn't depend on the size of the tables.
+    """
+
     def test_func(self):
         """
-        A test method to check if the current user is the article author.
+        It checks if the current user is a staff member.
 
-        The method checks if the current authenticated user is the article
-        author by comparing it with the 'obj.author' (obj is the instance of
-        the article to be updated).
+        :return: True if the user is a staff member, False otherwise.
+        """
+        return self.request.user.is_staff
 
-        :return: True, if the current authenticated user is the article author,
-            False otherwise.
+    def get(self, request, *args, **kwargs):
+        """
+        It handles GET requests, streaming the requested export.
+
+        :param request: The incoming GET request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments (the dataset and the format).
+        :return: The streaming HTTP response.
+        :raise Http404: If the dataset or the format doesn't exist.
+        """
+        dataset = kwargs['dataset']
+        export_format = kwargs['format']
+        if (dataset not in EXPORT_DATASETS
+                or export_format not in EXPORT_FORMATS):
+            raise Http404('Unknown export.')
+
+        response = StreamingHttpResponse(
+            iter_export(dataset, export_format),
+            content_type='application/gzip'
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="{dataset}.{export_format}.gz"'
+        )
+        return response
+
+
+class CachedSitemapMixin:
+    """
+    A mixin for the sitemap views that caches the rendered sitemaps.
+
+    The sitemaps are cached with a version, which is changed when the
+    articles they list change (see 'articles.sitemaps'), so every sitemap is
+    rendered once and only rendered again after a change. The cache keys
+    include the scheme and host, as the sitemap URLs are absolute.
+    """
+
+    def get_cache_key(self, request, name, version):
+        """
+        It returns the cache key of a sitemap.
+
+        :param request: The incoming request.
+        :param name: The name of the sitemap.
+        :param version: The version of the sitemap.
+        :return: The cache key.
+        """
+        return (
+            f'articles:sitemap:{name}:{version}:'
+            f'{request.scheme}:{request.get_host()}'
+        )
+
+    def get_cached_response(self, cache_key, render):
+        """
+        It returns a sitemap from the cache, rendering and caching it if it
+        isn't cached.
+
+        :param cache_key: The cache key of the sitemap.
+        :param render: A function that returns the rendered sitemap
+            response.
+        :return: The HTTP response.
+        """
+        cached_sitemap = cache.get(cache_key)
+        if cached_sitemap is None:
+            response = render()
+            response.render()
+            cached_sitemap = {
+                'content': response.content,
+                'headers': list(response.items())
+            }
+            cache.set(
+                cache_key,
+                cached_sitemap,
+                timeout=settings.ARTICLE_SITEMAP_CACHE_TIMEOUT
+            )
+
+        response = HttpResponse(cached_sitemap['content'])
+        for header, value in cached_sitemap['headers']:
+            response[header] = value
+        return response
+
+
+class ArticleSitemapIndexView(CachedSitemapMixin, View):
+    """
+    A class-based view in Django that returns the sitemap index, which
+    lists a sitemap for every shard of articles (a range of article ids).
+
+    The index is cached until an article is created, as only new articles
+    can add shards.
+    """
+
+    def get(self, request, *args, **kwargs):
         """
-        obj = self.get_object()
-        return obj.author == self.request.user
+        It handles GET requests, returning the sitemap index.
+
+        :param request: The incoming GET request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The HTTP response.
+        """
+        version = get_cache_version(SITEMAP_INDEX_VERSION_KEY)
+        cache_key = self.get_cache_key(request, 'index', version)
+        return self.get_cached_response(
+            cache_key,
+            lambda: self.render_index(request)
+        )
+
+    def render_index(self, request):
+        """
+        It renders the sitemap index.
+
+        :param request: The incoming GET request.
+        :return: The template response.
+        """
+        sitemaps = [
+            SitemapIndexItem(
+                location=request.build_absolute_uri(
+                    reverse(
+                        viewname='article_sitemap',
+                        kwargs={
+                            'shard': shard
+                        }
+                    )
+                )
+            )
+            for shard in range(get_sitemap_shard_count())
+        ]
+        response = TemplateResponse(
+            request=request,
+            template='sitemap_index.xml',
+            context={'sitemaps': sitemaps},
+            content_type='application/xml'
+        )
+        response['X-Robots-Tag'] = 'noindex, noodp, noarchive'
+        return response
+
+
+class ArticleSitemapView(CachedSitemapMixin, View):
+    """
+    A class-based view in Django that returns the sitemap of a shard of
+    articles (a range of article ids).
+
+    Every shard is cached until one of its articles is saved or deleted.
+    """
+
+    def get(self, request, *args, **kwargs):
+        """
+        It handles GET requests, returning the sitemap of the shard.
+
+        :param request: The incoming GET request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments (the shard number).
+        :return: The HTTP response.
+        :raise Http404: If the shard doesn't exist.
+        """
+        shard = kwargs['shard']
+        if shard >= get_sitemap_shard_count():
+            raise Http404('Unknown sitemap.')
+        version = get_cache_version(sitemap_shard_version_key(shard))
+        cache_key = self.get_cache_key(request, f'shard:{shard}', version)
+        return self.get_cached_response(
+            cache_key,
+            lambda: sitemap(request, {'articles': ArticleShardSitemap(shard)})
+        )
@@ -9,8 +9,20 @@ https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
+from newspaper.preload import preload_templates, preload_title_index
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'newspaper.settings')
 
 application = get_asgi_application()
+
+# Compile all the templates before the worker serves the first request
+if settings.TEMPLATE_PRELOAD_ENABLED:
+    preload_templates()
+
+# Build the title autocomplete index before the worker serves the first
+# request
+if settings.ARTICLE_AUTOCOMPLETE_PRELOAD_ENABLED:
+    preload_title_index()
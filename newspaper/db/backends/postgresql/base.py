@@ -0,0 +1,213 @@
+import functools
+import os
+import threading
+
+import psycopg2
+import psycopg2.extras
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base
+from django.utils.asyncio import async_unsafe
+from psycopg2 import OperationalError
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+from newspaper.db.pool import ConnectionPool, PoolTimeout
+
+# Connection pools, by process id and database alias (the pools inherited
+# from the parent process are kept, but never used, so their connections
+# aren't closed by the child process either)
+pools = {}
+pools_lock = threading.Lock()
+
+# Connections checked out by the parent process and dropped by a forked
+# child (kept, as closing them, even when they are garbage collected,
+# would end the sessions of the parent)
+inherited_connections = []
+
+
+def _reset_pools_lock():
+    """
+    It replaces the pools lock in a forked child process, as the lock may
+    have been held by another thread of the parent process when it forked.
+    """
+    global pools_lock
+    pools_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_pools_lock)
+
+
+def get_process_pool(alias):
+    """
+    It returns the connection pool of a database in the current process.
+
+    :param alias: The database alias.
+    :return: The connection pool, or None if it hasn't been created yet.
+    """
+    return pools.get((os.getpid(), alias))
+
+
+def open_connection(conn_params, isolation_level=None):
+    """
+    It opens a new connection for a pool, set up like the connections of
+    Django's 'postgresql' backend.
+
+    :param conn_params: The connection parameters.
+    :param isolation_level: The isolation level of the 'OPTIONS' setting, or
+        None to use the database default.
+    :return: The psycopg2 connection.
+    """
+    connection = psycopg2.connect(**conn_params)
+    if isolation_level is not None \
+            and isolation_level != connection.isolation_level:
+        connection.set_session(isolation_level=isolation_level)
+    psycopg2.extras.register_default_jsonb(
+        conn_or_curs=connection,
+        loads=lambda x: x
+    )
+    return connection
+
+
+def check_connection(connection):
+    """
+    It checks that an idle pooled connection is still usable.
+
+    :param connection: The psycopg2 connection.
+    :raise OperationalError: If the connection is broken.
+    """
+    if connection.closed:
+        raise OperationalError('The connection is closed.')
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+
+
+def reset_connection(connection):
+    """
+    It rolls back the open transaction of a returned connection, if any.
+
+    :param connection: The psycopg2 connection.
+    :raise OperationalError: If the connection is broken.
+    """
+    if connection.closed:
+        raise OperationalError('The connection is closed.')
+    if connection.info.transaction_status != TRANSACTION_STATUS_IDLE:
+        connection.rollback()
+
+
+def get_pool_stats():
+    """
+    It returns the statistics of the connection pools of the process.
+
+    :return: A dictionary with the statistics of every pool, by database
+        alias.
+    """
+    pid = os.getpid()
+    with pools_lock:
+        return {
+            alias: pool.get_stats()
+            for (pool_pid, alias), pool in pools.items() if pool_pid == pid
+        }
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    A PostgreSQL database backend that checks out its connections from a
+    pool shared by the threads of the process (see
+    'newspaper.db.pool.ConnectionPool'), instead of opening a new connection
+    for every request.
+
+    Closing a connection (at the end of every request, with 'CONN_MAX_AGE'
+    set to 0) returns it to the pool. The pool is configured with the
+    'pool' dictionary of the database 'OPTIONS': 'max_size', 'max_lifetime'
+    (seconds), 'timeout' (seconds) and 'check' (True to check the idle
+    connections with a 'SELECT 1' on checkout).
+
+    The pools are kept by process id, so a worker process forked after the
+    parent process used the database (e.g. with 'gunicorn --preload')
+    creates its own pool on its first connection instead of sharing the
+    connections of the parent. The connections checked out by the parent
+    process are dropped by the child without being returned or closed, as
+    closing them would end the sessions of the parent.
+    """
+
+    def __init__(self, settings_dict, alias='default'):
+        # None (unlimited persistent connections) is rejected too
+        if settings_dict.get('CONN_MAX_AGE', 0) != 0:
+            raise ImproperlyConfigured(
+                'Pooled database connections require CONN_MAX_AGE = 0 (the '
+                'connections are returned to the pool when they are closed).'
+            )
+        super().__init__(settings_dict, alias)
+        self.connection_pool = None
+
+    def get_pool(self, conn_params):
+        """
+        It returns the connection pool of the database, creating it the
+        first time.
+
+        :param conn_params: The connection parameters.
+        :return: The connection pool.
+        """
+        key = (os.getpid(), self.alias)
+        with pools_lock:
+            pool = pools.get(key)
+            if pool is None:
+                options = self.settings_dict['OPTIONS'].get('pool', {})
+                pool = pools[key] = ConnectionPool(
+                    connect=functools.partial(
+                        open_connection,
+                        conn_params,
+                        self.settings_dict['OPTIONS'].get('isolation_level')
+                    ),
+                    check=check_connection if options.get('check', True)
+                    else None,
+                    reset=reset_connection,
+                    max_size=options.get('max_size', 10),
+                    max_lifetime=options.get('max_lifetime'),
+                    timeout=options.get('timeout', 30)
+                )
+            return pool
+
+    def get_connection_params(self):
+        """
+        It returns the connection parameters, without the pool options.
+
+        :return: The connection parameters.
+        """
+        conn_params = super().get_connection_params()
+        conn_params.pop('pool', None)
+        return conn_params
+
+    @async_unsafe
+    def get_new_connection(self, conn_params):
+        """
+        It checks out a connection from the pool.
+
+        :param conn_params: The connection parameters.
+        :return: The psycopg2 connection.
+        :raise OperationalError: If no connection becomes available in time.
+        """
+        pool = self.get_pool(conn_params)
+        try:
+            connection = pool.getconn()
+        except PoolTimeout as error:
+            raise OperationalError(str(error)) from error
+        self.connection_pool = pool
+        # Like the 'postgresql' backend, before the autocommit is set
+        self.isolation_level = self.settings_dict['OPTIONS'].get(
+            'isolation_level',
+            connection.isolation_level
+        )
+        return connection
+
+    def _close(self):
+        """
+        It returns the connection to the pool instead of closing it (or
+        drops it, if it was checked out by the parent of a forked process).
+        """
+        if self.connection is None:
+            return
+        if self.connection_pool is get_process_pool(self.alias):
+            with self.wrap_database_errors:
+                self.connection_pool.putconn(self.connection)
+        else:
+            inherited_connections.append(self.connection)
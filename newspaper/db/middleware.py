@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from newspaper.db.routers import pin_to_primary
+
+# HTTP methods that don't change data
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS', 'TRACE')
+
+
+class PrimaryPinningMiddleware:
+    """
+    A middleware that pins the users to the primary database for a while
+    after they change data, so they read their own writes (for example,
+    the new article shown after 'ArticleCreateView' redirects) even if the
+    read replicas lag behind.
+
+    A successful unsafe request (creating, editing or commenting on an
+    article, logging in...) sets a cookie that expires after
+    'DATABASE_REPLICA_PIN_SECONDS' seconds. Requests with that cookie, and
+    all unsafe requests, read from the primary database (see
+    'newspaper.db.routers.ReplicaRouter'). A cookie is used instead of the
+    session so the pinning doesn't write the session, and works for
+    anonymous users too.
+
+    The middleware is disabled when there are no replicas.
+
+    Attributes:
+        cookie_name: The name of the pinning cookie.
+    """
+    cookie_name = 'primary_db'
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """
+        It runs the request pinned to the primary database if the user has
+        written recently, and pins the user after a successful write.
+
+        :param request: The incoming request.
+        :return: The HTTP response.
+        """
+        writing = request.method not in SAFE_METHODS
+        with pin_to_primary(writing or self.cookie_name in request.COOKIES):
+            response = self.get_response(request)
+        if writing and response.status_code < 400:
+            response.set_cookie(
+                key=self.cookie_name,
+                value='1',
+                max_age=settings.DATABASE_REPLICA_PIN_SECONDS,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite='Lax'
+            )
+        return response
@@ -0,0 +1,30 @@
+from newspaper.db.routers import replica_reads
+
+
+class ReplicaReadMixin:
+    """
+    A mixin for class-based views that lets the GET and HEAD requests read
+    from the database replicas (see 'newspaper.db.routers.ReplicaRouter').
+
+    The template responses are rendered inside the view, so the queries
+    run by the templates (lazy querysets) use the replicas too. Other
+    requests always use the primary database.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        """
+        It calls the parent's implementation with the replica reads
+        allowed for GET and HEAD requests.
+
+        :param request: The incoming request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The HTTP response (rendered).
+        """
+        if request.method not in ('GET', 'HEAD'):
+            return super().dispatch(request, *args, **kwargs)
+        with replica_reads():
+            response = super().dispatch(request, *args, **kwargs)
+            if hasattr(response, 'render'):
+                response.render()
+        return response
@@ -0,0 +1,209 @@
+import collections
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    """
+    Exception raised when no connection of a pool becomes available in time.
+    """
+
+
+class ConnectionPool:
+    """
+    A thread-safe pool of database connections, independent of the database
+    driver.
+
+    The connections are opened on demand (up to 'max_size' at once) and
+    returned to the pool instead of being closed, so the next checkouts
+    don't pay for the TCP, TLS and authentication handshakes. When all the
+    connections are in use, a checkout waits up to 'timeout' seconds for
+    one to be returned. The idle connections are reused newest first, so
+    the rarely used ones grow old and are closed after 'max_lifetime'
+    seconds.
+
+    Attributes:
+        connect: A function that opens a new connection.
+        check: A function that raises an exception if an idle connection
+            is no longer usable (run on every checkout), or None.
+        reset: A function that prepares a returned connection to be reused
+            (rolling back any open transaction) and raises an exception if
+            it can't be reused, or None.
+        max_size: The maximum number of open connections.
+        max_lifetime: The seconds after which a connection is closed (None
+            to keep the connections open).
+        timeout: The maximum seconds that a checkout waits for a connection.
+    """
+
+    def __init__(self, connect, check=None, reset=None, max_size=10,
+                 max_lifetime=None, timeout=30):
+        self.connect = connect
+        self.check = check
+        self.reset = reset
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.timeout = timeout
+        self._condition = threading.Condition()
+        self._idle = collections.deque()
+        self._opened_at = {}
+        self._stats = collections.Counter()
+
+    def _is_expired(self, connection):
+        """
+        It checks if a connection has reached its maximum lifetime.
+
+        :param connection: The connection.
+        :return: True if the connection must be closed, False otherwise.
+        """
+        return (
+            self.max_lifetime is not None
+            and time.monotonic() - self._opened_at[id(connection)]
+            >= self.max_lifetime
+        )
+
+    def _discard(self, connection, reason):
+        """
+        It closes a connection of the pool, making room for a new one. It
+        must be called with the lock held.
+
+        :param connection: The connection.
+        :param reason: The statistics counter of the reason.
+        """
+        del self._opened_at[id(connection)]
+        self._stats[reason] += 1
+        self._condition.notify()
+        try:
+            connection.close()
+        except Exception:
+            logger.debug('Error closing a pooled connection.', exc_info=True)
+
+    def getconn(self):
+        """
+        It checks out a connection, reusing an idle one if possible.
+
+        :return: The connection.
+        :raise PoolTimeout: If no connection becomes available in time.
+        """
+        deadline = time.monotonic() + self.timeout
+        waited = False
+        while True:
+            with self._condition:
+                connection = None
+                while self._idle:
+                    connection = self._idle.pop()
+                    if not self._is_expired(connection):
+                        break
+                    self._discard(connection, 'expired')
+                    connection = None
+
+                if connection is None:
+                    if len(self._opened_at) >= self.max_size:
+                        remaining = deadline - time.monotonic()
+                        if not waited:
+                            self._stats['waits'] += 1
+                            waited = True
+                        if remaining <= 0 or not self._condition.wait(
+                            remaining
+                        ):
+                            self._stats['timeouts'] += 1
+                            logger.warning(
+                                'Database connection pool exhausted: %s',
+                                self.get_stats()
+                            )
+                            raise PoolTimeout(
+                                f'No database connection available after '
+                                f'{self.timeout} seconds.'
+                            )
+                        continue
+                    # Reserve the place of the new connection
+                    placeholder = object()
+                    self._opened_at[id(placeholder)] = time.monotonic()
+
+            if connection is None:
+                try:
+                    connection = self.connect()
+                except Exception:
+                    with self._condition:
+                        del self._opened_at[id(placeholder)]
+                        self._condition.notify()
+                    raise
+                with self._condition:
+                    del self._opened_at[id(placeholder)]
+                    self._opened_at[id(connection)] = time.monotonic()
+                    self._stats['opened'] += 1
+                    self._stats['checkouts'] += 1
+                return connection
+
+            if self.check is not None:
+                try:
+                    self.check(connection)
+                except Exception:
+                    with self._condition:
+                        self._discard(connection, 'failed_checks')
+                    continue
+            with self._condition:
+                self._stats['checkouts'] += 1
+            return connection
+
+    def putconn(self, connection, close=False):
+        """
+        It returns a checked out connection to the pool.
+
+        :param connection: The connection.
+        :param close: True to close the connection instead of reusing it.
+        """
+        if not close and self.reset is not None:
+            try:
+                self.reset(connection)
+            except Exception:
+                close = True
+        with self._condition:
+            if id(connection) not in self._opened_at:
+                # Not a connection of the pool
+                connection.close()
+            elif close:
+                self._discard(connection, 'closed')
+            elif self._is_expired(connection):
+                self._discard(connection, 'expired')
+            else:
+                self._idle.append(connection)
+                self._condition.notify()
+
+    def closeall(self):
+        """
+        It closes the idle connections of the pool (the connections in use
+        are kept).
+        """
+        with self._condition:
+            while self._idle:
+                self._discard(self._idle.pop(), 'closed')
+
+    def get_stats(self):
+        """
+        It returns the statistics of the pool.
+
+        :return: A dictionary with the number of open, idle and in use
+            connections, the pool limits and the number of opened
+            connections, checkouts, checkouts that waited or timed out and
+            connections closed because they expired, failed the health check
+            or were closed.
+        """
+        with self._condition:
+            size = len(self._opened_at)
+            idle = len(self._idle)
+            return {
+                'size': size,
+                'idle': idle,
+                'in_use': size - idle,
+                'max_size': self.max_size,
+                'max_lifetime': self.max_lifetime,
+                **{
+                    name: self._stats[name] for name in (
+                        'opened', 'checkouts', 'waits', 'timeouts',
+                        'expired', 'failed_checks', 'closed'
+                    )
+                },
+            }
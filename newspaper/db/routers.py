@@ -0,0 +1,117 @@
+import contextlib
+import contextvars
+import random
+
+from django.conf import settings
+
+# Whether the reads of the current request (or task) may use the replicas
+_replica_reads = contextvars.ContextVar('replica_reads', default=False)
+
+# Whether the current request (or task) is pinned to the primary database
+_primary_pinned = contextvars.ContextVar('primary_pinned', default=False)
+
+
+@contextlib.contextmanager
+def replica_reads(enabled=True):
+    """
+    It allows the reads made inside the block to use the read replicas
+    (see 'ReplicaRouter'), unless the request is pinned to the primary
+    database.
+
+    :param enabled: False to keep the reads on the primary database.
+    """
+    token = _replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+@contextlib.contextmanager
+def pin_to_primary(pinned=True):
+    """
+    It sends all the reads made inside the block to the primary database,
+    even inside 'replica_reads' blocks.
+
+    :param pinned: False to leave the reads unpinned.
+    """
+    token = _primary_pinned.set(pinned)
+    try:
+        yield
+    finally:
+        _primary_pinned.reset(token)
+
+
+class ReplicaRouter:
+    """
+    A database router that sends the reads of the 'replica_apps' models to
+    a random read replica (the 'DATABASE_REPLICAS' setting) and everything
+    else to the primary database ('default').
+
+    The replicas are only used inside 'replica_reads' blocks (the views
+    that opt in with 'ReplicaReadMixin' and the feeds) and never while the
+    request is pinned to the primary database (see
+    'PrimaryPinningMiddleware'), so the users read their own writes and
+    the sessions, users and writes never depend on the replication lag.
+
+    Attributes:
+        replica_apps: The labels of the apps whose models can be read from
+            the replicas.
+    """
+    replica_apps = ('articles',)
+
+    def db_for_read(self, model, **hints):
+        """
+        It returns the database used to read a model.
+
+        :param model: The model.
+        :param hints: Hints about the query.
+        :return: A replica alias, or None to use the primary database.
+        """
+        if not settings.DATABASE_REPLICAS or not _replica_reads.get() \
+                or _primary_pinned.get() \
+                or model._meta.app_label not in self.replica_apps:
+            return None
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        """
+        It returns the database used to write a model (always the primary
+        database).
+
+        :param model: The model.
+        :param hints: Hints about the query.
+        :return: The primary database alias.
+        """
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """
+        It allows relations between objects read from the primary database
+        and from its replicas, as they hold the same data.
+
+        :param obj1: The first object.
+        :param obj2: The second object.
+        :param hints: Hints about the relation.
+        :return: True if both objects come from the primary database or its
+            replicas, None otherwise.
+        """
+        databases = {'default', *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """
+        It prevents the migrations from running on the replicas, which
+        receive the schema changes from the primary database.
+
+        :param db: The database alias.
+        :param app_label: The label of the migrated app.
+        :param model_name: The name of the migrated model.
+        :param hints: Hints about the migration.
+        :return: False for the replicas, None otherwise.
+        """
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
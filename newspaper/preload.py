@@ -0,0 +1,134 @@
+import collections
+import logging
+import time
+from pathlib import Path
+
+from django.db import connections
+from django.forms.renderers import get_default_renderer
+from django.template import engines
+
+logger = logging.getLogger(__name__)
+
+# Compilation result of a template
+PreloadedTemplate = collections.namedtuple(
+    'PreloadedTemplate',
+    ['backend', 'name', 'seconds', 'error']
+)
+
+
+def get_template_backends():
+    """
+    It returns the template backends whose templates are preloaded: the
+    backends of the 'TEMPLATES' setting and the backend of the form
+    renderer, which renders the form widgets (only its widget templates, as
+    it also finds the templates of the installed apps).
+
+    :return: A list of tuples with the template backend and the name prefix
+        of its templates to preload.
+    """
+    backends = [(backend, '') for backend in engines.all()]
+    renderer = get_default_renderer()
+    if hasattr(renderer, 'engine'):
+        backends.append((renderer.engine, 'django/forms/'))
+    return backends
+
+
+def discover_templates(backend, prefix=''):
+    """
+    It returns the names of all the templates of a template backend, in its
+    directories and in the 'templates' directories of the installed apps.
+
+    A name found in several directories is only returned once, as the
+    loaders only use the first one.
+
+    :param backend: The template backend.
+    :param prefix: The prefix of the returned template names.
+    :return: The list of template names.
+    """
+    names = []
+    for directory in backend.template_dirs:
+        directory = Path(directory)
+        for path in sorted(directory.rglob('*')):
+            name = path.relative_to(directory).as_posix()
+            if name.startswith(prefix) and path.is_file() \
+                    and name not in names:
+                names.append(name)
+    return names
+
+
+def preload_templates():
+    """
+    It compiles all the templates of every template backend (see
+    'get_template_backends'), so they are stored by the cached template
+    loader before the worker serves the first request (instead of being
+    compiled lazily on the first request that uses them).
+
+    The templates that can't be compiled are reported but don't stop the
+    preload, as some app templates are never used by the project.
+
+    :return: A list of 'PreloadedTemplate' tuples with the compilation
+        seconds (and the error, if any) of every template.
+    """
+    results = []
+    for backend, prefix in get_template_backends():
+        for name in discover_templates(backend, prefix):
+            started_at = time.perf_counter()
+            try:
+                backend.get_template(name)
+            except Exception as error:
+                error_message = f'{type(error).__name__}: {error}'
+            else:
+                error_message = None
+            seconds = time.perf_counter() - started_at
+            results.append(
+                PreloadedTemplate(backend.name, name, seconds, error_message)
+            )
+            if error_message is None:
+                logger.debug(
+                    'Template %s compiled in %.2f ms.',
+                    name,
+                    seconds * 1000
+                )
+            else:
+                logger.warning(
+                    'Template %s not preloaded: %s',
+                    name,
+                    error_message
+                )
+
+    logger.info(
+        'Preloaded %d templates in %.1f ms.',
+        sum(result.error is None for result in results),
+        sum(result.seconds for result in results) * 1000
+    )
+    return results
+
+
+def preload_title_index():
+    """
+    It builds the article title autocomplete index of the process (see
+    'articles.search.autocomplete.TitleIndex'), so the first autocomplete
+    request of the worker doesn't wait for it.
+
+    A failed build is reported but doesn't stop the worker (the index is
+    then built by the first autocomplete request). The database connections
+    opened by the build are closed afterwards, so they are never inherited
+    by worker processes forked after the preload (e.g. with
+    'gunicorn --preload').
+    """
+    # Imported here, as the models can't be imported before the app
+    # registry is ready
+    from articles.search.autocomplete import title_index
+
+    try:
+        title_index.ensure_built()
+    except Exception:
+        logger.exception('Title index not preloaded.')
+        return
+    finally:
+        connections.close_all()
+    logger.info(
+        'Built the title index (%d titles) in %.1f ms.',
+        len(title_index),
+        title_index.build_seconds * 1000
+    )
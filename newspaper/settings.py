@@ -10,7 +10,9 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 
+import itertools
 from pathlib import Path
+from django.core.exceptions import ImproperlyConfigured
 from environs import Env
 
 env = Env()
@@ -41,6 +43,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.sitemaps',
     # Local Apps
     'pages.apps.PagesConfig',
     'accounts.apps.AccountsConfig',
@@ -56,6 +59,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'newspaper.db.middleware.PrimaryPinningMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -79,6 +83,13 @@ TEMPLATES = [
     },
 ]
 
+# Compilation of all the templates when a WSGI or ASGI worker starts,
+# disabled in development so the development server starts faster
+TEMPLATE_PRELOAD_ENABLED = env.bool(
+    'TEMPLATE_PRELOAD_ENABLED',
+    default=not DEBUG
+)
+
 WSGI_APPLICATION = 'newspaper.wsgi.application'
 
 
@@ -89,6 +100,188 @@ DATABASES = {
     'default': env.dj_db_url('DATABASE_URL')
 }
 
+# Seconds that a database connection is kept open after a request (0 to
+# close it at the end of every request, None to keep it open) and whether
+# persistent connections are checked before they are reused
+DATABASES['default']['CONN_MAX_AGE'] = env.int(
+    'DATABASE_CONN_MAX_AGE',
+    default=0
+)
+DATABASES['default']['CONN_HEALTH_CHECKS'] = env.bool(
+    'DATABASE_CONN_HEALTH_CHECKS',
+    default=False
+)
+
+# Read replicas of the default database, one 'DATABASE_URL'-style URL per
+# 'DATABASE_REPLICA_URL_<n>' variable (numbered from 1), with the same
+# connection settings. The tests use the default database instead.
+DATABASE_REPLICAS = []
+for number in itertools.count(1):
+    variable = f'DATABASE_REPLICA_URL_{number}'
+    if not env.str(variable, default=''):
+        break
+    DATABASES[f'replica_{number}'] = {
+        **env.dj_db_url(variable),
+        'CONN_MAX_AGE': DATABASES['default']['CONN_MAX_AGE'],
+        'CONN_HEALTH_CHECKS': DATABASES['default']['CONN_HEALTH_CHECKS'],
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica_{number}')
+
+# The article list, article details and feeds are read from the replicas,
+# except for the users that have changed data in the last seconds, which
+# stay on the primary database to read their own writes
+DATABASE_ROUTERS = ['newspaper.db.routers.ReplicaRouter']
+DATABASE_REPLICA_PIN_SECONDS = env.int(
+    'DATABASE_REPLICA_PIN_SECONDS',
+    default=10
+)
+
+# Pool of PostgreSQL connections shared by the threads of every process
+# (it requires 'DATABASE_CONN_MAX_AGE' = 0): the maximum number of open
+# connections, the seconds after which a connection is replaced, the
+# seconds that a request waits for a free connection and whether idle
+# connections are checked before they are reused (one pool per database)
+if env.bool('DATABASE_POOL', default=False):
+    for database in DATABASES.values():
+        if 'postgresql' not in database['ENGINE']:
+            raise ImproperlyConfigured(
+                'DATABASE_POOL requires PostgreSQL database URLs.'
+            )
+        database['ENGINE'] = 'newspaper.db.backends.postgresql'
+        database.setdefault('OPTIONS', {})['pool'] = {
+            'max_size': env.int('DATABASE_POOL_MAX_SIZE', default=10),
+            'max_lifetime': env.int(
+                'DATABASE_POOL_MAX_LIFETIME',
+                default=60 * 30
+            ),
+            'timeout': env.int('DATABASE_POOL_TIMEOUT', default=30),
+            'check': env.bool('DATABASE_POOL_CHECK', default=True),
+        }
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': env.str(
+            'CACHE_BACKEND',
+            default='django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': env.str('CACHE_LOCATION', default=''),
+    },
+    'pages': {
+        'BACKEND': env.str(
+            'PAGE_CACHE_BACKEND',
+            default='django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': env.str('PAGE_CACHE_LOCATION', default='pages'),
+    }
+}
+
+# Session engine ('accounts.sessions' reads the sessions through the cache
+# and only writes them when they change, and requires a cache shared by all
+# the server processes), seconds after which the expiry date of an
+# unchanged session is refreshed by that engine and whether the sessions
+# are refreshed on every request (sliding expiration)
+SESSION_ENGINE = env.str(
+    'SESSION_ENGINE',
+    default='django.contrib.sessions.backends.db'
+)
+SESSION_REFRESH_INTERVAL = env.int(
+    'SESSION_REFRESH_INTERVAL',
+    default=60 * 60
+)
+SESSION_SAVE_EVERY_REQUEST = env.bool(
+    'SESSION_SAVE_EVERY_REQUEST',
+    default=False
+)
+
+# Seconds that the article template fragments stay cached (they are also
+# invalidated by version every time the article or its comments change)
+ARTICLE_FRAGMENT_CACHE_TIMEOUT = env.int(
+    'ARTICLE_FRAGMENT_CACHE_TIMEOUT',
+    default=60 * 60 * 24
+)
+
+# Seconds that the per-author article counts stay cached (they are also
+# invalidated every time an article of the author is saved or deleted)
+ARTICLE_COUNT_CACHE_TIMEOUT = env.int(
+    'ARTICLE_COUNT_CACHE_TIMEOUT',
+    default=60 * 60 * 24
+)
+
+# Seconds that the generated article feeds stay cached (they are also
+# invalidated every time an article of the feed is saved or deleted) and
+# seconds that feed readers may reuse them without asking again
+ARTICLE_FEED_CACHE_TIMEOUT = env.int(
+    'ARTICLE_FEED_CACHE_TIMEOUT',
+    default=60 * 60 * 24
+)
+ARTICLE_FEED_MAX_AGE = env.int('ARTICLE_FEED_MAX_AGE', default=60 * 5)
+
+# Number of articles of every sitemap shard (at most 50000, the limit of
+# the sitemaps protocol) and seconds that the rendered sitemaps stay cached
+# (they are also invalidated every time an article of the shard changes)
+ARTICLE_SITEMAP_SHARD_SIZE = env.int(
+    'ARTICLE_SITEMAP_SHARD_SIZE',
+    default=10000
+)
+ARTICLE_SITEMAP_CACHE_TIMEOUT = env.int(
+    'ARTICLE_SITEMAP_CACHE_TIMEOUT',
+    default=60 * 60 * 24 * 7
+)
+
+
+# Full-page cache of the pages served to non-authenticated users (home,
+# login and signup pages)
+ANONYMOUS_PAGE_CACHE_ENABLED = env.bool(
+    'ANONYMOUS_PAGE_CACHE_ENABLED',
+    default=False
+)
+ANONYMOUS_PAGE_CACHE_ALIAS = env.str(
+    'ANONYMOUS_PAGE_CACHE_ALIAS',
+    default='pages'
+)
+ANONYMOUS_PAGE_CACHE_TIMEOUT = env.int(
+    'ANONYMOUS_PAGE_CACHE_TIMEOUT',
+    default=60 * 5
+)
+
+# Per-process cache of the layout partials (header and navbar) rendered for
+# authenticated and non-authenticated users, disabled in development so the
+# template changes are shown
+LAYOUT_PARTIAL_CACHE_ENABLED = env.bool(
+    'LAYOUT_PARTIAL_CACHE_ENABLED',
+    default=not DEBUG
+)
+
+
+# Article full-text search backend (the database vendor default if it is
+# empty)
+ARTICLE_SEARCH_BACKEND = env.str('ARTICLE_SEARCH_BACKEND', default='')
+
+# In-memory article title autocomplete index of every worker process: the
+# maximum number of (newest) titles indexed and the seconds after which the
+# index is rebuilt to pick up the changes made by other processes
+ARTICLE_AUTOCOMPLETE_MAX_TITLES = env.int(
+    'ARTICLE_AUTOCOMPLETE_MAX_TITLES',
+    default=100000
+)
+ARTICLE_AUTOCOMPLETE_MAX_AGE = env.int(
+    'ARTICLE_AUTOCOMPLETE_MAX_AGE',
+    default=60 * 10
+)
+
+# Build of the article title autocomplete index when a WSGI or ASGI worker
+# starts (instead of on the first autocomplete request), disabled in
+# development so the development server starts faster
+ARTICLE_AUTOCOMPLETE_PRELOAD_ENABLED = env.bool(
+    'ARTICLE_AUTOCOMPLETE_PRELOAD_ENABLED',
+    default=not DEBUG
+)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
@@ -141,5 +334,12 @@ LOGOUT_REDIRECT_URL = 'home'
 CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
 CRISPY_TEMPLATE_PACK = "bootstrap5"
 
+# Per-process cache of the unbound crispy forms (comment and registration
+# forms), disabled in development so the template changes are shown
+CRISPY_FORM_CACHE_ENABLED = env.bool(
+    'CRISPY_FORM_CACHE_ENABLED',
+    default=not DEBUG
+)
+
 # Email backend (console)
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
@@ -0,0 +1,152 @@
+import threading
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from newspaper.db.pool import ConnectionPool, PoolTimeout
+
+
+class FakeConnection:
+    """
+    A database connection stand-in that only records whether it has been
+    closed.
+    """
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class ConnectionPoolTestCase(SimpleTestCase):
+    """
+    A unit test case for the 'ConnectionPool' class, which reuses database
+    connections instead of opening one per request.
+    """
+
+    def setUp(self):
+        """
+        It creates a pool of fake connections before every test.
+        """
+        self.opened = []
+        self.pool = ConnectionPool(
+            connect=self.connect,
+            max_size=2,
+            timeout=0.1
+        )
+
+    def connect(self):
+        """
+        It opens a fake connection.
+
+        :return: The connection.
+        """
+        connection = FakeConnection()
+        self.opened.append(connection)
+        return connection
+
+    def test_pool_reuses_connections(self):
+        """
+        Checks that a returned connection is reused instead of opening a new
+        one.
+        """
+        connection = self.pool.getconn()
+        self.pool.putconn(connection)
+
+        self.assertIs(self.pool.getconn(), connection)
+        self.assertEqual(
+            first=len(self.opened),
+            second=1
+        )
+        stats = self.pool.get_stats()
+        self.assertEqual(
+            first=(stats['size'], stats['in_use'], stats['checkouts']),
+            second=(1, 1, 2)
+        )
+
+    def test_pool_waits_for_connections(self):
+        """
+        Checks that a checkout waits for a connection when the pool is full
+        and times out if none is returned.
+        """
+        first = self.pool.getconn()
+        self.pool.getconn()
+
+        with self.assertRaises(PoolTimeout), \
+                self.assertLogs('newspaper.db.pool', level='WARNING'):
+            self.pool.getconn()
+
+        # A connection returned while waiting is reused
+        threading.Timer(0.02, self.pool.putconn, args=[first]).start()
+        self.assertIs(self.pool.getconn(), first)
+        stats = self.pool.get_stats()
+        self.assertEqual(
+            first=(stats['size'], stats['waits'], stats['timeouts']),
+            second=(2, 2, 1)
+        )
+
+    def test_pool_replaces_expired_connections(self):
+        """
+        Checks that the connections are closed after their maximum lifetime.
+        """
+        self.pool.max_lifetime = 60
+        connection = self.pool.getconn()
+        self.pool.putconn(connection)
+
+        with mock.patch(
+            'newspaper.db.pool.time.monotonic',
+            return_value=self.pool._opened_at[id(connection)] + 60
+        ):
+            new_connection = self.pool.getconn()
+
+        self.assertIsNot(new_connection, connection)
+        self.assertTrue(connection.closed)
+        self.assertEqual(
+            first=self.pool.get_stats()['expired'],
+            second=1
+        )
+
+    def test_pool_discards_broken_connections(self):
+        """
+        Checks that the connections that fail the health check on checkout
+        or can't be reset when returned are closed.
+        """
+        def check(connection):
+            if connection is broken:
+                raise ConnectionError
+
+        self.pool.check = check
+        broken = self.pool.getconn()
+        self.pool.putconn(broken)
+
+        connection = self.pool.getconn()
+        self.assertIsNot(connection, broken)
+        self.assertTrue(broken.closed)
+
+        def reset(connection):
+            raise ConnectionError
+
+        self.pool.reset = reset
+        self.pool.putconn(connection)
+        self.assertTrue(connection.closed)
+        stats = self.pool.get_stats()
+        self.assertEqual(
+            first=(stats['size'], stats['failed_checks'], stats['closed']),
+            second=(0, 1, 1)
+        )
+
+    def test_pool_connect_error(self):
+        """
+        Checks that a failed connection attempt doesn't take a place in the
+        pool.
+        """
+        self.pool.connect = mock.Mock(side_effect=ConnectionError)
+
+        with self.assertRaises(ConnectionError):
+            self.pool.getconn()
+
+        self.assertEqual(
+            first=self.pool.get_stats()['size'],
+            second=0
+        )
@@ -0,0 +1,181 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from articles.models import Article
+from newspaper.db.middleware import PrimaryPinningMiddleware
+from newspaper.db.routers import ReplicaRouter, pin_to_primary, \
+    replica_reads
+
+
+@override_settings(DATABASE_REPLICAS=['replica_1', 'replica_2'])
+class ReplicaRouterTestCase(SimpleTestCase):
+    """
+    A unit test case for the 'ReplicaRouter' database router, which sends
+    some reads to the database replicas.
+    """
+
+    def setUp(self):
+        """
+        It creates the router before every test.
+        """
+        self.router = ReplicaRouter()
+
+    def test_router_reads(self):
+        """
+        Checks that the article reads only use the replicas inside a
+        'replica_reads' block and while the request isn't pinned to the
+        primary database.
+        """
+        self.assertIsNone(self.router.db_for_read(Article))
+
+        with replica_reads():
+            self.assertIn(
+                member=self.router.db_for_read(Article),
+                container=['replica_1', 'replica_2']
+            )
+            # The users and the sessions are always read from the primary
+            self.assertIsNone(self.router.db_for_read(get_user_model()))
+
+            with pin_to_primary():
+                self.assertIsNone(self.router.db_for_read(Article))
+
+        with replica_reads(), override_settings(DATABASE_REPLICAS=[]):
+            self.assertIsNone(self.router.db_for_read(Article))
+
+    def test_router_writes_and_migrations(self):
+        """
+        Checks that the writes always use the primary database and that the
+        migrations don't run on the replicas.
+        """
+        with replica_reads():
+            self.assertEqual(
+                first=self.router.db_for_write(Article),
+                second='default'
+            )
+        self.assertFalse(self.router.allow_migrate('replica_1', 'articles'))
+        self.assertIsNone(self.router.allow_migrate('default', 'articles'))
+
+
+@override_settings(DATABASE_REPLICAS=['default'])
+class ReplicaRoutingTestCase(TestCase):
+    """
+    A test case for the replica reads of the views and the pinning of the
+    users to the primary database after a write (see
+    'PrimaryPinningMiddleware').
+
+    The default database plays the replica, and the replica choices of the
+    router are recorded.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        It creates a test user and an article.
+        """
+        # Test user
+        cls.user = get_user_model().objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+        # Test article
+        cls.article = Article.objects.create(
+            title='Test Article',
+            body='Test Body',
+            author=cls.user
+        )
+
+    def setUp(self):
+        """
+        It logs in with the test user, empties the cache and records the
+        replica choices of the router before every test.
+        """
+        cache.clear()
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+        patcher = mock.patch(
+            'newspaper.db.routers.random.choice',
+            return_value='default'
+        )
+        self.choice = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reads_use_replicas(self):
+        """
+        Checks that the article list, the article details and the feeds are
+        read from the replicas.
+        """
+        urls = [
+            reverse('article_list'),
+            reverse('article_detail', kwargs={'pk': self.article.pk}),
+            reverse('article_feed'),
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                self.choice.reset_mock()
+                response = self.client.get(path=url)
+
+                self.assertEqual(
+                    first=response.status_code,
+                    second=200
+                )
+                self.assertTrue(self.choice.called)
+
+    def test_writes_pin_to_primary(self):
+        """
+        Checks that creating an article pins the user to the primary
+        database, so the redirected page reads the new article from it.
+        """
+        response = self.client.post(
+            path=reverse('article_new'),
+            data={
+                'title': 'A new article',
+                'body': 'Article Body'
+            }
+        )
+        cookie = response.cookies[PrimaryPinningMiddleware.cookie_name]
+        self.assertEqual(
+            first=cookie['max-age'],
+            second=10
+        )
+        self.assertFalse(self.choice.called)
+
+        # The pinned user reads from the primary database
+        response = self.client.get(path=response.url)
+        self.assertContains(
+            response=response,
+            text='A new article'
+        )
+        self.assertFalse(self.choice.called)
+
+        # Once the pinning expires, the replicas are used again
+        del self.client.cookies[PrimaryPinningMiddleware.cookie_name]
+        self.client.get(path=reverse('article_list'))
+        self.assertTrue(self.choice.called)
+
+    def test_changed_feeds_use_primary(self):
+        """
+        Checks that the feeds are generated from the primary database right
+        after an article of their scope changes.
+        """
+        Article.objects.create(
+            title='A new article',
+            body='Article Body',
+            author=self.user
+        )
+
+        response = self.client.get(path=reverse('article_feed'))
+
+        self.assertContains(
+            response=response,
+            text='A new article'
+        )
+        self.assertFalse(self.choice.called)
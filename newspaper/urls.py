@@ -16,10 +16,22 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
+from articles.views import ArticleSitemapIndexView, ArticleSitemapView
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('accounts/', include('accounts.urls')),
     path('accounts/', include('django.contrib.auth.urls')),
     path('', include('pages.urls')),
-    path('articles/', include('articles.urls'))
+    path('articles/', include('articles.urls')),
+    path(
+        route='sitemap.xml',
+        view=ArticleSitemapIndexView.as_view(),
+        name='article_sitemap_index'
+    ),
+    path(
+        route='sitemap-articles-<int:shard>.xml',
+        view=ArticleSitemapView.as_view(),
+        name='article_sitemap'
+    )
 ]
@@ -0,0 +1,160 @@
+import copy
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.utils import load_backend
+
+# Database engines of the benchmark modes
+DIRECT_ENGINE = 'django.db.backends.postgresql'
+POOLED_ENGINE = 'newspaper.db.backends.postgresql'
+
+
+class Command(BaseCommand):
+    """
+    A management command that measures the latency of database requests with
+    a new connection per request and with pooled connections (see the
+    'newspaper.db.backends.postgresql' backend).
+
+    Every simulated request connects to the database, runs a query and
+    closes the connection (which returns it to the pool in pooled mode),
+    like a request served with 'CONN_MAX_AGE' = 0. The requests are made
+    from a pool of threads against the PostgreSQL database of the
+    'DATABASE_URL' setting.
+
+    Usage:
+        python manage.py benchmark_db_connections [--requests N]
+            [--concurrency N] [--pool-size N]
+    """
+    help = 'Compares the latency of new and pooled database connections.'
+
+    def add_arguments(self, parser):
+        """
+        It adds the command-line arguments of the command.
+
+        :param parser: The command-line arguments parser.
+        """
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=2000,
+            help='Number of requests made in every mode.'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=10,
+            help='Number of requests made at the same time.'
+        )
+        parser.add_argument(
+            '--pool-size',
+            type=int,
+            default=10,
+            help='The maximum number of pooled connections.'
+        )
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='The database to connect to.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        It runs the command.
+
+        :param args: Positional arguments.
+        :param options: The command-line options.
+        :raise CommandError: If the database isn't PostgreSQL.
+        """
+        settings_dict = connections[options['database']].settings_dict
+        if 'postgresql' not in settings_dict['ENGINE']:
+            raise CommandError('The benchmark requires a PostgreSQL database.')
+
+        from newspaper.db.backends.postgresql.base import get_process_pool
+
+        total = max(options['requests'], 1)
+        concurrency = max(options['concurrency'], 1)
+        pool_options = {
+            **settings_dict['OPTIONS'].get('pool', {}),
+            'max_size': options['pool_size'],
+        }
+        modes = [
+            ('Direct', 'benchmark_direct', DIRECT_ENGINE, None),
+            ('Pooled', 'benchmark_pooled', POOLED_ENGINE, pool_options),
+        ]
+        for name, alias, engine, pool in modes:
+            mode_settings = copy.deepcopy(settings_dict)
+            mode_settings['ENGINE'] = engine
+            mode_settings['CONN_MAX_AGE'] = 0
+            mode_settings['OPTIONS'].pop('pool', None)
+            if pool is not None:
+                mode_settings['OPTIONS']['pool'] = pool
+            elapsed, times = self.run(
+                settings_dict=mode_settings,
+                alias=alias,
+                total=total,
+                concurrency=concurrency
+            )
+            self.report(name, elapsed, times)
+            pool = get_process_pool(alias)
+            if pool is not None:
+                self.stdout.write(f'Pool: {pool.get_stats()}')
+                pool.closeall()
+
+    def run(self, settings_dict, alias, total, concurrency):
+        """
+        It makes the requests from a pool of threads, each one with its own
+        database wrapper.
+
+        :param settings_dict: The database settings.
+        :param alias: The database alias.
+        :param total: The number of requests.
+        :param concurrency: The number of threads.
+        :return: A tuple with the elapsed seconds and the response times in
+            seconds.
+        """
+        backend = load_backend(settings_dict['ENGINE'])
+        local = threading.local()
+
+        def request(number):
+            wrapper = getattr(local, 'wrapper', None)
+            if wrapper is None:
+                wrapper = local.wrapper = backend.DatabaseWrapper(
+                    settings_dict,
+                    alias
+                )
+            started_at = time.perf_counter()
+            try:
+                with wrapper.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+                    cursor.fetchone()
+            finally:
+                wrapper.close()
+            return time.perf_counter() - started_at
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            started_at = time.perf_counter()
+            times = list(executor.map(request, range(total)))
+            elapsed = time.perf_counter() - started_at
+        return elapsed, times
+
+    def report(self, mode, elapsed, times):
+        """
+        It writes the throughput and the latency percentiles of a mode.
+
+        :param mode: The name of the mode.
+        :param elapsed: The elapsed seconds.
+        :param times: The response times in seconds.
+        """
+        percentiles = statistics.quantiles(times, n=100) \
+            if len(times) > 1 else times * 99
+        self.stdout.write(
+            f'{mode}: {len(times)} requests in {elapsed:.2f} s, '
+            f'{len(times) / elapsed:.1f} requests/s, '
+            f'p50 {percentiles[49] * 1000:.2f} ms, '
+            f'p95 {percentiles[94] * 1000:.2f} ms, '
+            f'p99 {percentiles[98] * 1000:.2f} ms'
+        )
@@ -0,0 +1,120 @@
+import re
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.template import engines
+from django.template.loader import get_template
+from django.template.utils import get_app_template_dirs
+from django.test import override_settings
+
+from pages.partials import clear_layout_partials
+
+# Template extended by the pages with the layout partials
+BASE_TEMPLATE = 'layout/base.html'
+
+# Parent template of an '{% extends %}' tag
+EXTENDS_PATTERN = re.compile(r'{%\s*extends\s+[\'"]([^\'"]+)[\'"]\s*%}')
+
+
+class Command(BaseCommand):
+    """
+    A management command that measures the render time saved per request by
+    the cache of the layout partials (the header and the navbar, see
+    'pages.partials.render_layout_partial').
+
+    The base layout template is rendered repeatedly for a non-authenticated
+    and an authenticated user, with the partials rendered on every request
+    (like an include) and served from the cache. The partials are included
+    exactly once per page, so the time saved applies to every template
+    that extends the base layout, which are listed.
+
+    Usage:
+        python manage.py benchmark_layout_partials [--renders N]
+    """
+    help = 'Measures the render time saved by the layout partials cache.'
+
+    def add_arguments(self, parser):
+        """
+        It adds the command-line arguments of the command.
+
+        :param parser: The command-line arguments parser.
+        """
+        parser.add_argument(
+            '--renders',
+            type=int,
+            default=5000,
+            help='Number of renders of every mode.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        It runs the command.
+
+        :param args: Positional arguments.
+        :param options: The command-line options.
+        """
+        renders = max(options['renders'], 1)
+        template = get_template(BASE_TEMPLATE)
+        users = [
+            ('Anonymous', AnonymousUser()),
+            ('Authenticated', get_user_model()(username='benchmark_user')),
+        ]
+        for name, user in users:
+            times = {}
+            for cached in (False, True):
+                clear_layout_partials()
+                with override_settings(LAYOUT_PARTIAL_CACHE_ENABLED=cached):
+                    # Warm up the template loader and the partials cache
+                    template.render({'user': user})
+                    started_at = time.perf_counter()
+                    for _ in range(renders):
+                        template.render({'user': user})
+                    times[cached] = \
+                        (time.perf_counter() - started_at) / renders
+            saved = times[False] - times[True]
+            self.stdout.write(
+                f'{name}: {times[False] * 1e6:.1f} us per page uncached, '
+                f'{times[True] * 1e6:.1f} us cached, '
+                f'{saved * 1e6:.1f} us saved per request '
+                f'({saved / times[False]:.0%})'
+            )
+        clear_layout_partials()
+
+        templates = self.get_layout_templates()
+        self.stdout.write(
+            f'Templates that extend {BASE_TEMPLATE} ({len(templates)}): '
+            f'{", ".join(templates)}'
+        )
+
+    def get_layout_templates(self):
+        """
+        It returns the templates of the project that extend the base layout,
+        directly or through other templates.
+
+        :return: The sorted list of template names.
+        """
+        directories = [
+            *engines['django'].engine.dirs,
+            *get_app_template_dirs('templates'),
+        ]
+        parents = {}
+        for directory in directories:
+            for path in directory.glob('**/*.html'):
+                match = EXTENDS_PATTERN.search(path.read_text())
+                if match:
+                    name = path.relative_to(directory).as_posix()
+                    parents.setdefault(name, match.group(1))
+
+        templates = []
+        for name in parents:
+            parent = parents[name]
+            seen = {name}
+            while parent != BASE_TEMPLATE and parent in parents \
+                    and parent not in seen:
+                seen.add(parent)
+                parent = parents[parent]
+            if parent == BASE_TEMPLATE:
+                templates.append(name)
+        return sorted(templates)
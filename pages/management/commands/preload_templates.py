@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+
+from newspaper.preload import preload_templates
+
+
+class Command(BaseCommand):
+    """
+    A management command that compiles all the templates of the project
+    and the installed apps, like the WSGI and ASGI workers do when they
+    start (see the 'TEMPLATE_PRELOAD_ENABLED' setting), and reports the
+    compilation time of every template, slowest first.
+
+    Usage:
+        python manage.py preload_templates [--slowest N]
+    """
+    help = 'Compiles all the templates and reports their compilation time.'
+
+    def add_arguments(self, parser):
+        """
+        It adds the command-line arguments of the command.
+
+        :param parser: The command-line arguments parser.
+        """
+        parser.add_argument(
+            '--slowest',
+            type=int,
+            default=None,
+            help='Number of templates reported (the slowest ones).'
+        )
+
+    def handle(self, *args, **options):
+        """
+        It runs the command.
+
+        :param args: Positional arguments.
+        :param options: The command-line options.
+        """
+        results = preload_templates()
+        ranked = sorted(results, key=lambda result: -result.seconds)
+        for result in ranked[:options['slowest']]:
+            line = f'{result.seconds * 1000:8.2f} ms  ' \
+                   f'{result.backend}: {result.name}'
+            if result.error is None:
+                self.stdout.write(line)
+            else:
+                self.stdout.write(self.style.ERROR(
+                    f'{line} ({result.error})'
+                ))
+
+        errors = sum(result.error is not None for result in results)
+        summary = f'{len(results) - errors} templates compiled in ' \
+                  f'{sum(result.seconds for result in results) * 1000:.1f} ms'
+        if errors:
+            summary += f', {errors} errors'
+        self.stdout.write(f'{summary}.')
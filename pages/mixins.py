@@ -0,0 +1,148 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.cache import patch_cache_control
+from django.utils.http import urlencode
+from django.utils.translation import get_language
+
+# Value rendered instead of the CSRF token in the cached pages
+CSRF_TOKEN_PLACEHOLDER = 'csrf-token-placeholder-0f6e5d4c'
+
+
+class AnonymousPageCacheMixin:
+    """
+    A mixin for class-based views that caches the full responses served to
+    non-authenticated users.
+
+    The cache is opt-in (see the 'ANONYMOUS_PAGE_CACHE_ENABLED' setting) and
+    only GET and HEAD requests of non-authenticated users are cached, with a
+    separate cache entry for every scheme, host, path, language and value of
+    the query parameters read by the view. Any other query parameter (e.g.
+    tracking parameters) is ignored, and so is the order of the parameters,
+    so they don't create new cache entries.
+
+    The pages are cached with a placeholder instead of the CSRF token, which
+    is replaced by the token of the current user every time the page is
+    served, so cached forms can still be submitted. Pages with a CSRF token
+    are marked as private, so shared proxies don't cache them.
+
+    Attributes:
+        page_cache_prefix: The prefix of the cache keys of the view pages.
+        page_cache_query_params: The names of the query parameters read by
+            the view, which are part of the cache keys.
+    """
+    page_cache_prefix = 'pages:anonymous'
+    page_cache_query_params = ()
+
+    def dispatch(self, request, *args, **kwargs):
+        """
+        It serves the page from the cache if possible, otherwise it renders
+        the page and caches it.
+
+        :param request: The incoming request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The HTTP response.
+        """
+        if not self.is_page_cacheable(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        page_cache = caches[settings.ANONYMOUS_PAGE_CACHE_ALIAS]
+        cache_key = self.get_page_cache_key(request)
+        cached_page = page_cache.get(cache_key)
+
+        if cached_page is None:
+            self.caching_page = True
+            response = super().dispatch(request, *args, **kwargs)
+            if response.status_code != 200 or not hasattr(response, 'render'):
+                return response
+            response.render()
+            cached_page = {
+                'content': response.content,
+                'headers': list(response.items())
+            }
+            page_cache.set(
+                key=cache_key,
+                value=cached_page,
+                timeout=settings.ANONYMOUS_PAGE_CACHE_TIMEOUT
+            )
+
+        return self.build_page_response(request, cached_page)
+
+    def is_page_cacheable(self, request):
+        """
+        It checks if the response to a request can be served from (and
+        stored in) the cache.
+
+        :param request: The incoming request.
+        :return: True if the page cache is enabled, the request is a GET or
+            HEAD request and the user is not authenticated, False otherwise.
+        """
+        return (
+            settings.ANONYMOUS_PAGE_CACHE_ENABLED
+            and request.method in ('GET', 'HEAD')
+            and not request.user.is_authenticated
+        )
+
+    def get_page_cache_key(self, request):
+        """
+        It returns the cache key of the page requested, built from the
+        request path and the sorted values of the query parameters read by
+        the view.
+
+        :param request: The incoming request.
+        :return: The cache key.
+        """
+        query_string = urlencode(sorted(
+            (name, value)
+            for name in set(self.page_cache_query_params)
+            for value in request.GET.getlist(name)
+        ))
+        page_id = '|'.join([
+            request.scheme,
+            request.get_host(),
+            request.path,
+            query_string,
+            get_language() or ''
+        ])
+        digest = hashlib.md5(page_id.encode(), usedforsecurity=False)
+        return f'{self.page_cache_prefix}:{digest.hexdigest()}'
+
+    def get_context_data(self, **kwargs):
+        """
+        This method replaces the CSRF token with a placeholder in the context
+        data of the pages that are going to be cached.
+
+        :param kwargs: Additional keywords arguments.
+        :return: This method returns a dictionary with the context data used
+            in the template rendering.
+        """
+        context = super().get_context_data(**kwargs)
+        if getattr(self, 'caching_page', False):
+            context['csrf_token'] = CSRF_TOKEN_PLACEHOLDER
+        return context
+
+    def build_page_response(self, request, cached_page):
+        """
+        It builds the response of a cached page, inserting the CSRF token of
+        the current user.
+
+        :param request: The incoming request.
+        :param cached_page: The cached page content and headers.
+        :return: The HTTP response.
+        """
+        content = cached_page['content']
+        placeholder = CSRF_TOKEN_PLACEHOLDER.encode()
+        has_csrf_token = placeholder in content
+        if has_csrf_token:
+            content = content.replace(placeholder, get_token(request).encode())
+
+        response = HttpResponse(content)
+        for header, value in cached_page['headers']:
+            response[header] = value
+        if has_csrf_token:
+            patch_cache_control(response, private=True)
+        return response
@@ -0,0 +1,113 @@
+from crispy_forms.templatetags.crispy_forms_filters import as_crispy_form
+from crispy_forms.utils import TEMPLATE_PACK
+from django.conf import settings
+from django.forms import BaseForm, ModelChoiceField
+from django.template import Context
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+# Value rendered instead of the username in the cached partials
+USERNAME_PLACEHOLDER = 'username-placeholder-3b8e41d7'
+
+# Rendered layout partials of the process, by template name, authentication
+# state and language
+_rendered_partials = {}
+
+# Unbound crispy forms rendered by the process, by form class, prefix, id
+# format, template pack and language
+_rendered_forms = {}
+
+
+def clear_layout_partials():
+    """
+    It empties the rendered layout partials of the process.
+    """
+    _rendered_partials.clear()
+
+
+def clear_crispy_forms():
+    """
+    It empties the rendered crispy forms of the process.
+    """
+    _rendered_forms.clear()
+
+
+def render_layout_partial(context, template_name):
+    """
+    It renders a layout partial (such as the navbar), reusing the HTML
+    rendered for the previous requests with the same authentication state
+    and language.
+
+    The partials are rendered only once per process: they only depend on
+    whether the user is authenticated (the URLs are fixed), and the
+    username is rendered as a placeholder, replaced by the username of the
+    current user after the lookup. The partials can't use other values of
+    the context. If the 'LAYOUT_PARTIAL_CACHE_ENABLED' setting is False,
+    the partial is rendered with the template context, like an include.
+
+    :param context: The template context.
+    :param template_name: The name of the partial template.
+    :return: The HTML of the partial.
+    """
+    engine = context.template.engine
+    if not settings.LAYOUT_PARTIAL_CACHE_ENABLED:
+        with context.push():
+            return engine.get_template(template_name).render(context)
+
+    user = context.get('user')
+    is_authenticated = bool(user and user.is_authenticated)
+    key = (template_name, is_authenticated, get_language())
+    html = _rendered_partials.get(key)
+    if html is None:
+        html = _rendered_partials[key] = engine.get_template(
+            template_name
+        ).render(Context(
+            {
+                'user': {
+                    'is_authenticated': is_authenticated,
+                    'username': USERNAME_PLACEHOLDER
+                }
+            },
+            autoescape=context.autoescape
+        ))
+
+    if is_authenticated:
+        html = html.replace(
+            USERNAME_PLACEHOLDER,
+            conditional_escape(user.get_username())
+        )
+    return mark_safe(html)
+
+
+def render_crispy_form(form, template_pack=TEMPLATE_PACK):
+    """
+    It renders a form with crispy forms (like the 'crispy' filter), reusing
+    the HTML rendered for the previous requests if the form is unbound.
+
+    An unbound form without initial data is rendered the same way for every
+    request, so it is rendered only once per process, form class and
+    language. The form tag and the CSRF token are rendered by the
+    templates, outside the cached HTML. Bound forms (with the submitted
+    values and the validation errors) and forms with initial data or
+    database choices are always rendered. If the 'CRISPY_FORM_CACHE_ENABLED'
+    setting is False, all the forms are rendered.
+
+    :param form: The form.
+    :param template_pack: The crispy forms template pack.
+    :return: The HTML of the form fields.
+    """
+    if not settings.CRISPY_FORM_CACHE_ENABLED \
+            or not isinstance(form, BaseForm) or form.is_bound \
+            or form.initial or any(
+                isinstance(field, ModelChoiceField)
+                for field in form.fields.values()
+            ):
+        return as_crispy_form(form, template_pack)
+
+    key = (type(form), form.prefix, form.auto_id, template_pack,
+           get_language())
+    html = _rendered_forms.get(key)
+    if html is None:
+        html = _rendered_forms[key] = as_crispy_form(form, template_pack)
+    return html
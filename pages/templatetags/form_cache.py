@@ -0,0 +1,23 @@
+from crispy_forms.utils import TEMPLATE_PACK
+from django import template
+
+from pages.partials import render_crispy_form
+
+register = template.Library()
+
+
+@register.filter
+def cached_crispy(form, template_pack=TEMPLATE_PACK):
+    """
+    It renders a form with crispy forms, rendering unbound forms only once
+    per process (see 'pages.partials.render_crispy_form').
+
+    Usage:
+        {% load form_cache %}
+        {{ form|cached_crispy }}
+
+    :param form: The form.
+    :param template_pack: The crispy forms template pack.
+    :return: The HTML of the form fields.
+    """
+    return render_crispy_form(form, template_pack)
@@ -0,0 +1,22 @@
+from django import template
+
+from pages.partials import render_layout_partial
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def layout_partial(context, template_name):
+    """
+    It renders a layout partial, which is cached by authentication state
+    (see 'pages.partials.render_layout_partial').
+
+    Usage:
+        {% load layout %}
+        {% layout_partial 'layout/partials/navbar.html' %}
+
+    :param context: The template context.
+    :param template_name: The name of the partial template.
+    :return: The HTML of the partial.
+    """
+    return render_layout_partial(context, template_name)
@@ -1,7 +1,17 @@
+from unittest import mock
+
+from crispy_forms.templatetags.crispy_forms_filters import as_crispy_form
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import caches
+from django.template import engines
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 
+from articles.forms import CommentForm
+from newspaper.preload import preload_templates
+from pages.partials import clear_crispy_forms, clear_layout_partials, \
+    render_crispy_form
+
 
 class HomeViewTestCase(TestCase):
     """
@@ -69,4 +79,365 @@ class HomeViewTestCase(TestCase):
         self.assertTemplateUsed(
             response=response,
             template_name='home.html'
-        )
\ No newline at end of file
+        )
+
+
+@override_settings(ANONYMOUS_PAGE_CACHE_ENABLED=True)
+class AnonymousPageCacheTestCase(TestCase):
+    """
+    Unit test case for the full-page cache of the pages served to
+    non-authenticated users (via the 'AnonymousPageCacheMixin' mixin).
+    """
+    HOMEPAGE_URL = reverse('home')
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        This method creates objects in a test database that are available to
+        all unit tests. It is called only once for this test case, and the
+        created objects are shared among all unit tests in this test case.
+        """
+        # Custom user model used by this project
+        user_model = get_user_model()
+
+        # Test user
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+
+    def setUp(self):
+        """
+        It clears the page cache before every test.
+        """
+        caches['pages'].clear()
+
+    def test_homepage_served_from_cache(self):
+        """
+        Checks that the homepage is rendered only once for non-authenticated
+        users and then served from the cache.
+        """
+        # First request (renders and caches the page)
+        first_response = self.client.get(self.HOMEPAGE_URL)
+        self.assertTemplateUsed(
+            response=first_response,
+            template_name='home.html'
+        )
+
+        # Second request (served from the cache)
+        second_response = self.client.get(self.HOMEPAGE_URL)
+        self.assertEqual(
+            first=second_response.status_code,
+            second=200
+        )
+        self.assertTemplateNotUsed(
+            response=second_response,
+            template_name='home.html'
+        )
+        self.assertEqual(
+            first=second_response.content,
+            second=first_response.content
+        )
+
+    def test_homepage_query_params_not_read_ignored(self):
+        """
+        Checks that the query parameters not read by the view (and their
+        order) don't create new cache entries.
+        """
+        # First request (renders and caches the page)
+        self.client.get(self.HOMEPAGE_URL, {'utm_source': 'x', 'ref': 'y'})
+
+        # Requests with other query strings (served from the cache)
+        for query_string in ('', '?ref=y&utm_source=x', '?junk=1'):
+            response = self.client.get(self.HOMEPAGE_URL + query_string)
+            self.assertTemplateNotUsed(
+                response=response,
+                template_name='home.html'
+            )
+
+    def test_login_query_params_read_cached_separately(self):
+        """
+        Checks that every value of the query parameters read by the view has
+        its own cache entry, regardless of the other query parameters.
+        """
+        login_url = reverse('login')
+
+        # First request (renders and caches the page)
+        self.client.get(login_url, {'next': '/articles/'})
+
+        # Request with the same redirect parameter (served from the cache)
+        response = self.client.get(login_url, {
+            'utm_source': 'x',
+            'next': '/articles/'
+        })
+        self.assertTemplateNotUsed(
+            response=response,
+            template_name='registration/login.html'
+        )
+
+        # Request with another redirect parameter
+        response = self.client.get(login_url, {'next': '/accounts/'})
+        self.assertTemplateUsed(
+            response=response,
+            template_name='registration/login.html'
+        )
+
+    def test_homepage_not_cached_user_authenticated(self):
+        """
+        Checks that the pages of authenticated users are neither served from
+        nor stored in the cache.
+        """
+        # Non-authenticated user (caches the page)
+        self.client.get(self.HOMEPAGE_URL)
+
+        # Authenticated user
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+        response = self.client.get(self.HOMEPAGE_URL)
+        self.assertTemplateUsed(
+            response=response,
+            template_name='home.html'
+        )
+        self.assertContains(
+            response=response,
+            text='Welcome, test_user'
+        )
+
+
+@override_settings(LAYOUT_PARTIAL_CACHE_ENABLED=True)
+class LayoutPartialCacheTestCase(TestCase):
+    """
+    Unit test case for the cache of the layout partials (header and navbar),
+    which are rendered once per authentication state.
+    """
+    HOMEPAGE_URL = reverse('home')
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        This method creates two test users, one of them with a username
+        that has to be escaped.
+        """
+        # Custom user model used by this project
+        user_model = get_user_model()
+
+        # Test users
+        cls.user = user_model.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
+        )
+        cls.other_user = user_model.objects.create_user(
+            username='<b>other_user</b>',
+            password='test_pass',
+            email='other@example.net',
+            age=18
+        )
+
+    def setUp(self):
+        """
+        It clears the rendered partials before every test.
+        """
+        clear_layout_partials()
+
+    def test_navbar_rendered_once_per_auth_state(self):
+        """
+        Checks that the navbar is only rendered the first time for every
+        authentication state.
+        """
+        # Non-authenticated user (renders the partials)
+        response = self.client.get(self.HOMEPAGE_URL)
+        self.assertTemplateUsed(
+            response=response,
+            template_name='layout/partials/navbar.html'
+        )
+        self.assertContains(
+            response=response,
+            text=reverse('login')
+        )
+
+        # Served from the cache
+        response = self.client.get(self.HOMEPAGE_URL)
+        self.assertTemplateNotUsed(
+            response=response,
+            template_name='layout/partials/navbar.html'
+        )
+
+        # Authenticated user (renders the partials)
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+        response = self.client.get(self.HOMEPAGE_URL)
+        self.assertTemplateUsed(
+            response=response,
+            template_name='layout/partials/navbar.html'
+        )
+        self.assertContains(
+            response=response,
+            text=reverse('logout')
+        )
+        self.assertNotContains(
+            response=response,
+            text=reverse('login')
+        )
+
+    def test_navbar_username_not_cached(self):
+        """
+        Checks that every user sees their own (escaped) username in the
+        cached navbar.
+        """
+        self.client.login(
+            username='test_user',
+            password='test_pass'
+        )
+        response = self.client.get(self.HOMEPAGE_URL)
+        self.assertContains(
+            response=response,
+            text='Welcome, test_user'
+        )
+
+        self.client.login(
+            username='<b>other_user</b>',
+            password='test_pass'
+        )
+        response = self.client.get(self.HOMEPAGE_URL)
+        self.assertTemplateNotUsed(
+            response=response,
+            template_name='layout/partials/navbar.html'
+        )
+        self.assertContains(
+            response=response,
+            text='Welcome, &lt;b&gt;other_user&lt;/b&gt;'
+        )
+        self.assertNotContains(
+            response=response,
+            text='test_user'
+        )
+
+
+class PreloadTemplatesTestCase(SimpleTestCase):
+    """
+    Unit test case for the 'preload_templates' function, which compiles all
+    the templates when a worker starts.
+    """
+
+    def test_preload_templates(self):
+        """
+        Checks that the project, app and form widget templates are compiled
+        without errors and stored by the cached template loader.
+        """
+        results = preload_templates()
+        names = [result.name for result in results]
+
+        for name in ('layout/base.html', 'articles/article_detail.html',
+                     'registration/login.html', 'bootstrap5/field.html',
+                     'django/forms/widgets/text.html'):
+            with self.subTest(name=name):
+                self.assertIn(
+                    member=name,
+                    container=names
+                )
+        self.assertEqual(
+            first=[result for result in results if result.error],
+            second=[]
+        )
+
+        loader = engines['django'].engine.template_loaders[0]
+        self.assertIn(
+            member='layout/base.html',
+            container=loader.get_template_cache
+        )
+
+
+@override_settings(CRISPY_FORM_CACHE_ENABLED=True)
+class CrispyFormCacheTestCase(TestCase):
+    """
+    Unit test case for the cache of the unbound crispy forms (the comment
+    and registration forms), which are rendered once per process.
+    """
+    LOGIN_URL = reverse('login')
+    SIGNUP_URL = reverse('signup')
+
+    def setUp(self):
+        """
+        It clears the rendered forms before every test.
+        """
+        clear_crispy_forms()
+
+    def test_unbound_form_rendered_once(self):
+        """
+        Checks that an unbound form is rendered only the first time, while
+        bound forms are always rendered with their values and errors.
+        """
+        with mock.patch(
+            'pages.partials.as_crispy_form',
+            wraps=as_crispy_form
+        ) as render:
+            first_html = render_crispy_form(CommentForm())
+            second_html = render_crispy_form(CommentForm())
+            self.assertEqual(
+                first=render.call_count,
+                second=1
+            )
+            self.assertEqual(
+                first=second_html,
+                second=first_html
+            )
+
+            bound_html = render_crispy_form(CommentForm(data={'comment': ''}))
+            self.assertEqual(
+                first=render.call_count,
+                second=2
+            )
+        self.assertIn(
+            member='is-invalid',
+            container=bound_html
+        )
+        self.assertNotIn(
+            member='is-invalid',
+            container=first_html
+        )
+
+    def test_registration_forms_csrf_token(self):
+        """
+        Checks that the cached login form is served with the CSRF token of
+        every client, and that the submitted signup form is rendered with
+        its errors.
+        """
+        tokens = []
+        for _ in range(2):
+            client = self.client_class()
+            response = client.get(self.LOGIN_URL)
+            self.assertContains(
+                response=response,
+                text='name="username"'
+            )
+            token = response.context['csrf_token']
+            self.assertContains(
+                response=response,
+                text=f'value="{token}"'
+            )
+            tokens.append(str(token))
+        self.assertNotEqual(
+            first=tokens[0],
+            second=tokens[1]
+        )
+
+        response = self.client.post(
+            path=self.SIGNUP_URL,
+            data={'username': 'new_user', 'age': 'invalid'}
+        )
+        self.assertContains(
+            response=response,
+            text='value="new_user"'
+        )
+        self.assertContains(
+            response=response,
+            text='is-invalid'
+        )
@@ -1,9 +1,14 @@
 from django.views.generic import TemplateView
 
+from pages.mixins import AnonymousPageCacheMixin
 
-class HomeView(TemplateView):
+
+class HomeView(AnonymousPageCacheMixin, TemplateView):
     """
     A class-based view that inherits from the Django 'TemplateView' generic
     view and is responsible for rendering the homepage template of the website.
+
+    The homepage served to non-authenticated users can be cached (via the
+    'AnonymousPageCacheMixin' mixin).
     """
     template_name = 'home.html'